@@ -9,8 +9,13 @@ from .jamo import (JAMO_LEADS, JAMO_LEADS_MODERN,
                    jamo_to_hcj, j2hcj,
                    hcj_to_jamo, hcj2j,
                    jamo_to_hangul, j2h,
+                   hcj_to_hangul, hcj2h,
                    hangul_to_jamo, h2j,
+                   hangul_to_hcj, h2hcj,
+                   hangul_to_jamo_chunks, jamo_to_hcj_chunks,
                    compose_jamo, decompose_jamo,
                    is_jamo_compound,
+                   has_tail, tail_of,
                    InvalidJamoError)
+from .backends import set_backend
 __version__ = '0.4.2'
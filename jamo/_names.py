@@ -0,0 +1,461 @@
+# -*- coding: utf-8 -*-
+"""Unicode character names for every Hangul jamo block.
+
+Generated by tools/parse.py from tools/data/HangulJamoData.txt. Do not edit.
+"""
+
+JAMO_TO_NAME = {
+    '\u1100': 'HANGUL CHOSEONG KIYEOK',
+    '\u1101': 'HANGUL CHOSEONG SSANGKIYEOK',
+    '\u1102': 'HANGUL CHOSEONG NIEUN',
+    '\u1103': 'HANGUL CHOSEONG TIKEUT',
+    '\u1104': 'HANGUL CHOSEONG SSANGTIKEUT',
+    '\u1105': 'HANGUL CHOSEONG RIEUL',
+    '\u1106': 'HANGUL CHOSEONG MIEUM',
+    '\u1107': 'HANGUL CHOSEONG PIEUP',
+    '\u1108': 'HANGUL CHOSEONG SSANGPIEUP',
+    '\u1109': 'HANGUL CHOSEONG SIOS',
+    '\u110a': 'HANGUL CHOSEONG SSANGSIOS',
+    '\u110b': 'HANGUL CHOSEONG IEUNG',
+    '\u110c': 'HANGUL CHOSEONG CIEUC',
+    '\u110d': 'HANGUL CHOSEONG SSANGCIEUC',
+    '\u110e': 'HANGUL CHOSEONG CHIEUCH',
+    '\u110f': 'HANGUL CHOSEONG KHIEUKH',
+    '\u1110': 'HANGUL CHOSEONG THIEUTH',
+    '\u1111': 'HANGUL CHOSEONG PHIEUPH',
+    '\u1112': 'HANGUL CHOSEONG HIEUH',
+    '\u1113': 'HANGUL CHOSEONG NIEUN-KIYEOK',
+    '\u1114': 'HANGUL CHOSEONG SSANGNIEUN',
+    '\u1115': 'HANGUL CHOSEONG NIEUN-TIKEUT',
+    '\u1116': 'HANGUL CHOSEONG NIEUN-PIEUP',
+    '\u1117': 'HANGUL CHOSEONG TIKEUT-KIYEOK',
+    '\u1118': 'HANGUL CHOSEONG RIEUL-NIEUN',
+    '\u1119': 'HANGUL CHOSEONG SSANGRIEUL',
+    '\u111a': 'HANGUL CHOSEONG RIEUL-HIEUH',
+    '\u111b': 'HANGUL CHOSEONG KAPYEOUNRIEUL',
+    '\u111c': 'HANGUL CHOSEONG MIEUM-PIEUP',
+    '\u111d': 'HANGUL CHOSEONG KAPYEOUNMIEUM',
+    '\u111e': 'HANGUL CHOSEONG PIEUP-KIYEOK',
+    '\u111f': 'HANGUL CHOSEONG PIEUP-NIEUN',
+    '\u1120': 'HANGUL CHOSEONG PIEUP-TIKEUT',
+    '\u1121': 'HANGUL CHOSEONG PIEUP-SIOS',
+    '\u1122': 'HANGUL CHOSEONG PIEUP-SIOS-KIYEOK',
+    '\u1123': 'HANGUL CHOSEONG PIEUP-SIOS-TIKEUT',
+    '\u1124': 'HANGUL CHOSEONG PIEUP-SIOS-PIEUP',
+    '\u1125': 'HANGUL CHOSEONG PIEUP-SSANGSIOS',
+    '\u1126': 'HANGUL CHOSEONG PIEUP-SIOS-CIEUC',
+    '\u1127': 'HANGUL CHOSEONG PIEUP-CIEUC',
+    '\u1128': 'HANGUL CHOSEONG PIEUP-CHIEUCH',
+    '\u1129': 'HANGUL CHOSEONG PIEUP-THIEUTH',
+    '\u112a': 'HANGUL CHOSEONG PIEUP-PHIEUPH',
+    '\u112b': 'HANGUL CHOSEONG KAPYEOUNPIEUP',
+    '\u112c': 'HANGUL CHOSEONG KAPYEOUNSSANGPIEUP',
+    '\u112d': 'HANGUL CHOSEONG SIOS-KIYEOK',
+    '\u112e': 'HANGUL CHOSEONG SIOS-NIEUN',
+    '\u112f': 'HANGUL CHOSEONG SIOS-TIKEUT',
+    '\u1130': 'HANGUL CHOSEONG SIOS-RIEUL',
+    '\u1131': 'HANGUL CHOSEONG SIOS-MIEUM',
+    '\u1132': 'HANGUL CHOSEONG SIOS-PIEUP',
+    '\u1133': 'HANGUL CHOSEONG SIOS-PIEUP-KIYEOK',
+    '\u1134': 'HANGUL CHOSEONG SIOS-SSANGSIOS',
+    '\u1135': 'HANGUL CHOSEONG SIOS-IEUNG',
+    '\u1136': 'HANGUL CHOSEONG SIOS-CIEUC',
+    '\u1137': 'HANGUL CHOSEONG SIOS-CHIEUCH',
+    '\u1138': 'HANGUL CHOSEONG SIOS-KHIEUKH',
+    '\u1139': 'HANGUL CHOSEONG SIOS-THIEUTH',
+    '\u113a': 'HANGUL CHOSEONG SIOS-PHIEUPH',
+    '\u113b': 'HANGUL CHOSEONG SIOS-HIEUH',
+    '\u113c': 'HANGUL CHOSEONG CHITUEUMSIOS',
+    '\u113d': 'HANGUL CHOSEONG CHITUEUMSSANGSIOS',
+    '\u113e': 'HANGUL CHOSEONG CEONGCHIEUMSIOS',
+    '\u113f': 'HANGUL CHOSEONG CEONGCHIEUMSSANGSIOS',
+    '\u1140': 'HANGUL CHOSEONG PANSIOS',
+    '\u1141': 'HANGUL CHOSEONG IEUNG-KIYEOK',
+    '\u1142': 'HANGUL CHOSEONG IEUNG-TIKEUT',
+    '\u1143': 'HANGUL CHOSEONG IEUNG-MIEUM',
+    '\u1144': 'HANGUL CHOSEONG IEUNG-PIEUP',
+    '\u1145': 'HANGUL CHOSEONG IEUNG-SIOS',
+    '\u1146': 'HANGUL CHOSEONG IEUNG-PANSIOS',
+    '\u1147': 'HANGUL CHOSEONG SSANGIEUNG',
+    '\u1148': 'HANGUL CHOSEONG IEUNG-CIEUC',
+    '\u1149': 'HANGUL CHOSEONG IEUNG-CHIEUCH',
+    '\u114a': 'HANGUL CHOSEONG IEUNG-THIEUTH',
+    '\u114b': 'HANGUL CHOSEONG IEUNG-PHIEUPH',
+    '\u114c': 'HANGUL CHOSEONG YESIEUNG',
+    '\u114d': 'HANGUL CHOSEONG CIEUC-IEUNG',
+    '\u114e': 'HANGUL CHOSEONG CHITUEUMCIEUC',
+    '\u114f': 'HANGUL CHOSEONG CHITUEUMSSANGCIEUC',
+    '\u1150': 'HANGUL CHOSEONG CEONGCHIEUMCIEUC',
+    '\u1151': 'HANGUL CHOSEONG CEONGCHIEUMSSANGCIEUC',
+    '\u1152': 'HANGUL CHOSEONG CHIEUCH-KHIEUKH',
+    '\u1153': 'HANGUL CHOSEONG CHIEUCH-HIEUH',
+    '\u1154': 'HANGUL CHOSEONG CHITUEUMCHIEUCH',
+    '\u1155': 'HANGUL CHOSEONG CEONGCHIEUMCHIEUCH',
+    '\u1156': 'HANGUL CHOSEONG PHIEUPH-PIEUP',
+    '\u1157': 'HANGUL CHOSEONG KAPYEOUNPHIEUPH',
+    '\u1158': 'HANGUL CHOSEONG SSANGHIEUH',
+    '\u1159': 'HANGUL CHOSEONG YEORINHIEUH',
+    '\u115a': 'HANGUL CHOSEONG KIYEOK-TIKEUT',
+    '\u115b': 'HANGUL CHOSEONG NIEUN-SIOS',
+    '\u115c': 'HANGUL CHOSEONG NIEUN-CIEUC',
+    '\u115d': 'HANGUL CHOSEONG NIEUN-HIEUH',
+    '\u115e': 'HANGUL CHOSEONG TIKEUT-RIEUL',
+    '\u115f': 'HANGUL CHOSEONG FILLER',
+    '\u1160': 'HANGUL JUNGSEONG FILLER',
+    '\u1161': 'HANGUL JUNGSEONG A',
+    '\u1162': 'HANGUL JUNGSEONG AE',
+    '\u1163': 'HANGUL JUNGSEONG YA',
+    '\u1164': 'HANGUL JUNGSEONG YAE',
+    '\u1165': 'HANGUL JUNGSEONG EO',
+    '\u1166': 'HANGUL JUNGSEONG E',
+    '\u1167': 'HANGUL JUNGSEONG YEO',
+    '\u1168': 'HANGUL JUNGSEONG YE',
+    '\u1169': 'HANGUL JUNGSEONG O',
+    '\u116a': 'HANGUL JUNGSEONG WA',
+    '\u116b': 'HANGUL JUNGSEONG WAE',
+    '\u116c': 'HANGUL JUNGSEONG OE',
+    '\u116d': 'HANGUL JUNGSEONG YO',
+    '\u116e': 'HANGUL JUNGSEONG U',
+    '\u116f': 'HANGUL JUNGSEONG WEO',
+    '\u1170': 'HANGUL JUNGSEONG WE',
+    '\u1171': 'HANGUL JUNGSEONG WI',
+    '\u1172': 'HANGUL JUNGSEONG YU',
+    '\u1173': 'HANGUL JUNGSEONG EU',
+    '\u1174': 'HANGUL JUNGSEONG YI',
+    '\u1175': 'HANGUL JUNGSEONG I',
+    '\u1176': 'HANGUL JUNGSEONG A-O',
+    '\u1177': 'HANGUL JUNGSEONG A-U',
+    '\u1178': 'HANGUL JUNGSEONG YA-O',
+    '\u1179': 'HANGUL JUNGSEONG YA-YO',
+    '\u117a': 'HANGUL JUNGSEONG EO-O',
+    '\u117b': 'HANGUL JUNGSEONG EO-U',
+    '\u117c': 'HANGUL JUNGSEONG EO-EU',
+    '\u117d': 'HANGUL JUNGSEONG YEO-O',
+    '\u117e': 'HANGUL JUNGSEONG YEO-U',
+    '\u117f': 'HANGUL JUNGSEONG O-EO',
+    '\u1180': 'HANGUL JUNGSEONG O-E',
+    '\u1181': 'HANGUL JUNGSEONG O-YE',
+    '\u1182': 'HANGUL JUNGSEONG O-O',
+    '\u1183': 'HANGUL JUNGSEONG O-U',
+    '\u1184': 'HANGUL JUNGSEONG YO-YA',
+    '\u1185': 'HANGUL JUNGSEONG YO-YAE',
+    '\u1186': 'HANGUL JUNGSEONG YO-YEO',
+    '\u1187': 'HANGUL JUNGSEONG YO-O',
+    '\u1188': 'HANGUL JUNGSEONG YO-I',
+    '\u1189': 'HANGUL JUNGSEONG U-A',
+    '\u118a': 'HANGUL JUNGSEONG U-AE',
+    '\u118b': 'HANGUL JUNGSEONG U-EO-EU',
+    '\u118c': 'HANGUL JUNGSEONG U-YE',
+    '\u118d': 'HANGUL JUNGSEONG U-U',
+    '\u118e': 'HANGUL JUNGSEONG YU-A',
+    '\u118f': 'HANGUL JUNGSEONG YU-EO',
+    '\u1190': 'HANGUL JUNGSEONG YU-E',
+    '\u1191': 'HANGUL JUNGSEONG YU-YEO',
+    '\u1192': 'HANGUL JUNGSEONG YU-YE',
+    '\u1193': 'HANGUL JUNGSEONG YU-U',
+    '\u1194': 'HANGUL JUNGSEONG YU-I',
+    '\u1195': 'HANGUL JUNGSEONG EU-U',
+    '\u1196': 'HANGUL JUNGSEONG EU-EU',
+    '\u1197': 'HANGUL JUNGSEONG YI-U',
+    '\u1198': 'HANGUL JUNGSEONG I-A',
+    '\u1199': 'HANGUL JUNGSEONG I-YA',
+    '\u119a': 'HANGUL JUNGSEONG I-O',
+    '\u119b': 'HANGUL JUNGSEONG I-U',
+    '\u119c': 'HANGUL JUNGSEONG I-EU',
+    '\u119d': 'HANGUL JUNGSEONG I-ARAEA',
+    '\u119e': 'HANGUL JUNGSEONG ARAEA',
+    '\u119f': 'HANGUL JUNGSEONG ARAEA-EO',
+    '\u11a0': 'HANGUL JUNGSEONG ARAEA-U',
+    '\u11a1': 'HANGUL JUNGSEONG ARAEA-I',
+    '\u11a2': 'HANGUL JUNGSEONG SSANGARAEA',
+    '\u11a3': 'HANGUL JUNGSEONG A-EU',
+    '\u11a4': 'HANGUL JUNGSEONG YA-U',
+    '\u11a5': 'HANGUL JUNGSEONG YEO-YA',
+    '\u11a6': 'HANGUL JUNGSEONG O-YA',
+    '\u11a7': 'HANGUL JUNGSEONG O-YAE',
+    '\u11a8': 'HANGUL JONGSEONG KIYEOK',
+    '\u11a9': 'HANGUL JONGSEONG SSANGKIYEOK',
+    '\u11aa': 'HANGUL JONGSEONG KIYEOK-SIOS',
+    '\u11ab': 'HANGUL JONGSEONG NIEUN',
+    '\u11ac': 'HANGUL JONGSEONG NIEUN-CIEUC',
+    '\u11ad': 'HANGUL JONGSEONG NIEUN-HIEUH',
+    '\u11ae': 'HANGUL JONGSEONG TIKEUT',
+    '\u11af': 'HANGUL JONGSEONG RIEUL',
+    '\u11b0': 'HANGUL JONGSEONG RIEUL-KIYEOK',
+    '\u11b1': 'HANGUL JONGSEONG RIEUL-MIEUM',
+    '\u11b2': 'HANGUL JONGSEONG RIEUL-PIEUP',
+    '\u11b3': 'HANGUL JONGSEONG RIEUL-SIOS',
+    '\u11b4': 'HANGUL JONGSEONG RIEUL-THIEUTH',
+    '\u11b5': 'HANGUL JONGSEONG RIEUL-PHIEUPH',
+    '\u11b6': 'HANGUL JONGSEONG RIEUL-HIEUH',
+    '\u11b7': 'HANGUL JONGSEONG MIEUM',
+    '\u11b8': 'HANGUL JONGSEONG PIEUP',
+    '\u11b9': 'HANGUL JONGSEONG PIEUP-SIOS',
+    '\u11ba': 'HANGUL JONGSEONG SIOS',
+    '\u11bb': 'HANGUL JONGSEONG SSANGSIOS',
+    '\u11bc': 'HANGUL JONGSEONG IEUNG',
+    '\u11bd': 'HANGUL JONGSEONG CIEUC',
+    '\u11be': 'HANGUL JONGSEONG CHIEUCH',
+    '\u11bf': 'HANGUL JONGSEONG KHIEUKH',
+    '\u11c0': 'HANGUL JONGSEONG THIEUTH',
+    '\u11c1': 'HANGUL JONGSEONG PHIEUPH',
+    '\u11c2': 'HANGUL JONGSEONG HIEUH',
+    '\u11c3': 'HANGUL JONGSEONG KIYEOK-RIEUL',
+    '\u11c4': 'HANGUL JONGSEONG KIYEOK-SIOS-KIYEOK',
+    '\u11c5': 'HANGUL JONGSEONG NIEUN-KIYEOK',
+    '\u11c6': 'HANGUL JONGSEONG NIEUN-TIKEUT',
+    '\u11c7': 'HANGUL JONGSEONG NIEUN-SIOS',
+    '\u11c8': 'HANGUL JONGSEONG NIEUN-PANSIOS',
+    '\u11c9': 'HANGUL JONGSEONG NIEUN-THIEUTH',
+    '\u11ca': 'HANGUL JONGSEONG TIKEUT-KIYEOK',
+    '\u11cb': 'HANGUL JONGSEONG TIKEUT-RIEUL',
+    '\u11cc': 'HANGUL JONGSEONG RIEUL-KIYEOK-SIOS',
+    '\u11cd': 'HANGUL JONGSEONG RIEUL-NIEUN',
+    '\u11ce': 'HANGUL JONGSEONG RIEUL-TIKEUT',
+    '\u11cf': 'HANGUL JONGSEONG RIEUL-TIKEUT-HIEUH',
+    '\u11d0': 'HANGUL JONGSEONG SSANGRIEUL',
+    '\u11d1': 'HANGUL JONGSEONG RIEUL-MIEUM-KIYEOK',
+    '\u11d2': 'HANGUL JONGSEONG RIEUL-MIEUM-SIOS',
+    '\u11d3': 'HANGUL JONGSEONG RIEUL-PIEUP-SIOS',
+    '\u11d4': 'HANGUL JONGSEONG RIEUL-PIEUP-HIEUH',
+    '\u11d5': 'HANGUL JONGSEONG RIEUL-KAPYEOUNPIEUP',
+    '\u11d6': 'HANGUL JONGSEONG RIEUL-SSANGSIOS',
+    '\u11d7': 'HANGUL JONGSEONG RIEUL-PANSIOS',
+    '\u11d8': 'HANGUL JONGSEONG RIEUL-KHIEUKH',
+    '\u11d9': 'HANGUL JONGSEONG RIEUL-YEORINHIEUH',
+    '\u11da': 'HANGUL JONGSEONG MIEUM-KIYEOK',
+    '\u11db': 'HANGUL JONGSEONG MIEUM-RIEUL',
+    '\u11dc': 'HANGUL JONGSEONG MIEUM-PIEUP',
+    '\u11dd': 'HANGUL JONGSEONG MIEUM-SIOS',
+    '\u11de': 'HANGUL JONGSEONG MIEUM-SSANGSIOS',
+    '\u11df': 'HANGUL JONGSEONG MIEUM-PANSIOS',
+    '\u11e0': 'HANGUL JONGSEONG MIEUM-CHIEUCH',
+    '\u11e1': 'HANGUL JONGSEONG MIEUM-HIEUH',
+    '\u11e2': 'HANGUL JONGSEONG KAPYEOUNMIEUM',
+    '\u11e3': 'HANGUL JONGSEONG PIEUP-RIEUL',
+    '\u11e4': 'HANGUL JONGSEONG PIEUP-PHIEUPH',
+    '\u11e5': 'HANGUL JONGSEONG PIEUP-HIEUH',
+    '\u11e6': 'HANGUL JONGSEONG KAPYEOUNPIEUP',
+    '\u11e7': 'HANGUL JONGSEONG SIOS-KIYEOK',
+    '\u11e8': 'HANGUL JONGSEONG SIOS-TIKEUT',
+    '\u11e9': 'HANGUL JONGSEONG SIOS-RIEUL',
+    '\u11ea': 'HANGUL JONGSEONG SIOS-PIEUP',
+    '\u11eb': 'HANGUL JONGSEONG PANSIOS',
+    '\u11ec': 'HANGUL JONGSEONG IEUNG-KIYEOK',
+    '\u11ed': 'HANGUL JONGSEONG IEUNG-SSANGKIYEOK',
+    '\u11ee': 'HANGUL JONGSEONG SSANGIEUNG',
+    '\u11ef': 'HANGUL JONGSEONG IEUNG-KHIEUKH',
+    '\u11f0': 'HANGUL JONGSEONG YESIEUNG',
+    '\u11f1': 'HANGUL JONGSEONG YESIEUNG-SIOS',
+    '\u11f2': 'HANGUL JONGSEONG YESIEUNG-PANSIOS',
+    '\u11f3': 'HANGUL JONGSEONG PHIEUPH-PIEUP',
+    '\u11f4': 'HANGUL JONGSEONG KAPYEOUNPHIEUPH',
+    '\u11f5': 'HANGUL JONGSEONG HIEUH-NIEUN',
+    '\u11f6': 'HANGUL JONGSEONG HIEUH-RIEUL',
+    '\u11f7': 'HANGUL JONGSEONG HIEUH-MIEUM',
+    '\u11f8': 'HANGUL JONGSEONG HIEUH-PIEUP',
+    '\u11f9': 'HANGUL JONGSEONG YEORINHIEUH',
+    '\u11fa': 'HANGUL JONGSEONG KIYEOK-NIEUN',
+    '\u11fb': 'HANGUL JONGSEONG KIYEOK-PIEUP',
+    '\u11fc': 'HANGUL JONGSEONG KIYEOK-CHIEUCH',
+    '\u11fd': 'HANGUL JONGSEONG KIYEOK-KHIEUKH',
+    '\u11fe': 'HANGUL JONGSEONG KIYEOK-HIEUH',
+    '\u11ff': 'HANGUL JONGSEONG SSANGNIEUN',
+    '\ua960': 'HANGUL CHOSEONG TIKEUT-MIEUM',
+    '\ua961': 'HANGUL CHOSEONG TIKEUT-PIEUP',
+    '\ua962': 'HANGUL CHOSEONG TIKEUT-SIOS',
+    '\ua963': 'HANGUL CHOSEONG TIKEUT-CIEUC',
+    '\ua964': 'HANGUL CHOSEONG RIEUL-KIYEOK',
+    '\ua965': 'HANGUL CHOSEONG RIEUL-SSANGKIYEOK',
+    '\ua966': 'HANGUL CHOSEONG RIEUL-TIKEUT',
+    '\ua967': 'HANGUL CHOSEONG RIEUL-SSANGTIKEUT',
+    '\ua968': 'HANGUL CHOSEONG RIEUL-MIEUM',
+    '\ua969': 'HANGUL CHOSEONG RIEUL-PIEUP',
+    '\ua96a': 'HANGUL CHOSEONG RIEUL-SSANGPIEUP',
+    '\ua96b': 'HANGUL CHOSEONG RIEUL-KAPYEOUNPIEUP',
+    '\ua96c': 'HANGUL CHOSEONG RIEUL-SIOS',
+    '\ua96d': 'HANGUL CHOSEONG RIEUL-CIEUC',
+    '\ua96e': 'HANGUL CHOSEONG RIEUL-KHIEUKH',
+    '\ua96f': 'HANGUL CHOSEONG MIEUM-KIYEOK',
+    '\ua970': 'HANGUL CHOSEONG MIEUM-TIKEUT',
+    '\ua971': 'HANGUL CHOSEONG MIEUM-SIOS',
+    '\ua972': 'HANGUL CHOSEONG PIEUP-SIOS-THIEUTH',
+    '\ua973': 'HANGUL CHOSEONG PIEUP-KHIEUKH',
+    '\ua974': 'HANGUL CHOSEONG PIEUP-HIEUH',
+    '\ua975': 'HANGUL CHOSEONG SSANGSIOS-PIEUP',
+    '\ua976': 'HANGUL CHOSEONG IEUNG-RIEUL',
+    '\ua977': 'HANGUL CHOSEONG IEUNG-HIEUH',
+    '\ua978': 'HANGUL CHOSEONG SSANGCIEUC-HIEUH',
+    '\ua979': 'HANGUL CHOSEONG SSANGTHIEUTH',
+    '\ua97a': 'HANGUL CHOSEONG PHIEUPH-HIEUH',
+    '\ua97b': 'HANGUL CHOSEONG HIEUH-SIOS',
+    '\ua97c': 'HANGUL CHOSEONG SSANGYEORINHIEUH',
+    '\ud7b0': 'HANGUL JUNGSEONG O-YEO',
+    '\ud7b1': 'HANGUL JUNGSEONG O-O-I',
+    '\ud7b2': 'HANGUL JUNGSEONG YO-A',
+    '\ud7b3': 'HANGUL JUNGSEONG YO-AE',
+    '\ud7b4': 'HANGUL JUNGSEONG YO-EO',
+    '\ud7b5': 'HANGUL JUNGSEONG U-YEO',
+    '\ud7b6': 'HANGUL JUNGSEONG U-I-I',
+    '\ud7b7': 'HANGUL JUNGSEONG YU-AE',
+    '\ud7b8': 'HANGUL JUNGSEONG YU-O',
+    '\ud7b9': 'HANGUL JUNGSEONG EU-A',
+    '\ud7ba': 'HANGUL JUNGSEONG EU-EO',
+    '\ud7bb': 'HANGUL JUNGSEONG EU-E',
+    '\ud7bc': 'HANGUL JUNGSEONG EU-O',
+    '\ud7bd': 'HANGUL JUNGSEONG I-YA-O',
+    '\ud7be': 'HANGUL JUNGSEONG I-YAE',
+    '\ud7bf': 'HANGUL JUNGSEONG I-YEO',
+    '\ud7c0': 'HANGUL JUNGSEONG I-YE',
+    '\ud7c1': 'HANGUL JUNGSEONG I-O-I',
+    '\ud7c2': 'HANGUL JUNGSEONG I-YO',
+    '\ud7c3': 'HANGUL JUNGSEONG I-YU',
+    '\ud7c4': 'HANGUL JUNGSEONG I-I',
+    '\ud7c5': 'HANGUL JUNGSEONG ARAEA-A',
+    '\ud7c6': 'HANGUL JUNGSEONG ARAEA-E',
+    '\ud7cb': 'HANGUL JONGSEONG NIEUN-RIEUL',
+    '\ud7cc': 'HANGUL JONGSEONG NIEUN-CHIEUCH',
+    '\ud7cd': 'HANGUL JONGSEONG SSANGTIKEUT',
+    '\ud7ce': 'HANGUL JONGSEONG SSANGTIKEUT-PIEUP',
+    '\ud7cf': 'HANGUL JONGSEONG TIKEUT-PIEUP',
+    '\ud7d0': 'HANGUL JONGSEONG TIKEUT-SIOS',
+    '\ud7d1': 'HANGUL JONGSEONG TIKEUT-SIOS-KIYEOK',
+    '\ud7d2': 'HANGUL JONGSEONG TIKEUT-CIEUC',
+    '\ud7d3': 'HANGUL JONGSEONG TIKEUT-CHIEUCH',
+    '\ud7d4': 'HANGUL JONGSEONG TIKEUT-THIEUTH',
+    '\ud7d5': 'HANGUL JONGSEONG RIEUL-SSANGKIYEOK',
+    '\ud7d6': 'HANGUL JONGSEONG RIEUL-KIYEOK-HIEUH',
+    '\ud7d7': 'HANGUL JONGSEONG SSANGRIEUL-KHIEUKH',
+    '\ud7d8': 'HANGUL JONGSEONG RIEUL-MIEUM-HIEUH',
+    '\ud7d9': 'HANGUL JONGSEONG RIEUL-PIEUP-TIKEUT',
+    '\ud7da': 'HANGUL JONGSEONG RIEUL-PIEUP-PHIEUPH',
+    '\ud7db': 'HANGUL JONGSEONG RIEUL-YESIEUNG',
+    '\ud7dc': 'HANGUL JONGSEONG RIEUL-YEORINHIEUH-HIEUH',
+    '\ud7dd': 'HANGUL JONGSEONG KAPYEOUNRIEUL',
+    '\ud7de': 'HANGUL JONGSEONG MIEUM-NIEUN',
+    '\ud7df': 'HANGUL JONGSEONG MIEUM-SSANGNIEUN',
+    '\ud7e0': 'HANGUL JONGSEONG SSANGMIEUM',
+    '\ud7e1': 'HANGUL JONGSEONG MIEUM-PIEUP-SIOS',
+    '\ud7e2': 'HANGUL JONGSEONG MIEUM-CIEUC',
+    '\ud7e3': 'HANGUL JONGSEONG PIEUP-TIKEUT',
+    '\ud7e4': 'HANGUL JONGSEONG PIEUP-RIEUL-PHIEUPH',
+    '\ud7e5': 'HANGUL JONGSEONG PIEUP-MIEUM',
+    '\ud7e6': 'HANGUL JONGSEONG SSANGPIEUP',
+    '\ud7e7': 'HANGUL JONGSEONG PIEUP-SIOS-TIKEUT',
+    '\ud7e8': 'HANGUL JONGSEONG PIEUP-CIEUC',
+    '\ud7e9': 'HANGUL JONGSEONG PIEUP-CHIEUCH',
+    '\ud7ea': 'HANGUL JONGSEONG SIOS-MIEUM',
+    '\ud7eb': 'HANGUL JONGSEONG SIOS-KAPYEOUNPIEUP',
+    '\ud7ec': 'HANGUL JONGSEONG SSANGSIOS-KIYEOK',
+    '\ud7ed': 'HANGUL JONGSEONG SSANGSIOS-TIKEUT',
+    '\ud7ee': 'HANGUL JONGSEONG SIOS-PANSIOS',
+    '\ud7ef': 'HANGUL JONGSEONG SIOS-CIEUC',
+    '\ud7f0': 'HANGUL JONGSEONG SIOS-CHIEUCH',
+    '\ud7f1': 'HANGUL JONGSEONG SIOS-THIEUTH',
+    '\ud7f2': 'HANGUL JONGSEONG SIOS-HIEUH',
+    '\ud7f3': 'HANGUL JONGSEONG PANSIOS-PIEUP',
+    '\ud7f4': 'HANGUL JONGSEONG PANSIOS-KAPYEOUNPIEUP',
+    '\ud7f5': 'HANGUL JONGSEONG YESIEUNG-MIEUM',
+    '\ud7f6': 'HANGUL JONGSEONG YESIEUNG-HIEUH',
+    '\ud7f7': 'HANGUL JONGSEONG CIEUC-PIEUP',
+    '\ud7f8': 'HANGUL JONGSEONG CIEUC-SSANGPIEUP',
+    '\ud7f9': 'HANGUL JONGSEONG SSANGCIEUC',
+    '\ud7fa': 'HANGUL JONGSEONG PHIEUPH-SIOS',
+    '\ud7fb': 'HANGUL JONGSEONG PHIEUPH-THIEUTH',
+}
+HCJ_TO_NAME = {
+    '\u3131': 'HANGUL LETTER KIYEOK',
+    '\u3132': 'HANGUL LETTER SSANGKIYEOK',
+    '\u3133': 'HANGUL LETTER KIYEOK-SIOS',
+    '\u3134': 'HANGUL LETTER NIEUN',
+    '\u3135': 'HANGUL LETTER NIEUN-CIEUC',
+    '\u3136': 'HANGUL LETTER NIEUN-HIEUH',
+    '\u3137': 'HANGUL LETTER TIKEUT',
+    '\u3138': 'HANGUL LETTER SSANGTIKEUT',
+    '\u3139': 'HANGUL LETTER RIEUL',
+    '\u313a': 'HANGUL LETTER RIEUL-KIYEOK',
+    '\u313b': 'HANGUL LETTER RIEUL-MIEUM',
+    '\u313c': 'HANGUL LETTER RIEUL-PIEUP',
+    '\u313d': 'HANGUL LETTER RIEUL-SIOS',
+    '\u313e': 'HANGUL LETTER RIEUL-THIEUTH',
+    '\u313f': 'HANGUL LETTER RIEUL-PHIEUPH',
+    '\u3140': 'HANGUL LETTER RIEUL-HIEUH',
+    '\u3141': 'HANGUL LETTER MIEUM',
+    '\u3142': 'HANGUL LETTER PIEUP',
+    '\u3143': 'HANGUL LETTER SSANGPIEUP',
+    '\u3144': 'HANGUL LETTER PIEUP-SIOS',
+    '\u3145': 'HANGUL LETTER SIOS',
+    '\u3146': 'HANGUL LETTER SSANGSIOS',
+    '\u3147': 'HANGUL LETTER IEUNG',
+    '\u3148': 'HANGUL LETTER CIEUC',
+    '\u3149': 'HANGUL LETTER SSANGCIEUC',
+    '\u314a': 'HANGUL LETTER CHIEUCH',
+    '\u314b': 'HANGUL LETTER KHIEUKH',
+    '\u314c': 'HANGUL LETTER THIEUTH',
+    '\u314d': 'HANGUL LETTER PHIEUPH',
+    '\u314e': 'HANGUL LETTER HIEUH',
+    '\u314f': 'HANGUL LETTER A',
+    '\u3150': 'HANGUL LETTER AE',
+    '\u3151': 'HANGUL LETTER YA',
+    '\u3152': 'HANGUL LETTER YAE',
+    '\u3153': 'HANGUL LETTER EO',
+    '\u3154': 'HANGUL LETTER E',
+    '\u3155': 'HANGUL LETTER YEO',
+    '\u3156': 'HANGUL LETTER YE',
+    '\u3157': 'HANGUL LETTER O',
+    '\u3158': 'HANGUL LETTER WA',
+    '\u3159': 'HANGUL LETTER WAE',
+    '\u315a': 'HANGUL LETTER OE',
+    '\u315b': 'HANGUL LETTER YO',
+    '\u315c': 'HANGUL LETTER U',
+    '\u315d': 'HANGUL LETTER WEO',
+    '\u315e': 'HANGUL LETTER WE',
+    '\u315f': 'HANGUL LETTER WI',
+    '\u3160': 'HANGUL LETTER YU',
+    '\u3161': 'HANGUL LETTER EU',
+    '\u3162': 'HANGUL LETTER YI',
+    '\u3163': 'HANGUL LETTER I',
+    '\u3164': 'HANGUL FILLER',
+    '\u3165': 'HANGUL LETTER SSANGNIEUN',
+    '\u3166': 'HANGUL LETTER NIEUN-TIKEUT',
+    '\u3167': 'HANGUL LETTER NIEUN-SIOS',
+    '\u3168': 'HANGUL LETTER NIEUN-PANSIOS',
+    '\u3169': 'HANGUL LETTER RIEUL-KIYEOK-SIOS',
+    '\u316a': 'HANGUL LETTER RIEUL-TIKEUT',
+    '\u316b': 'HANGUL LETTER RIEUL-PIEUP-SIOS',
+    '\u316c': 'HANGUL LETTER RIEUL-PANSIOS',
+    '\u316d': 'HANGUL LETTER RIEUL-YEORINHIEUH',
+    '\u316e': 'HANGUL LETTER MIEUM-PIEUP',
+    '\u316f': 'HANGUL LETTER MIEUM-SIOS',
+    '\u3170': 'HANGUL LETTER MIEUM-PANSIOS',
+    '\u3171': 'HANGUL LETTER KAPYEOUNMIEUM',
+    '\u3172': 'HANGUL LETTER PIEUP-KIYEOK',
+    '\u3173': 'HANGUL LETTER PIEUP-TIKEUT',
+    '\u3174': 'HANGUL LETTER PIEUP-SIOS-KIYEOK',
+    '\u3175': 'HANGUL LETTER PIEUP-SIOS-TIKEUT',
+    '\u3176': 'HANGUL LETTER PIEUP-CIEUC',
+    '\u3177': 'HANGUL LETTER PIEUP-THIEUTH',
+    '\u3178': 'HANGUL LETTER KAPYEOUNPIEUP',
+    '\u3179': 'HANGUL LETTER KAPYEOUNSSANGPIEUP',
+    '\u317a': 'HANGUL LETTER SIOS-KIYEOK',
+    '\u317b': 'HANGUL LETTER SIOS-NIEUN',
+    '\u317c': 'HANGUL LETTER SIOS-TIKEUT',
+    '\u317d': 'HANGUL LETTER SIOS-PIEUP',
+    '\u317e': 'HANGUL LETTER SIOS-CIEUC',
+    '\u317f': 'HANGUL LETTER PANSIOS',
+    '\u3180': 'HANGUL LETTER SSANGIEUNG',
+    '\u3181': 'HANGUL LETTER YESIEUNG',
+    '\u3182': 'HANGUL LETTER YESIEUNG-SIOS',
+    '\u3183': 'HANGUL LETTER YESIEUNG-PANSIOS',
+    '\u3184': 'HANGUL LETTER KAPYEOUNPHIEUPH',
+    '\u3185': 'HANGUL LETTER SSANGHIEUH',
+    '\u3186': 'HANGUL LETTER YEORINHIEUH',
+    '\u3187': 'HANGUL LETTER YO-YA',
+    '\u3188': 'HANGUL LETTER YO-YAE',
+    '\u3189': 'HANGUL LETTER YO-I',
+    '\u318a': 'HANGUL LETTER YU-YEO',
+    '\u318b': 'HANGUL LETTER YU-YE',
+    '\u318c': 'HANGUL LETTER YU-I',
+    '\u318d': 'HANGUL LETTER ARAEA',
+    '\u318e': 'HANGUL LETTER ARAEAE',
+}
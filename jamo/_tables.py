@@ -0,0 +1,434 @@
+# -*- coding: utf-8 -*-
+"""Conversion tables for every Hangul jamo block.
+
+Generated by tools/parse.py from tools/data/HangulJamoData.txt. Do not edit.
+"""
+
+JAMO_TO_HCJ = {
+    '\u1100': '\u3131',
+    '\u1101': '\u3132',
+    '\u1102': '\u3134',
+    '\u1103': '\u3137',
+    '\u1104': '\u3138',
+    '\u1105': '\u3139',
+    '\u1106': '\u3141',
+    '\u1107': '\u3142',
+    '\u1108': '\u3143',
+    '\u1109': '\u3145',
+    '\u110a': '\u3146',
+    '\u110b': '\u3147',
+    '\u110c': '\u3148',
+    '\u110d': '\u3149',
+    '\u110e': '\u314a',
+    '\u110f': '\u314b',
+    '\u1110': '\u314c',
+    '\u1111': '\u314d',
+    '\u1112': '\u314e',
+    '\u1114': '\u3165',
+    '\u1115': '\u3166',
+    '\u111a': '\u3140',
+    '\u111c': '\u316e',
+    '\u111d': '\u3171',
+    '\u111e': '\u3172',
+    '\u1120': '\u3173',
+    '\u1121': '\u3144',
+    '\u1122': '\u3174',
+    '\u1123': '\u3175',
+    '\u1127': '\u3176',
+    '\u1129': '\u3177',
+    '\u112b': '\u3178',
+    '\u112c': '\u3179',
+    '\u112d': '\u317a',
+    '\u112e': '\u317b',
+    '\u112f': '\u317c',
+    '\u1132': '\u317d',
+    '\u1136': '\u317e',
+    '\u1140': '\u317f',
+    '\u1147': '\u3180',
+    '\u114c': '\u3181',
+    '\u1157': '\u3184',
+    '\u1158': '\u3185',
+    '\u1159': '\u3186',
+    '\u115b': '\u3167',
+    '\u115c': '\u3135',
+    '\u115d': '\u3136',
+    '\u1161': '\u314f',
+    '\u1162': '\u3150',
+    '\u1163': '\u3151',
+    '\u1164': '\u3152',
+    '\u1165': '\u3153',
+    '\u1166': '\u3154',
+    '\u1167': '\u3155',
+    '\u1168': '\u3156',
+    '\u1169': '\u3157',
+    '\u116a': '\u3158',
+    '\u116b': '\u3159',
+    '\u116c': '\u315a',
+    '\u116d': '\u315b',
+    '\u116e': '\u315c',
+    '\u116f': '\u315d',
+    '\u1170': '\u315e',
+    '\u1171': '\u315f',
+    '\u1172': '\u3160',
+    '\u1173': '\u3161',
+    '\u1174': '\u3162',
+    '\u1175': '\u3163',
+    '\u1184': '\u3187',
+    '\u1185': '\u3188',
+    '\u1188': '\u3189',
+    '\u1191': '\u318a',
+    '\u1192': '\u318b',
+    '\u1194': '\u318c',
+    '\u119e': '\u318d',
+    '\u11a8': '\u3131',
+    '\u11a9': '\u3132',
+    '\u11aa': '\u3133',
+    '\u11ab': '\u3134',
+    '\u11ac': '\u3135',
+    '\u11ad': '\u3136',
+    '\u11ae': '\u3137',
+    '\u11af': '\u3139',
+    '\u11b0': '\u313a',
+    '\u11b1': '\u313b',
+    '\u11b2': '\u313c',
+    '\u11b3': '\u313d',
+    '\u11b4': '\u313e',
+    '\u11b5': '\u313f',
+    '\u11b6': '\u3140',
+    '\u11b7': '\u3141',
+    '\u11b8': '\u3142',
+    '\u11b9': '\u3144',
+    '\u11ba': '\u3145',
+    '\u11bb': '\u3146',
+    '\u11bc': '\u3147',
+    '\u11bd': '\u3148',
+    '\u11be': '\u314a',
+    '\u11bf': '\u314b',
+    '\u11c0': '\u314c',
+    '\u11c1': '\u314d',
+    '\u11c2': '\u314e',
+    '\u11c6': '\u3166',
+    '\u11c7': '\u3167',
+    '\u11c8': '\u3168',
+    '\u11cc': '\u3169',
+    '\u11ce': '\u316a',
+    '\u11d3': '\u316b',
+    '\u11d7': '\u316c',
+    '\u11d9': '\u316d',
+    '\u11dc': '\u316e',
+    '\u11dd': '\u316f',
+    '\u11df': '\u3170',
+    '\u11e2': '\u3171',
+    '\u11e6': '\u3178',
+    '\u11e7': '\u317a',
+    '\u11e8': '\u317c',
+    '\u11ea': '\u317d',
+    '\u11eb': '\u317f',
+    '\u11ee': '\u3180',
+    '\u11f0': '\u3181',
+    '\u11f1': '\u3182',
+    '\u11f2': '\u3183',
+    '\u11f4': '\u3184',
+    '\u11f9': '\u3186',
+    '\u11ff': '\u3165',
+    '\ua964': '\u313a',
+    '\ua966': '\u316a',
+    '\ua968': '\u313b',
+    '\ua969': '\u313c',
+    '\ua96c': '\u313d',
+    '\ua971': '\u316f',
+    '\ud7cd': '\u3138',
+    '\ud7e3': '\u3173',
+    '\ud7e6': '\u3143',
+    '\ud7e7': '\u3175',
+    '\ud7e8': '\u3176',
+    '\ud7ef': '\u317e',
+    '\ud7f9': '\u3149',
+}
+HCJ_TO_JAMO_LEAD = {
+    '\u1160': '\u115f',
+    '\u11a8': '\u1100',
+    '\u11a9': '\u1101',
+    '\u11ab': '\u1102',
+    '\u11ac': '\u115c',
+    '\u11ad': '\u115d',
+    '\u11ae': '\u1103',
+    '\u11af': '\u1105',
+    '\u11b0': '\ua964',
+    '\u11b1': '\ua968',
+    '\u11b2': '\ua969',
+    '\u11b3': '\ua96c',
+    '\u11b6': '\u111a',
+    '\u11b7': '\u1106',
+    '\u11b8': '\u1107',
+    '\u11b9': '\u1121',
+    '\u11ba': '\u1109',
+    '\u11bb': '\u110a',
+    '\u11bc': '\u110b',
+    '\u11bd': '\u110c',
+    '\u11be': '\u110e',
+    '\u11bf': '\u110f',
+    '\u11c0': '\u1110',
+    '\u11c1': '\u1111',
+    '\u11c2': '\u1112',
+    '\u11c5': '\u1113',
+    '\u11c6': '\u1115',
+    '\u11c7': '\u115b',
+    '\u11ca': '\u1117',
+    '\u11cb': '\u115e',
+    '\u11cd': '\u1118',
+    '\u11ce': '\ua966',
+    '\u11d0': '\u1119',
+    '\u11d5': '\ua96b',
+    '\u11d8': '\ua96e',
+    '\u11da': '\ua96f',
+    '\u11dc': '\u111c',
+    '\u11dd': '\ua971',
+    '\u11e2': '\u111d',
+    '\u11e4': '\u112a',
+    '\u11e5': '\ua974',
+    '\u11e6': '\u112b',
+    '\u11e7': '\u112d',
+    '\u11e8': '\u112f',
+    '\u11e9': '\u1130',
+    '\u11ea': '\u1132',
+    '\u11eb': '\u1140',
+    '\u11ec': '\u1141',
+    '\u11ee': '\u1147',
+    '\u11f0': '\u114c',
+    '\u11f3': '\u1156',
+    '\u11f4': '\u1157',
+    '\u11f9': '\u1159',
+    '\u11ff': '\u1114',
+    '\u3131': '\u1100',
+    '\u3132': '\u1101',
+    '\u3134': '\u1102',
+    '\u3135': '\u115c',
+    '\u3136': '\u115d',
+    '\u3137': '\u1103',
+    '\u3138': '\u1104',
+    '\u3139': '\u1105',
+    '\u313a': '\ua964',
+    '\u313b': '\ua968',
+    '\u313c': '\ua969',
+    '\u313d': '\ua96c',
+    '\u3140': '\u111a',
+    '\u3141': '\u1106',
+    '\u3142': '\u1107',
+    '\u3143': '\u1108',
+    '\u3144': '\u1121',
+    '\u3145': '\u1109',
+    '\u3146': '\u110a',
+    '\u3147': '\u110b',
+    '\u3148': '\u110c',
+    '\u3149': '\u110d',
+    '\u314a': '\u110e',
+    '\u314b': '\u110f',
+    '\u314c': '\u1110',
+    '\u314d': '\u1111',
+    '\u314e': '\u1112',
+    '\u3165': '\u1114',
+    '\u3166': '\u1115',
+    '\u3167': '\u115b',
+    '\u316a': '\ua966',
+    '\u316e': '\u111c',
+    '\u316f': '\ua971',
+    '\u3171': '\u111d',
+    '\u3172': '\u111e',
+    '\u3173': '\u1120',
+    '\u3174': '\u1122',
+    '\u3175': '\u1123',
+    '\u3176': '\u1127',
+    '\u3177': '\u1129',
+    '\u3178': '\u112b',
+    '\u3179': '\u112c',
+    '\u317a': '\u112d',
+    '\u317b': '\u112e',
+    '\u317c': '\u112f',
+    '\u317d': '\u1132',
+    '\u317e': '\u1136',
+    '\u317f': '\u1140',
+    '\u3180': '\u1147',
+    '\u3181': '\u114c',
+    '\u3184': '\u1157',
+    '\u3185': '\u1158',
+    '\u3186': '\u1159',
+    '\ud7cd': '\u1104',
+    '\ud7cf': '\ua961',
+    '\ud7d0': '\ua962',
+    '\ud7d2': '\ua963',
+    '\ud7d5': '\ua965',
+    '\ud7dd': '\u111b',
+    '\ud7e3': '\u1120',
+    '\ud7e6': '\u1108',
+    '\ud7e7': '\u1123',
+    '\ud7e8': '\u1127',
+    '\ud7e9': '\u1128',
+    '\ud7ea': '\u1131',
+    '\ud7ef': '\u1136',
+    '\ud7f0': '\u1137',
+    '\ud7f1': '\u1139',
+    '\ud7f2': '\u113b',
+    '\ud7f9': '\u110d',
+}
+HCJ_TO_JAMO_VOWEL = {
+    '\u115f': '\u1160',
+    '\u314f': '\u1161',
+    '\u3150': '\u1162',
+    '\u3151': '\u1163',
+    '\u3152': '\u1164',
+    '\u3153': '\u1165',
+    '\u3154': '\u1166',
+    '\u3155': '\u1167',
+    '\u3156': '\u1168',
+    '\u3157': '\u1169',
+    '\u3158': '\u116a',
+    '\u3159': '\u116b',
+    '\u315a': '\u116c',
+    '\u315b': '\u116d',
+    '\u315c': '\u116e',
+    '\u315d': '\u116f',
+    '\u315e': '\u1170',
+    '\u315f': '\u1171',
+    '\u3160': '\u1172',
+    '\u3161': '\u1173',
+    '\u3162': '\u1174',
+    '\u3163': '\u1175',
+    '\u3187': '\u1184',
+    '\u3188': '\u1185',
+    '\u3189': '\u1188',
+    '\u318a': '\u1191',
+    '\u318b': '\u1192',
+    '\u318c': '\u1194',
+    '\u318d': '\u119e',
+}
+HCJ_TO_JAMO_TAIL = {
+    '\u1100': '\u11a8',
+    '\u1101': '\u11a9',
+    '\u1102': '\u11ab',
+    '\u1103': '\u11ae',
+    '\u1104': '\ud7cd',
+    '\u1105': '\u11af',
+    '\u1106': '\u11b7',
+    '\u1107': '\u11b8',
+    '\u1108': '\ud7e6',
+    '\u1109': '\u11ba',
+    '\u110a': '\u11bb',
+    '\u110b': '\u11bc',
+    '\u110c': '\u11bd',
+    '\u110d': '\ud7f9',
+    '\u110e': '\u11be',
+    '\u110f': '\u11bf',
+    '\u1110': '\u11c0',
+    '\u1111': '\u11c1',
+    '\u1112': '\u11c2',
+    '\u1113': '\u11c5',
+    '\u1114': '\u11ff',
+    '\u1115': '\u11c6',
+    '\u1117': '\u11ca',
+    '\u1118': '\u11cd',
+    '\u1119': '\u11d0',
+    '\u111a': '\u11b6',
+    '\u111b': '\ud7dd',
+    '\u111c': '\u11dc',
+    '\u111d': '\u11e2',
+    '\u1120': '\ud7e3',
+    '\u1121': '\u11b9',
+    '\u1123': '\ud7e7',
+    '\u1127': '\ud7e8',
+    '\u1128': '\ud7e9',
+    '\u112a': '\u11e4',
+    '\u112b': '\u11e6',
+    '\u112d': '\u11e7',
+    '\u112f': '\u11e8',
+    '\u1130': '\u11e9',
+    '\u1131': '\ud7ea',
+    '\u1132': '\u11ea',
+    '\u1136': '\ud7ef',
+    '\u1137': '\ud7f0',
+    '\u1139': '\ud7f1',
+    '\u113b': '\ud7f2',
+    '\u1140': '\u11eb',
+    '\u1141': '\u11ec',
+    '\u1147': '\u11ee',
+    '\u114c': '\u11f0',
+    '\u1156': '\u11f3',
+    '\u1157': '\u11f4',
+    '\u1159': '\u11f9',
+    '\u115b': '\u11c7',
+    '\u115c': '\u11ac',
+    '\u115d': '\u11ad',
+    '\u115e': '\u11cb',
+    '\u3131': '\u11a8',
+    '\u3132': '\u11a9',
+    '\u3133': '\u11aa',
+    '\u3134': '\u11ab',
+    '\u3135': '\u11ac',
+    '\u3136': '\u11ad',
+    '\u3137': '\u11ae',
+    '\u3138': '\ud7cd',
+    '\u3139': '\u11af',
+    '\u313a': '\u11b0',
+    '\u313b': '\u11b1',
+    '\u313c': '\u11b2',
+    '\u313d': '\u11b3',
+    '\u313e': '\u11b4',
+    '\u313f': '\u11b5',
+    '\u3140': '\u11b6',
+    '\u3141': '\u11b7',
+    '\u3142': '\u11b8',
+    '\u3143': '\ud7e6',
+    '\u3144': '\u11b9',
+    '\u3145': '\u11ba',
+    '\u3146': '\u11bb',
+    '\u3147': '\u11bc',
+    '\u3148': '\u11bd',
+    '\u3149': '\ud7f9',
+    '\u314a': '\u11be',
+    '\u314b': '\u11bf',
+    '\u314c': '\u11c0',
+    '\u314d': '\u11c1',
+    '\u314e': '\u11c2',
+    '\u3165': '\u11ff',
+    '\u3166': '\u11c6',
+    '\u3167': '\u11c7',
+    '\u3168': '\u11c8',
+    '\u3169': '\u11cc',
+    '\u316a': '\u11ce',
+    '\u316b': '\u11d3',
+    '\u316c': '\u11d7',
+    '\u316d': '\u11d9',
+    '\u316e': '\u11dc',
+    '\u316f': '\u11dd',
+    '\u3170': '\u11df',
+    '\u3171': '\u11e2',
+    '\u3173': '\ud7e3',
+    '\u3175': '\ud7e7',
+    '\u3176': '\ud7e8',
+    '\u3178': '\u11e6',
+    '\u317a': '\u11e7',
+    '\u317c': '\u11e8',
+    '\u317d': '\u11ea',
+    '\u317e': '\ud7ef',
+    '\u317f': '\u11eb',
+    '\u3180': '\u11ee',
+    '\u3181': '\u11f0',
+    '\u3182': '\u11f1',
+    '\u3183': '\u11f2',
+    '\u3184': '\u11f4',
+    '\u3186': '\u11f9',
+    '\ua961': '\ud7cf',
+    '\ua962': '\ud7d0',
+    '\ua963': '\ud7d2',
+    '\ua964': '\u11b0',
+    '\ua965': '\ud7d5',
+    '\ua966': '\u11ce',
+    '\ua968': '\u11b1',
+    '\ua969': '\u11b2',
+    '\ua96b': '\u11d5',
+    '\ua96c': '\u11b3',
+    '\ua96e': '\u11d8',
+    '\ua96f': '\u11da',
+    '\ua971': '\u11dd',
+    '\ua974': '\u11e5',
+}
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+"""asyncio adapters for the string converters.
+
+Each adapter consumes an async iterable of str or bytes chunks and is itself
+an async generator of converted str chunks:
+
+    >>> from jamo import aio
+    >>> async for chunk in aio.h2j_stream(reader):
+    ...     await writer.write(chunk)
+
+Bytes are decoded incrementally, so multi-byte characters may be split
+anywhere. Converters that combine characters (hcj2h, normalize) hold back the
+end of a chunk until it can no longer change. The source is only read when
+the consumer asks for more, so a slow consumer slows the producer down, and
+at most max_chunk characters are converted at a time. Chunks of
+offload_threshold characters or more are converted in an executor instead
+of on the event loop.
+"""
+
+import asyncio
+import codecs
+
+from .jamo import (h2j, j2hcj, h2hcj, hcj2h,
+                   _HCJ_LEAD_INDEX, _HCJ_VOWEL_INDEX, _HCJ_TAIL_INDEX)
+from .normalize import normalize
+
+
+def _split_anywhere(text):
+    return len(text)
+
+
+def _split_hcj(text):
+    """Return the last index where hcj2h can restart: before a consonant
+    that is followed by a vowel, or after anything that is not HCJ.
+    """
+    for index in range(len(text) - 2, -1, -1):
+        char = text[index]
+        if char in _HCJ_LEAD_INDEX and text[index + 1] in _HCJ_VOWEL_INDEX:
+            return index
+        if char not in _HCJ_VOWEL_INDEX and char not in _HCJ_TAIL_INDEX and\
+                char not in _HCJ_LEAD_INDEX:
+            return index + 1
+    return 0
+
+
+def _split_conjoining(text):
+    """Return the index before the end of text that may still compose with
+    what follows: a trailing lead, lead and vowel, or syllable without a
+    tail. Anything before it can no longer change, however long a run of
+    conjoining jamo it is part of.
+    """
+    last = text[-1:]
+    if "\uac00" <= last <= "\ud7a3" and (ord(last) - 0xac00) % 28 == 0:
+        return len(text) - 1
+    index = len(text)
+    if "\u1160" <= last <= "\u11a7":
+        index -= 1
+    if index and "\u1100" <= text[index - 1] <= "\u115f":
+        return index - 1
+    return len(text)
+
+
+async def convert_stream(source, converter, split=_split_anywhere,
+                         encoding="utf-8", errors="strict", max_chunk=65536,
+                         offload_threshold=65536, executor=None):
+    """Convert an async iterable of str or bytes chunks with a str -> str
+    converter, yielding str chunks.
+
+    split(text) returns how much of the buffered text may be converted now;
+    the rest is kept for the next chunk. Set offload_threshold to None to
+    never use the executor.
+    """
+    loop = asyncio.get_running_loop()
+    decoder = None
+    pending = ""
+
+    async def run(text):
+        if offload_threshold is not None and len(text) >= offload_threshold:
+            return await loop.run_in_executor(executor, converter, text)
+        return converter(text)
+
+    async for chunk in source:
+        if isinstance(chunk, (bytes, bytearray, memoryview)):
+            if decoder is None:
+                decoder = codecs.getincrementaldecoder(encoding)(errors)
+            chunk = decoder.decode(chunk)
+        pending += chunk
+        while len(pending) > max_chunk:
+            index = split(pending[:max_chunk]) or split(pending) or\
+                len(pending)
+            if index == len(pending):
+                break
+            piece, pending = pending[:index], pending[index:]
+            yield await run(piece)
+        index = split(pending)
+        if index:
+            piece, pending = pending[:index], pending[index:]
+            yield await run(piece)
+    if decoder is not None:
+        pending += decoder.decode(b"", final=True)
+    if pending:
+        yield await run(pending)
+
+
+def h2j_stream(source, **kwargs):
+    """Async generator version of h2j. See convert_stream for the options.
+    """
+    return convert_stream(source, h2j, **kwargs)
+
+
+def j2hcj_stream(source, **kwargs):
+    """Async generator version of j2hcj. See convert_stream for the options.
+    """
+    return convert_stream(source, j2hcj, **kwargs)
+
+
+def h2hcj_stream(source, **kwargs):
+    """Async generator version of h2hcj. See convert_stream for the options.
+    """
+    return convert_stream(source, h2hcj, **kwargs)
+
+
+def hcj2h_stream(source, **kwargs):
+    """Async generator version of hcj2h, composing across chunk boundaries.
+    See convert_stream for the options.
+    """
+    return convert_stream(source, hcj2h, split=_split_hcj, **kwargs)
+
+
+def normalize_stream(source, **kwargs):
+    """Async generator version of jamo.normalize.normalize, composing across
+    chunk boundaries. See convert_stream for the options.
+    """
+    return convert_stream(source, normalize, split=_split_conjoining,
+                          **kwargs)
@@ -0,0 +1,150 @@
+# -*- coding: utf-8 -*-
+"""Syllable algebra: rewrite the lead, vowel or tail of syllables in place.
+
+Mappings are given per position with HCJ or U+11xx jamo characters; '' stands
+for "no tail". They are compiled once into a codepoint table over all 11172
+modern syllables, so a whole string is rewritten in a single str.translate
+pass without decomposing it:
+
+    >>> from jamo.algebra import substitute, variants
+    >>> substitute("있었다", tails={"ㅆ": "ㅅ"})
+    '잇엇다'
+    >>> substitute("개게", vowels={"ㅐ": "ㅔ", "ㅔ": "ㅐ"})
+    '게개'
+    >>> list(variants("개", vowels={"ㅐ": "ㅔ"}))
+    ['개', '게']
+"""
+
+from functools import lru_cache
+from itertools import product
+
+from .jamo import (_JAMO_OFFSET, _JAMO_LEAD_OFFSET, _JAMO_VOWEL_OFFSET,
+                   _JAMO_TAIL_OFFSET, is_hcj, hcj_to_jamo,
+                   InvalidJamoError)
+
+
+# Number of modern jamo and codepoint offset per position. Indices are
+# 1-based; the tail index 0 means "no tail".
+_POSITIONS = {"lead": (19, _JAMO_LEAD_OFFSET),
+              "vowel": (21, _JAMO_VOWEL_OFFSET),
+              "tail": (27, _JAMO_TAIL_OFFSET)}
+
+
+def _jamo_index(char, position):
+    """Return the index of a modern lead, vowel or tail, as computed by
+    _hangul_char_to_jamo. '' is the tail index 0.
+    """
+    count, offset = _POSITIONS[position]
+    if position == "tail" and not char:
+        return 0
+    if is_hcj(char):
+        char = hcj_to_jamo(char, position)
+    index = ord(char) - offset
+    if not 1 <= index <= count:
+        raise InvalidJamoError(
+            "Not a modern {} jamo.".format(position), char)
+    return index
+
+
+def _index_mapping(mapping, position):
+    """Normalize {jamo: jamo or iterable of jamo} to {index: (indices)}.
+    """
+    result = {}
+    for source, targets in (mapping or {}).items():
+        if isinstance(targets, str) and len(targets) <= 1:
+            targets = [targets]
+        result[_jamo_index(source, position)] = tuple(
+            _jamo_index(_, position) for _ in targets)
+    return result
+
+
+def _freeze(mapping):
+    return tuple(sorted((source, targets if isinstance(targets, str)
+                         else tuple(targets))
+                        for source, targets in (mapping or {}).items()))
+
+
+def _syllable(lead, vowel, tail):
+    return chr(tail + (vowel - 1) * 28 + (lead - 1) * 588 + _JAMO_OFFSET)
+
+
+class SyllableMap(object):
+    """A compiled lead/vowel/tail substitution.
+
+    Each mapping sends a jamo to its replacement; when a replacement is a
+    sequence, the first entry is used by translate and all of them by
+    variants.
+    """
+    def __init__(self, leads=None, vowels=None, tails=None):
+        self._maps = (_index_mapping(leads, "lead"),
+                      _index_mapping(vowels, "vowel"),
+                      _index_mapping(tails, "tail"))
+        self._table = None
+
+    def _options(self, code):
+        """Return the alternatives for a syllable as (lead, vowel, tail)
+        index choices, the original first.
+        """
+        rem = code - _JAMO_OFFSET
+        tail = rem % 28
+        vowel = 1 + ((rem - tail) % 588) // 28
+        lead = 1 + rem // 588
+        return [(index,) + tuple(_ for _ in mapping.get(index, ())
+                                 if _ != index)
+                for index, mapping in zip((lead, vowel, tail), self._maps)]
+
+    @property
+    def table(self):
+        """The str.translate table of every syllable the map changes.
+        """
+        if self._table is None:
+            self._table = {}
+            for code in range(_JAMO_OFFSET, _JAMO_OFFSET + 11172):
+                options = self._options(code)
+                if any(len(_) > 1 for _ in options):
+                    self._table[code] = _syllable(*(_[len(_) > 1]
+                                                    for _ in options))
+        return self._table
+
+    def translate(self, string):
+        """Apply the substitution to every syllable of string.
+        """
+        return string.translate(self.table)
+
+    __call__ = translate
+
+    def variants(self, string):
+        """Lazily yield every string obtained by substituting any subset of
+        the matching positions, starting with string itself.
+        """
+        choices = []
+        for char in string:
+            code = ord(char)
+            if _JAMO_OFFSET <= code < _JAMO_OFFSET + 11172:
+                choices.append([_syllable(*_)
+                                for _ in product(*self._options(code))])
+            else:
+                choices.append([char])
+        return (''.join(_) for _ in product(*choices))
+
+
+@lru_cache(maxsize=64)
+def _compile(leads, vowels, tails):
+    return SyllableMap(dict(leads), dict(vowels), dict(tails))
+
+
+def substitute(string, leads=None, vowels=None, tails=None):
+    """Replace leads, vowels and tails of every syllable in string in a single
+    pass. Compiled maps are cached; see SyllableMap to keep one explicitly.
+    """
+    return _compile(_freeze(leads), _freeze(vowels),
+                    _freeze(tails)).translate(string)
+
+
+def variants(string, leads=None, vowels=None, tails=None):
+    """Lazily generate every variant of string under the given mappings,
+    starting with string itself. Mapping values may be sequences of
+    alternatives.
+    """
+    return _compile(_freeze(leads), _freeze(vowels),
+                    _freeze(tails)).variants(string)
@@ -0,0 +1,231 @@
+# -*- coding: utf-8 -*-
+"""Selectable engines for the string converters h2j and j2hcj.
+
+"reference" is the character-by-character code in jamo/jamo.py and defines
+the expected results. "table" converts with str.translate over precomputed
+tables. "numpy" vectorizes the syllable arithmetic and needs NumPy.
+
+    >>> import jamo
+    >>> jamo.set_backend("table")
+    >>> jamo.h2j("한굴", backend="reference")  # per-call override
+
+Before switching production code to another engine, compare it against the
+reference with the differential harness:
+
+    $ python tools/differential.py --count 1000000
+"""
+
+import random
+import time
+
+from . import jamo as _jamo
+from .jamo import (_JAMO_OFFSET, _JAMO_LEAD_OFFSET, _JAMO_VOWEL_OFFSET,
+                   _JAMO_TAIL_OFFSET, _JAMO_TO_HCJ,
+                   hangul_to_jamo, jamo_to_hcj, _hangul_char_to_jamo)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _as_string(data):
+    return data if isinstance(data, str) else ''.join(data)
+
+
+class ReferenceBackend(object):
+    """The generator-based implementation from jamo/jamo.py.
+    """
+    name = "reference"
+
+    def h2j(self, hangul_string):
+        return ''.join(hangul_to_jamo(hangul_string))
+
+    def j2hcj(self, jamo):
+        return ''.join(jamo_to_hcj(jamo))
+
+
+class TableBackend(object):
+    """Single-pass str.translate over precomputed codepoint tables.
+    """
+    name = "table"
+
+    def __init__(self):
+        self._h2j_table = {code: ''.join(_hangul_char_to_jamo(chr(code)))
+                           for code in range(_JAMO_OFFSET,
+                                             _JAMO_OFFSET + 11172)}
+        self._j2hcj_table = {ord(jamo): hcj
+                             for jamo, hcj in _JAMO_TO_HCJ.items()}
+
+    def h2j(self, hangul_string):
+        return _as_string(hangul_string).translate(self._h2j_table)
+
+    def j2hcj(self, jamo):
+        return _as_string(jamo).translate(self._j2hcj_table)
+
+
+class NumpyBackend(object):
+    """Vectorized syllable arithmetic over UTF-32 code unit arrays.
+    """
+    name = "numpy"
+
+    def __init__(self):
+        if numpy is None:
+            raise ImportError("The numpy backend requires NumPy.")
+        self._hcj_lut = numpy.arange(0x10000, dtype="<u4")
+        for jamo, hcj in _JAMO_TO_HCJ.items():
+            self._hcj_lut[ord(jamo)] = ord(hcj)
+
+    @staticmethod
+    def _codes(string):
+        return numpy.frombuffer(string.encode("utf-32-le", "surrogatepass"),
+                                dtype="<u4")
+
+    def h2j(self, hangul_string):
+        string = _as_string(hangul_string)
+        if not string:
+            return string
+        codes = self._codes(string)
+        rem = codes.astype(numpy.int64) - _JAMO_OFFSET
+        syllable = (rem >= 0) & (rem < 11172)
+        tail = numpy.where(syllable, rem % 28, 0)
+        counts = numpy.where(syllable, numpy.where(tail > 0, 3, 2), 1)
+        starts = numpy.cumsum(counts) - counts
+        out = numpy.empty(int(counts.sum()), dtype="<u4")
+        out[starts] = numpy.where(syllable,
+                                  1 + rem // 588 + _JAMO_LEAD_OFFSET, codes)
+        out[starts[syllable] + 1] = (1 + (rem[syllable] % 588) // 28 +
+                                     _JAMO_VOWEL_OFFSET)
+        tailed = tail > 0
+        out[starts[tailed] + 2] = tail[tailed] + _JAMO_TAIL_OFFSET
+        return out.tobytes().decode("utf-32-le", "surrogatepass")
+
+    def j2hcj(self, jamo):
+        string = _as_string(jamo)
+        if not string:
+            return string
+        codes = self._codes(string)
+        bmp = codes < 0x10000
+        out = codes.copy()
+        out[bmp] = self._hcj_lut[codes[bmp]]
+        return out.tobytes().decode("utf-32-le", "surrogatepass")
+
+
+_BACKEND_TYPES = {"reference": ReferenceBackend,
+                  "table": TableBackend,
+                  "numpy": NumpyBackend}
+_INSTANCES = {}
+
+
+def get_backend(name):
+    """Return the engine instance registered under name. Engines are built
+    on first use. Raises ValueError for unknown names and ImportError when
+    an engine's dependencies are missing.
+    """
+    if name not in _BACKEND_TYPES:
+        raise ValueError("Unknown backend {!r}, expected one of {}.".format(
+            name, ", ".join(sorted(_BACKEND_TYPES))))
+    if name not in _INSTANCES:
+        _INSTANCES[name] = _BACKEND_TYPES[name]()
+    return _INSTANCES[name]
+
+
+def set_backend(name):
+    """Select the engine used by h2j and j2hcj for the whole process.
+    """
+    engine = get_backend(name)
+    _jamo._BACKEND = None if name == "reference" else engine
+
+
+def available_backends():
+    """Return the names of the engines usable in this environment.
+    """
+    names = []
+    for name in sorted(_BACKEND_TYPES):
+        try:
+            get_backend(name)
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+# Character pools for generated test strings: modern syllables dominate, but
+# every class of input the converters treat differently is represented.
+# Built by _get_pools, so that only processes running the harness pay for
+# them.
+_POOLS = []
+
+
+def _get_pools():
+    if not _POOLS:
+        _POOLS.extend([
+            (8, [chr(_) for _ in range(0xac00, 0xd7a4)]),
+            (2, [chr(_) for _ in range(0x1100, 0x1200)]),
+            (2, [chr(_) for _ in range(0x3131, 0x318f)]),
+            (1, [chr(_) for _ in range(0xa960, 0xa97d)] +
+                [chr(_) for _ in range(0xd7b0, 0xd7fc)]),
+            (2, [chr(_) for _ in range(0x20, 0x7f)] + [" ", "\n", "\t"]),
+            (1, ["字", "母", "é", "ㅤ", " ", "\U0001f600", "\U00020000",
+                 chr(0xabff), chr(0xd7a4), chr(0x10ff), chr(0x3130),
+                 chr(0xd800), chr(0xdbff), chr(0xdc00), chr(0xdfff)]),
+        ])
+    return _POOLS
+
+
+def random_strings(count, max_length=64, seed=None):
+    """Yield count random strings drawn from every class of input.
+    """
+    rng = random.Random(seed)
+    weights = [weight for weight, _ in _get_pools()]
+    pools = [pool for _, pool in _get_pools()]
+    for _ in range(count):
+        length = rng.randint(0, max_length)
+        chosen = rng.choices(pools, weights, k=length)
+        yield ''.join(rng.choice(pool) for pool in chosen)
+
+
+def differential_check(count=10000, backends=None, functions=("h2j", "j2hcj"),
+                       max_length=64, seed=None, max_reports=10):
+    """Run generated strings through every backend and compare the results
+    with the reference backend.
+
+    Returns {backend: {"divergences": [(function, input, expected, got)],
+    "count": int, "seconds": float, "speedup": float}}, where divergences
+    holds the first max_reports of the count mismatches and speedup is
+    relative to the reference engine over the same inputs.
+
+    Strings are generated, converted and compared one at a time, so memory
+    use does not grow with count.
+    """
+    if backends is None:
+        backends = available_backends()
+    reference = get_backend("reference")
+    engines = [get_backend(_) for _ in backends if _ != "reference"]
+    report = {_: {"divergences": [], "count": 0, "seconds": 0.0}
+              for _ in backends}
+    report.setdefault("reference", {"divergences": [], "count": 0,
+                                    "seconds": 0.0})
+    clock = time.perf_counter
+    for string in random_strings(count, max_length, seed):
+        for function in functions:
+            start = clock()
+            want = getattr(reference, function)(string)
+            report["reference"]["seconds"] += clock() - start
+            for engine in engines:
+                entry = report[engine.name]
+                start = clock()
+                got = getattr(engine, function)(string)
+                entry["seconds"] += clock() - start
+                if got != want:
+                    entry["count"] += 1
+                    if len(entry["divergences"]) < max_reports:
+                        entry["divergences"].append(
+                            (function, string, want, got))
+    seconds = report["reference"]["seconds"]
+    if "reference" not in backends:
+        del report["reference"]
+    for entry in report.values():
+        entry["speedup"] = (seconds / entry["seconds"]
+                            if entry["seconds"] else float("inf"))
+    return report
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+"""Compact binary storage for Hangul text.
+
+UTF-8 spends three bytes on every Hangul syllable. This format stores text as
+a sequence of big-endian 16-bit units:
+
+    0x0000-0x7FFF  one modern syllable
+    0x8000 | n     a run of n modern conjoining jamo, 7 bits each
+                   ("jamo" mode only), followed by ceil(7n / 8) bytes
+    0xC000 | n     an escape run: n bytes of UTF-8 follow
+
+Each chunk is prefixed with its byte length and character count, and an empty
+chunk ends the sequence.
+
+In "syllable" mode a syllable unit is its index from U+AC00 (0-11171). In
+"jamo" mode it is packed as lead << 10 | vowel << 5 | tail, so each field can
+be read with a shift and a mask.
+
+Text is cut into independently decodable chunks, and an index of chunk
+offsets is appended on close so that JamoReader can seek to any character
+without decoding from the start:
+
+    >>> from jamo.binary import JamoWriter, JamoReader
+    >>> with open("archive.jamb", "wb") as fout:
+    ...     with JamoWriter(fout) as writer:
+    ...         writer.write("한국어 텍스트")
+    >>> with open("archive.jamb", "rb") as fin:
+    ...     JamoReader(fin).read(4, 3)
+    '텍스트'
+"""
+
+from bisect import bisect_right
+import io
+import re
+import struct
+
+from .jamo import _JAMO_OFFSET
+
+
+MODES = ("syllable", "jamo")
+
+_MAGIC = b"JAMB"
+_INDEX_MAGIC = b"JAMX"
+_VERSION = 1
+# magic, version, mode, chunk size in characters
+_HEADER = struct.Struct(">4sBBxxI")
+# byte length of the body, character count
+_CHUNK = struct.Struct(">II")
+# character offset, byte offset of a chunk
+_ENTRY = struct.Struct(">QQ")
+# chunk count, index offset, index magic
+_TRAILER = struct.Struct(">QQ4s")
+
+_MAX_RUN = 0x3FFF
+_JAMO_RUN = 0x8000
+_ESCAPE = 0xC000
+
+_SYLLABLES = "\uac00-\ud7a3"
+_MODERN_JAMO = "\u1100-\u1112\u1161-\u1175\u11a8-\u11c2"
+_RUNS = {"syllable": re.compile("([{0}]+)|([^{0}]+)".format(_SYLLABLES)),
+         "jamo": re.compile("([{0}]+)|([{1}]+)|([^{0}{1}]+)".format(
+             _SYLLABLES, _MODERN_JAMO))}
+
+
+def _jamo_code(char):
+    """Return the 7-bit code of a modern conjoining jamo: leads are 0-18,
+    vowels 19-39 and tails 40-66.
+    """
+    code = ord(char)
+    if code < 0x1161:
+        return code - 0x1100
+    if code < 0x11A8:
+        return code - 0x1161 + 19
+    return code - 0x11A8 + 40
+
+
+def _jamo_char(code):
+    if code < 19:
+        return chr(code + 0x1100)
+    if code < 40:
+        return chr(code - 19 + 0x1161)
+    return chr(code - 40 + 0x11A8)
+
+
+def _encode_syllables(run, mode, out):
+    units = []
+    for char in run:
+        rem = ord(char) - _JAMO_OFFSET
+        if mode == "jamo":
+            tail = rem % 28
+            units.append((rem // 588) << 10 | ((rem % 588) // 28) << 5 | tail)
+        else:
+            units.append(rem)
+    out += struct.pack(">%dH" % len(units), *units)
+
+
+def _encode_jamo(run, out):
+    for start in range(0, len(run), _MAX_RUN):
+        piece = run[start:start + _MAX_RUN]
+        out += struct.pack(">H", _JAMO_RUN | len(piece))
+        # Eight 7-bit codes fill exactly seven bytes, so packing a group at
+        # a time gives the same bits as packing the run as one integer,
+        # without the cost of shifting an ever growing integer.
+        for group in range(0, len(piece), 8):
+            bits = 0
+            for char in piece[group:group + 8]:
+                bits = bits << 7 | _jamo_code(char)
+            count = min(8, len(piece) - group)
+            size = (7 * count + 7) // 8
+            out += (bits << 8 * size - 7 * count).to_bytes(size, "big")
+
+
+def _decode_jamo(data, position, count):
+    """Return the count jamo packed in data from position on.
+    """
+    chars = []
+    for group in range(0, count, 8):
+        size = min(7, (7 * (count - group) + 7) // 8)
+        bits = int.from_bytes(data[position:position + size], "big")
+        position += size
+        length = min(8, count - group)
+        bits >>= 8 * size - 7 * length
+        chars.extend(_jamo_char(bits >> 7 * (length - 1 - _) & 127)
+                     for _ in range(length))
+    return ''.join(chars)
+
+
+def _encode_escape(run, out):
+    # At most four UTF-8 bytes per character keeps every piece in range.
+    # Lone surrogates, which str allows, are stored as their three bytes.
+    step = _MAX_RUN // 4
+    for start in range(0, len(run), step):
+        data = run[start:start + step].encode("utf-8", "surrogatepass")
+        out += struct.pack(">H", _ESCAPE | len(data))
+        out += data
+
+
+def encode(text, mode="syllable"):
+    """Encode text as a chunk body.
+    """
+    if mode not in MODES:
+        raise ValueError("mode must be one of " + ", ".join(MODES))
+    out = bytearray()
+    for match in _RUNS[mode].finditer(text):
+        if match.group(1):
+            _encode_syllables(match.group(1), mode, out)
+        elif mode == "jamo" and match.group(2):
+            _encode_jamo(match.group(2), out)
+        else:
+            _encode_escape(match.group(match.lastindex), out)
+    return bytes(out)
+
+
+def decode(data, mode="syllable"):
+    """Decode a chunk body produced by encode.
+    """
+    if mode not in MODES:
+        raise ValueError("mode must be one of " + ", ".join(MODES))
+    data = memoryview(data)
+    parts = []
+    position = 0
+    while position < len(data):
+        unit = data[position] << 8 | data[position + 1]
+        position += 2
+        if unit < _JAMO_RUN:
+            if mode == "jamo":
+                lead, vowel, tail = unit >> 10, (unit >> 5) & 31, unit & 31
+                unit = tail + vowel * 28 + lead * 588
+            parts.append(chr(unit + _JAMO_OFFSET))
+        elif unit < _ESCAPE:
+            count = unit & _MAX_RUN
+            parts.append(_decode_jamo(data, position, count))
+            position += (7 * count + 7) // 8
+        else:
+            size = unit & _MAX_RUN
+            parts.append(str(data[position:position + size], "utf-8",
+                             "surrogatepass"))
+            position += size
+    return ''.join(parts)
+
+
+class JamoWriter(object):
+    """Write text to a binary stream in chunks of chunk_size characters.
+    close() writes the chunk index; it does not close the underlying stream.
+    """
+    def __init__(self, stream, mode="syllable", chunk_size=65536):
+        if mode not in MODES:
+            raise ValueError("mode must be one of " + ", ".join(MODES))
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be positive")
+        self.stream = stream
+        self.mode = mode
+        self.chunk_size = chunk_size
+        self._pending = []
+        self._pending_length = 0
+        self._chars = 0
+        self._offset = _HEADER.size
+        self._index = []
+        self.closed = False
+        stream.write(_HEADER.pack(_MAGIC, _VERSION, MODES.index(mode),
+                                  chunk_size))
+
+    def write(self, text):
+        """Buffer text, writing out every chunk that fills up.
+        """
+        if self.closed:
+            raise ValueError("write to closed JamoWriter")
+        self._pending.append(text)
+        self._pending_length += len(text)
+        if self._pending_length >= self.chunk_size:
+            pending = ''.join(self._pending)
+            full = len(pending) - len(pending) % self.chunk_size
+            for start in range(0, full, self.chunk_size):
+                self._write_chunk(pending[start:start + self.chunk_size])
+            self._pending = [pending[full:]]
+            self._pending_length = len(pending) - full
+        return len(text)
+
+    def _write_chunk(self, text):
+        body = encode(text, self.mode)
+        self._index.append((self._chars, self._offset))
+        self.stream.write(_CHUNK.pack(len(body), len(text)))
+        self.stream.write(body)
+        self._chars += len(text)
+        self._offset += _CHUNK.size + len(body)
+
+    def close(self):
+        """Flush the last partial chunk and append the chunk index.
+        """
+        if self.closed:
+            return
+        pending = ''.join(self._pending)
+        if pending:
+            self._write_chunk(pending)
+        self._pending = []
+        # An empty chunk ends the chunk sequence for sequential readers.
+        self.stream.write(_CHUNK.pack(0, 0))
+        index_offset = self._offset + _CHUNK.size
+        for entry in self._index:
+            self.stream.write(_ENTRY.pack(*entry))
+        self.stream.write(_TRAILER.pack(len(self._index), index_offset,
+                                        _INDEX_MAGIC))
+        self.closed = True
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class JamoReader(object):
+    """Read text written by JamoWriter from a binary stream.
+
+    Seekable streams with an index support random access through read(start,
+    length); any stream can be decoded front to back with iter_chunks().
+    """
+    def __init__(self, stream):
+        self.stream = stream
+        magic, version, mode, self.chunk_size = _HEADER.unpack(
+            stream.read(_HEADER.size))
+        if magic != _MAGIC or version != _VERSION or mode >= len(MODES):
+            raise ValueError("Not a jamo binary stream.")
+        self.mode = MODES[mode]
+        self._index = None
+
+    def _load_index(self):
+        if self._index is None:
+            self.stream.seek(-_TRAILER.size, io.SEEK_END)
+            count, offset, magic = _TRAILER.unpack(
+                self.stream.read(_TRAILER.size))
+            if magic != _INDEX_MAGIC:
+                raise ValueError("Stream has no chunk index.")
+            self.stream.seek(offset)
+            data = self.stream.read(count * _ENTRY.size)
+            self._index = [_ENTRY.unpack_from(data, _ * _ENTRY.size)
+                           for _ in range(count)]
+            self._length = None
+        return self._index
+
+    def _read_chunk(self, byte_offset):
+        self.stream.seek(byte_offset)
+        size, count = _CHUNK.unpack(self.stream.read(_CHUNK.size))
+        return decode(self.stream.read(size), self.mode)
+
+    def iter_chunks(self):
+        """Yield the decoded chunks in order, reading sequentially from the
+        start of the stream. This works without an index, e.g. on pipes.
+        """
+        if self.stream.seekable():
+            self.stream.seek(_HEADER.size)
+        while True:
+            header = self.stream.read(_CHUNK.size)
+            if len(header) < _CHUNK.size:
+                return
+            size, count = _CHUNK.unpack(header)
+            if not count:
+                return
+            yield decode(self.stream.read(size), self.mode)
+
+    def __len__(self):
+        index = self._load_index()
+        if self._length is None:
+            if not index:
+                self._length = 0
+            else:
+                self.stream.seek(index[-1][1])
+                size, count = _CHUNK.unpack(self.stream.read(_CHUNK.size))
+                self._length = index[-1][0] + count
+        return self._length
+
+    def read(self, start=0, length=None):
+        """Return length characters starting at character offset start,
+        decoding only the chunks that overlap the range.
+        """
+        index = self._load_index()
+        if not index:
+            return ''
+        end = len(self) if length is None else min(start + length, len(self))
+        parts = []
+        chunk = max(bisect_right(index, (start, float("inf"))) - 1, 0)
+        while chunk < len(index) and index[chunk][0] < end:
+            char_offset, byte_offset = index[chunk]
+            text = self._read_chunk(byte_offset)
+            parts.append(text[max(start - char_offset, 0):end - char_offset])
+            chunk += 1
+        return ''.join(parts)
+
+
+def dumps(text, mode="syllable", chunk_size=65536):
+    """Return text encoded as a complete, indexed binary stream.
+    """
+    out = io.BytesIO()
+    with JamoWriter(out, mode, chunk_size) as writer:
+        writer.write(text)
+    return out.getvalue()
+
+
+def loads(data):
+    """Decode a complete binary stream produced by dumps or JamoWriter.
+    """
+    return JamoReader(io.BytesIO(data)).read()
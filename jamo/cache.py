@@ -0,0 +1,124 @@
+# -*- coding: utf-8 -*-
+"""Opt-in memoization for the string-level converters.
+
+Text passing through h2j, j2hcj and friends is usually highly repetitive, so
+a small bounded cache in front of a converter avoids redoing the same work.
+Nothing in jamo is cached unless a converter is explicitly wrapped:
+
+    >>> from jamo import h2j
+    >>> from jamo.cache import cached
+    >>> fast_h2j = cached(h2j, maxsize=10000, tokenize=True)
+    >>> fast_h2j("한국어 한국어") == h2j("한국어 한국어")
+    True
+    >>> info = fast_h2j.cache_info()
+    >>> info.hits, info.misses, info.evictions, info.currsize
+    (1, 1, 0, 1)
+"""
+
+from collections import namedtuple, OrderedDict
+from sys import getsizeof
+import re
+import threading
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "evictions",
+                                     "maxsize", "currsize",
+                                     "maxbytes", "currbytes"])
+
+_WHITESPACE = re.compile(r"(\s+)")
+
+
+class ConversionCache(object):
+    """A thread-safe LRU cache wrapped around a string converter.
+
+    maxsize bounds the number of cached entries and maxbytes bounds their
+    approximate memory footprint; either may be None for no limit. When
+    tokenize is set, input is split on whitespace and every word is cached
+    separately, which only makes sense for converters that treat whitespace
+    as an unchanged separator (h2j, j2hcj, ...).
+    """
+    def __init__(self, func, maxsize=4096, maxbytes=None, tokenize=False):
+        if maxsize is not None and maxsize < 0:
+            raise ValueError("maxsize must be None or non-negative")
+        if maxbytes is not None and maxbytes < 0:
+            raise ValueError("maxbytes must be None or non-negative")
+        self.func = func
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.tokenize = tokenize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._nbytes = 0
+        self.__doc__ = getattr(func, "__doc__", None)
+        self.__name__ = getattr(func, "__name__", "ConversionCache")
+
+    def __call__(self, string):
+        if not self.tokenize:
+            return self._lookup(string)
+        return ''.join(part if not part or part.isspace() else
+                       self._lookup(part)
+                       for part in _WHITESPACE.split(string))
+
+    def __repr__(self):
+        return "<ConversionCache for {name} {info}>".format(
+            name=self.__name__, info=self.cache_info())
+
+    def _lookup(self, key):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+            else:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return value
+        # The conversion itself runs unlocked; concurrent misses on the same
+        # key may both convert, but only one result is stored.
+        value = self.func(key)
+        self._store(key, value)
+        return value
+
+    def _store(self, key, value):
+        size = getsizeof(key) + getsizeof(value)
+        if (self.maxsize == 0 or
+                (self.maxbytes is not None and size > self.maxbytes)):
+            return
+        with self._lock:
+            if key in self._data:
+                return
+            self._data[key] = value
+            self._nbytes += size
+            while ((self.maxsize is not None and
+                    len(self._data) > self.maxsize) or
+                   (self.maxbytes is not None and
+                    self._nbytes > self.maxbytes)):
+                old_key, old_value = self._data.popitem(last=False)
+                self._nbytes -= getsizeof(old_key) + getsizeof(old_value)
+                self._evictions += 1
+
+    def cache_info(self):
+        """Return a CacheInfo snapshot of the hit/miss statistics.
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self._evictions,
+                             self.maxsize, len(self._data),
+                             self.maxbytes, self._nbytes)
+
+    def cache_clear(self):
+        """Drop every cached entry and reset the statistics.
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = self._misses = self._evictions = self._nbytes = 0
+
+
+def cached(func, maxsize=4096, maxbytes=None, tokenize=False):
+    """Wrap a string converter such as h2j or j2hcj in a ConversionCache.
+    See ConversionCache for the meaning of the arguments.
+    """
+    return ConversionCache(func, maxsize=maxsize, maxbytes=maxbytes,
+                           tokenize=tokenize)
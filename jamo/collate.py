@@ -0,0 +1,157 @@
+# -*- coding: utf-8 -*-
+"""Sort keys that collate Hangul by its jamo.
+
+Code point order puts HCJ, conjoining jamo and syllables in unrelated
+ranges. sort_key() instead reads every string as a sequence of units: a
+Hangul unit is a (lead, vowel, tail) triple, however it is written, and any
+other character is a unit of its own that sorts before Hangul. The key is a
+bytes object of four bytes per unit, so keys compare the same way in
+sorted(), in database indexes and in external merge sorts:
+
+    >>> from jamo import h2j
+    >>> from jamo.collate import sort_key, hangul_sorted
+    >>> sort_key("한") == sort_key(h2j("한"))
+    True
+    >>> hangul_sorted(["각", "ㄱ", "가나", "가", "A"])
+    ['A', 'ㄱ', '가', '가나', '각']
+
+Modern jamo sort in dictionary order. Archaic leads, vowels and tails sort
+after the modern ones of their position, in code point order. A letter
+written alone sorts as a syllable without vowel, before the syllables that
+start with it.
+"""
+
+import re
+
+from .jamo import (JAMO_COMPOUNDS_MODERN, decompose_jamo,
+                   _JAMO_OFFSET, _HCJ_TO_JAMO)
+from .normalize import normalize
+
+
+def _weights(*ranges):
+    """Return {jamo: weight}, weights counting from 1 in the given order.
+    """
+    chars = [chr(_) for start, end in ranges for _ in range(start, end)]
+    return {char: weight for weight, char in enumerate(chars, 1)}
+
+
+_LEADS = _weights((0x1100, 0x115f), (0xa960, 0xa97d))
+_VOWELS = _weights((0x1161, 0x11a8), (0xd7b0, 0xd7c7))
+_TAILS = _weights((0x11a8, 0x1200), (0xd7cb, 0xd7fc))
+_LEAD_FILLER = len(_LEADS) + 1
+_CONJOINING = re.compile("[\u1100-\u11ff\ua960-\ua97f\ud7b0-\ud7ff]")
+
+
+def _unit(lead, vowel=0, tail=0):
+    return "\x02" + chr(lead) + chr(vowel) + chr(tail)
+
+
+def _hcj_unit(hcj):
+    """Return the unit of a HCJ letter written alone, or None.
+    """
+    if hcj in _HCJ_TO_JAMO["lead"]:
+        return _unit(_LEADS.get(_HCJ_TO_JAMO["lead"][hcj], _LEAD_FILLER))
+    if hcj in _HCJ_TO_JAMO["vowel"]:
+        return _unit(_LEAD_FILLER, _VOWELS[_HCJ_TO_JAMO["vowel"][hcj]])
+    if hcj in _HCJ_TO_JAMO["tail"]:
+        # Clusters that cannot start a syllable sort with their first letter.
+        lead = _LEAD_FILLER
+        if hcj in JAMO_COMPOUNDS_MODERN:
+            lead = _LEADS[_HCJ_TO_JAMO["lead"][decompose_jamo(hcj)[0]]]
+        return _unit(lead, 0, _TAILS[_HCJ_TO_JAMO["tail"][hcj]])
+    if hcj == "\u3164":
+        return _unit(_LEAD_FILLER)
+    return None
+
+
+class _Table(dict):
+    """str.translate table from characters to units. Characters that are not
+    Hangul are added on first use.
+    """
+    def __missing__(self, code):
+        unit = "\x01" + chr(code >> 16) + chr((code >> 8) & 0xff) +\
+            chr(code & 0xff)
+        self[code] = unit
+        return unit
+
+
+def _build_table():
+    table = _Table()
+    # Modern jamo weigh the same as their syllable indices.
+    for rem in range(11172):
+        table[_JAMO_OFFSET + rem] = _unit(1 + rem // 588,
+                                          1 + (rem % 588) // 28, rem % 28)
+    for code in range(0x3131, 0x318f):
+        unit = _hcj_unit(chr(code))
+        if unit is not None:
+            table[code] = unit
+    return table
+
+
+_TABLE = _build_table()
+
+
+def _conjoining_units(string):
+    """Yield the units of a string that has conjoining jamo left after
+    normalization: archaic or incomplete sequences.
+    """
+    lead = vowel = tail = None
+    for char in string:
+        if char in _LEADS or char == "\u115f":
+            position = 0
+        elif char in _VOWELS or char == "\u1160":
+            position = 1
+        elif char in _TAILS:
+            position = 2
+        else:
+            position = None
+        if lead is not None and position is not None and\
+                (position == 1 and vowel is None and tail is None or
+                 position == 2 and vowel is not None and tail is None):
+            if position == 1:
+                vowel = _VOWELS.get(char, 0)
+            else:
+                tail = _TAILS[char]
+            continue
+        if lead is not None:
+            yield _unit(lead, vowel or 0, tail or 0)
+            lead = vowel = tail = None
+        if position == 0:
+            lead = _LEADS.get(char, _LEAD_FILLER)
+        elif position == 1:
+            lead, vowel = _LEAD_FILLER, _VOWELS.get(char, 0)
+        elif position == 2:
+            lead, vowel, tail = _LEAD_FILLER, 0, _TAILS[char]
+        elif _JAMO_OFFSET <= ord(char) < _JAMO_OFFSET + 11172:
+            unit = _TABLE[ord(char)]
+            lead, vowel = ord(unit[1]), ord(unit[2])
+            tail = ord(unit[3]) or None
+        else:
+            yield _TABLE[ord(char)]
+    if lead is not None:
+        yield _unit(lead, vowel or 0, tail or 0)
+
+
+def sort_key(string):
+    """Return the collation key of string as bytes.
+    Strings that differ only in how their Hangul is written, such as a
+    syllable and its conjoining jamo, have equal keys.
+    """
+    string = normalize(string)
+    if _CONJOINING.search(string):
+        string = ''.join(_conjoining_units(string))
+    else:
+        string = string.translate(_TABLE)
+    return string.encode("latin-1")
+
+
+def sort_keys(strings):
+    """Return the collation keys of an iterable of strings, as a list.
+    """
+    return [sort_key(_) for _ in strings]
+
+
+def hangul_sorted(strings, reverse=False):
+    """Return a new list of strings in collation order.
+    """
+    return sorted(strings, key=sort_key, reverse=reverse)
@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""Jamo operations over whole pandas and Arrow string columns.
+
+h2j(), chosung() and has_tail() take a pyarrow string array and work on its
+UTF-8 data and offsets buffers directly, a chunk of chunk_size rows at a
+time, instead of calling a Python function once per row. Importing this
+module also registers a "jamo" accessor on pandas Series:
+
+    >>> import pandas
+    >>> import jamo.columns
+    >>> names = pandas.Series(["한국어", "사전"])
+    >>> list(names.jamo.chosung())
+    ['ㅎㄱㅇ', 'ㅅㅈ']
+    >>> list(names.jamo.has_tail())
+    [False, True]
+
+chosung() maps every syllable to a letter of the same UTF-8 length, so the
+offsets are kept and the data buffer goes through a single str.translate.
+h2j() decomposes the data buffer with the NumPy arithmetic of jamo.utf8 and
+shifts the offsets by the growth of the syllables before them. has_tail()
+reads the last syllable of every row from its end offset, and only rows that
+end in something else go through jamo.has_tail.
+
+pandas and pyarrow are optional. Without pyarrow or NumPy, the accessor
+falls back to mapping the "table" backend over the rows.
+"""
+
+from .backends import get_backend
+from .index import _get_chosung_table
+from .jamo import _JAMO_OFFSET, has_tail as _has_tail
+from . import utf8
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+try:
+    import pandas
+except ImportError:
+    pandas = None
+
+
+def _chunks(array, chunk_size):
+    """Yield the arrays of at most chunk_size rows that make up array.
+    """
+    for chunk in getattr(array, "chunks", [array]):
+        for start in range(0, len(chunk), chunk_size):
+            yield chunk.slice(start, chunk_size)
+
+
+def _map_chunks(convert, array, chunk_size, result_type=None):
+    """Apply convert to every chunk of array, a string Array or
+    ChunkedArray, and return the results as an array of the same kind.
+    """
+    if pyarrow is None or numpy is None:
+        raise ImportError("jamo.columns requires pyarrow and NumPy.")
+    if not (pyarrow.types.is_string(array.type) or
+            pyarrow.types.is_large_string(array.type)):
+        array = array.cast(pyarrow.large_string())
+    result_type = result_type or array.type
+    results = [convert(chunk) for chunk in _chunks(array, chunk_size)
+               if len(chunk)]
+    if isinstance(array, pyarrow.ChunkedArray):
+        return pyarrow.chunked_array(results, type=result_type)
+    if not results:
+        return pyarrow.array([], type=result_type)
+    return results[0] if len(results) == 1 else\
+        pyarrow.concat_arrays(results)
+
+
+def _buffers(chunk):
+    """Return the offsets of a string array, counted from the start of its
+    data, and its data, as NumPy arrays.
+    """
+    _, offsets, data = chunk.buffers()
+    large = pyarrow.types.is_large_string(chunk.type)
+    offsets = numpy.frombuffer(offsets, dtype="<i8" if large else "<i4")
+    offsets = offsets[chunk.offset:chunk.offset + len(chunk) + 1]
+    if data is None:
+        data = numpy.zeros(0, dtype=numpy.uint8)
+    else:
+        data = numpy.frombuffer(data, dtype=numpy.uint8)
+    return offsets - offsets[0], data[offsets[0]:offsets[-1]]
+
+
+def _from_buffers(chunk, offsets, data):
+    """Return a string array of the type and nulls of chunk over the given
+    offsets and data.
+    """
+    validity = chunk.is_valid().buffers()[1] if chunk.null_count else None
+    return pyarrow.Array.from_buffers(
+        chunk.type, len(chunk),
+        [validity, pyarrow.py_buffer(offsets), pyarrow.py_buffer(data)],
+        chunk.null_count)
+
+
+def _h2j_chunk(chunk):
+    offsets, data = _buffers(chunk)
+    starts, _, growth = utf8._syllables(data)
+    shift = numpy.zeros(len(data) + 1, dtype=numpy.int64)
+    shift[starts + 3] = growth
+    shift = numpy.cumsum(shift)
+    out = bytearray(len(data) + int(growth.sum()))
+    utf8.decompose_into(data, out)
+    if pyarrow.types.is_string(chunk.type) and len(out) >= 1 << 31:
+        raise OverflowError("Decomposed chunk too large for a string "
+                            "array; use a smaller chunk_size or "
+                            "large_string.")
+    return _from_buffers(chunk, (offsets + shift[offsets]).astype(
+        offsets.dtype), out)
+
+
+def _chosung_chunk(chunk):
+    offsets, data = _buffers(chunk)
+    string = str(data, "utf-8", "surrogateescape")
+    data = string.translate(_get_chosung_table()).encode(
+        "utf-8", "surrogateescape")
+    return _from_buffers(chunk, offsets, data)
+
+
+def _has_tail_chunk(chunk):
+    offsets, data = _buffers(chunk)
+    ends = offsets[1:].astype(numpy.int64)
+    last = numpy.maximum(ends - 3, 0)
+    padded = numpy.concatenate([data, numpy.zeros(3, dtype=numpy.uint8)])
+    code = (padded[last].astype(numpy.int64) & 0x0f) << 12 |\
+        (padded[last + 1].astype(numpy.int64) & 0x3f) << 6 |\
+        padded[last + 2].astype(numpy.int64) & 0x3f
+    syllable = (ends - offsets[:-1] >= 3) & (padded[last] >= 0xea) &\
+        (padded[last] <= 0xed) & (code >= _JAMO_OFFSET) &\
+        (code < _JAMO_OFFSET + 11172)
+    values = (code - _JAMO_OFFSET) % 28 > 0
+    missing = numpy.zeros(len(chunk), dtype=bool)
+    if chunk.null_count:
+        missing |= numpy.asarray(chunk.is_null())
+    for row in numpy.flatnonzero(~syllable & ~missing):
+        # Punctuation, jamo, digits and Latin letters at the end.
+        value = _has_tail(chunk[int(row)].as_py())
+        if value is None:
+            missing[row] = True
+        else:
+            values[row] = value
+    return pyarrow.array(values, mask=missing, type=pyarrow.bool_())
+
+
+def h2j(array, chunk_size=65536):
+    """Decompose the syllables of every row of a pyarrow string array into
+    conjoining jamo, as jamo.h2j does.
+    """
+    return _map_chunks(_h2j_chunk, array, chunk_size)
+
+
+def chosung(array, chunk_size=65536):
+    """Replace every syllable of every row of a pyarrow string array with
+    its lead as HCJ, as jamo.sqlite.chosung does.
+    """
+    return _map_chunks(_chosung_chunk, array, chunk_size)
+
+
+def has_tail(array, chunk_size=65536):
+    """Return a pyarrow boolean array telling if the last syllable of every
+    row has a tail, as jamo.has_tail does. Rows for which it cannot be
+    determined are null.
+    """
+    return _map_chunks(_has_tail_chunk, array, chunk_size, pyarrow.bool_())
+
+
+class JamoAccessor(object):
+    """The "jamo" accessor of pandas Series of strings.
+    """
+    def __init__(self, series):
+        self._series = series
+
+    def _apply(self, convert, fallback, chunk_size, text=True):
+        series = self._series
+        if pyarrow is None or numpy is None:
+            return series.map(fallback, na_action="ignore")
+        result = convert(pyarrow.array(series, from_pandas=True),
+                         chunk_size).to_pandas()
+        if text:
+            result = result.astype(series.dtype)
+        result.index = series.index
+        result.name = series.name
+        missing = series.isna()
+        if missing.any():
+            # Keep missing rows as they were, as map(na_action="ignore").
+            result = result.where(~missing, series)
+        return result
+
+    def h2j(self, chunk_size=65536):
+        """Decompose the syllables of every row, as jamo.h2j does.
+        """
+        return self._apply(h2j, get_backend("table").h2j, chunk_size)
+
+    def chosung(self, chunk_size=65536):
+        """Replace every syllable with its lead as HCJ.
+        """
+        return self._apply(chosung, _chosung, chunk_size)
+
+    def has_tail(self, chunk_size=65536):
+        """Test if the last syllable of every row has a tail. Rows for which
+        it cannot be determined are None.
+        """
+        return self._apply(has_tail, _has_tail, chunk_size, text=False)
+
+
+def _chosung(string):
+    return string.translate(_get_chosung_table())
+
+
+if pandas is not None:
+    pandas.api.extensions.register_series_accessor("jamo")(JamoAccessor)
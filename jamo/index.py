@@ -0,0 +1,417 @@
+# -*- coding: utf-8 -*-
+"""An on-disk inverted index over jamo or chosung n-grams.
+
+Every document is turned into a key, either its letters as in jamo.trie
+("jamo") or the leads of its syllables as HCJ ("chosung"), and the n-grams
+of the keys are indexed with sorted posting lists. The index is written
+once, possibly by several processes, and read through mmap, so opening it
+takes constant time and every process on a node shares one copy in the page
+cache:
+
+    >>> from jamo import index
+    >>> index.build(["한국어 사전", "학교 급식", "한글"], "titles.idx")
+    >>> with index.load("titles.idx") as titles:
+    ...     titles.search("국어"), titles.prefix("한ㄱ")
+    ([0], [0, 2])
+    >>> index.build(["한국어 사전", "학교 급식"], "chosung.idx",
+    ...             mode="chosung")
+    >>> index.load("chosung.idx").prefix("ㅎㄱ")
+    [0, 1]
+
+Grams, keys and posting lists are stored as sorted arrays and found by
+binary search.
+"""
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+import heapq
+from itertools import groupby, islice
+import mmap
+import os
+import shutil
+import struct
+import tempfile
+
+from .jamo import _JAMO_OFFSET, _HCJ_LEAD_INDEX
+from .trie import letters
+
+
+MODES = ("jamo", "chosung")
+
+_MAGIC = b"JIDX"
+_VERSION = 1
+# magic, version, mode, n, reserved, document count, gram count, offsets of
+# the gram offset, gram text, posting offset, posting, key offset, key text
+# and key order arrays
+_HEADER = struct.Struct("<4sHBBIQQ7Q")
+# The sections after the header, in file order.
+_SECTIONS = ("gram_offsets", "gram_text", "posting_offsets", "postings",
+             "key_offsets", "key_text", "order")
+_OFFSET = struct.Struct("<Q")
+_DOCUMENT = struct.Struct("<I")
+# Byte length of a gram and its document count, or of a key and its
+# document, in a run file.
+_RECORD = struct.Struct("<II")
+# Most run files merged, and so open, at a time.
+_FAN_IN = 64
+
+_CHOSUNG = {}
+
+
+def _get_chosung_table():
+    """Return the str.translate table from syllables to their lead as HCJ,
+    built on first use.
+    """
+    if not _CHOSUNG:
+        leads = sorted(_HCJ_LEAD_INDEX, key=_HCJ_LEAD_INDEX.get)
+        for rem in range(11172):
+            _CHOSUNG[_JAMO_OFFSET + rem] = leads[rem // 588]
+    return _CHOSUNG
+
+
+def document_key(text, mode="jamo"):
+    """Return the key under which text is indexed in the given mode.
+    """
+    if mode == "jamo":
+        return letters(text)
+    if mode == "chosung":
+        return text.translate(_get_chosung_table())
+    raise ValueError("mode must be one of " + ", ".join(MODES))
+
+
+def _grams(key, n):
+    """Return the n-grams of a document key. The grams at its end are
+    shorter, so that every position of the key starts a gram.
+    """
+    return {key[_:_ + n] for _ in range(len(key))}
+
+
+def _query_grams(key, n):
+    if len(key) <= n:
+        return {key}
+    return {key[_:_ + n] for _ in range(len(key) - n + 1)}
+
+
+def _chunks(texts, chunk_size):
+    """Yield (number of the first text, list of texts) for every chunk of
+    chunk_size texts, reading texts lazily.
+    """
+    texts = iter(texts)
+    start = 0
+    while True:
+        chunk = list(islice(texts, chunk_size))
+        if not chunk:
+            return
+        yield start, chunk
+        start += len(chunk)
+
+
+def _map_chunks(function, chunks, processes):
+    """Yield function(chunk) for every chunk, in order. With processes, at
+    most twice that many chunks are read ahead and in flight at a time.
+    """
+    if not processes or processes == 1:
+        for chunk in chunks:
+            yield function(chunk)
+        return
+    with ProcessPoolExecutor(processes) as executor:
+        pending = deque()
+        for chunk in chunks:
+            pending.append(executor.submit(function, chunk))
+            if len(pending) >= 2 * processes:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+def _write_run(path, records, postings):
+    """Write sorted (bytes, value) records to a run file. The value is the
+    little-endian uint32 documents when postings is true, and a document
+    otherwise, as read by _read_run.
+    """
+    with open(path, "wb") as fout:
+        for text, value in records:
+            if postings:
+                fout.write(_RECORD.pack(len(text), len(value) // 4) + text +
+                           value)
+            else:
+                fout.write(_RECORD.pack(len(text), value) + text)
+
+
+def _read_run(path, postings):
+    """Yield the (bytes, value) records of a run file. The value is the
+    little-endian uint32 documents when postings is true, and a document
+    otherwise.
+    """
+    with open(path, "rb") as fin:
+        while True:
+            record = fin.read(_RECORD.size)
+            if not record:
+                return
+            size, value = _RECORD.unpack(record)
+            text = fin.read(size)
+            yield text, fin.read(4 * value) if postings else value
+
+
+def _index_chunk(args):
+    """Key and invert one chunk of texts, and spill its grams with their
+    documents and its keys with their documents, both sorted, to two run
+    files. Returns the common path of the runs and the UTF-8 keys in
+    document order.
+    """
+    start, texts, mode, n, directory = args
+    keys = [document_key(_, mode) for _ in texts]
+    postings = {}
+    for document, key in enumerate(keys, start):
+        for gram in _grams(key, n):
+            postings.setdefault(gram, []).append(document)
+    keys = [_.encode("utf-8") for _ in keys]
+    run = os.path.join(directory, "%d" % start)
+    # Strings sort by codepoint, which is also the order of their UTF-8.
+    _write_run(run + ".grams", ((gram.encode("utf-8"),
+                                 struct.pack("<%dI" % len(postings[gram]),
+                                             *postings[gram]))
+                                for gram in sorted(postings)), True)
+    _write_run(run + ".keys", sorted(zip(keys, range(start, start +
+                                                     len(keys)))), False)
+    return run, keys
+
+
+def _merge_runs(paths, postings):
+    """Merge sorted run files. Records with equal bytes come out in the
+    order of paths, so their documents stay in order.
+
+    At most _FAN_IN runs are open at a time: while there are more, every
+    _FAN_IN consecutive runs are first merged into one new run, which
+    replaces them.
+    """
+    while len(paths) > _FAN_IN:
+        merged = []
+        for start in range(0, len(paths), _FAN_IN):
+            group = paths[start:start + _FAN_IN]
+            path = group[0] + ".merged"
+            _write_run(path, _merge_runs(group, postings), postings)
+            for _ in group:
+                os.remove(_)
+            merged.append(path)
+        paths = merged
+    return heapq.merge(*[_read_run(_, postings) for _ in paths],
+                       key=lambda record: record[0])
+
+
+def _write_postings(paths, gram_offsets, gram_text, posting_offsets,
+                    postings):
+    """Merge gram runs into the gram and posting sections. Returns the
+    number of grams.
+    """
+    count = text_offset = posting_offset = 0
+    gram_offsets.write(_OFFSET.pack(0))
+    posting_offsets.write(_OFFSET.pack(0))
+    for gram, records in groupby(_merge_runs(paths, True),
+                                 key=lambda record: record[0]):
+        gram_text.write(gram)
+        text_offset += len(gram)
+        gram_offsets.write(_OFFSET.pack(text_offset))
+        for _, documents in records:
+            postings.write(documents)
+            posting_offset += len(documents) // 4
+        posting_offsets.write(_OFFSET.pack(posting_offset))
+        count += 1
+    return count
+
+
+def _concatenate(fout, sections):
+    """Write room for the header, then every section file aligned to 8
+    bytes. Returns the offsets of the sections.
+    """
+    fout.write(b"\0" * _HEADER.size)
+    position = _HEADER.size
+    offsets = []
+    for section in sections:
+        fout.write(b"\0" * (-position % 8))
+        position += -position % 8
+        offsets.append(position)
+        position += section.tell()
+        section.seek(0)
+        shutil.copyfileobj(section, fout)
+    return offsets
+
+
+def build(texts, path, mode="jamo", n=3, processes=None, chunk_size=65536):
+    """Index texts, numbered from 0, and write the index to path.
+
+    Texts are read chunk_size at a time, and the grams and keys of every
+    chunk are sorted and spilled to run files in a temporary directory next
+    to path, in that many worker processes with processes. The runs are then
+    merged in document order into the index, which is written as a stream,
+    so memory use grows with chunk_size rather than with the number of
+    texts.
+    """
+    if mode not in MODES:
+        raise ValueError("mode must be one of " + ", ".join(MODES))
+    with ExitStack() as stack:
+        directory = stack.enter_context(tempfile.TemporaryDirectory(
+            dir=os.path.dirname(os.path.abspath(path))))
+        sections = {_: stack.enter_context(
+            open(os.path.join(directory, _), "w+b")) for _ in _SECTIONS}
+        chunks = ((start, chunk, mode, n, directory)
+                  for start, chunk in _chunks(texts, chunk_size))
+        runs = []
+        key_offset = 0
+        sections["key_offsets"].write(_OFFSET.pack(0))
+        for run, keys in _map_chunks(_index_chunk, chunks, processes):
+            runs.append(run)
+            for key in keys:
+                sections["key_text"].write(key)
+                key_offset += len(key)
+                sections["key_offsets"].write(_OFFSET.pack(key_offset))
+        grams = _write_postings([_ + ".grams" for _ in runs],
+                                sections["gram_offsets"],
+                                sections["gram_text"],
+                                sections["posting_offsets"],
+                                sections["postings"])
+        documents = 0
+        for _, document in _merge_runs([_ + ".keys" for _ in runs], False):
+            sections["order"].write(_DOCUMENT.pack(document))
+            documents += 1
+        with open(path, "wb") as fout:
+            offsets = _concatenate(fout, [sections[_] for _ in _SECTIONS])
+            fout.seek(0)
+            fout.write(_HEADER.pack(_MAGIC, _VERSION, MODES.index(mode), n,
+                                    0, documents, grams, *offsets))
+
+
+class InvertedIndex(object):
+    """Read-only view over an index written by build.
+    The buffer is never copied.
+    """
+    def __init__(self, buffer, owner=None):
+        self._buffer = memoryview(buffer)
+        self._owner = owner
+        (magic, version, mode, self.n, _, documents, grams,
+         gram_offset_offset, gram_text_offset, posting_offset_offset,
+         posting_offset, key_offset_offset, key_text_offset,
+         order_offset) = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a jamo index buffer.")
+        self.mode = MODES[mode]
+        self._gram_offsets = self._array(gram_offset_offset, grams + 1, "Q")
+        self._gram_text = self._buffer[gram_text_offset:]
+        self._posting_offsets = self._array(posting_offset_offset,
+                                            grams + 1, "Q")
+        self._postings = self._array(posting_offset,
+                                     self._posting_offsets[grams], "I")
+        self._key_offsets = self._array(key_offset_offset, documents + 1,
+                                        "Q")
+        self._key_text = self._buffer[key_text_offset:]
+        self._order = self._array(order_offset, documents, "I")
+
+    def _array(self, offset, count, fmt):
+        size = struct.calcsize(fmt)
+        return self._buffer[offset:offset + count * size].cast(fmt)
+
+    def _gram(self, index):
+        return bytes(self._gram_text[self._gram_offsets[index]:
+                                     self._gram_offsets[index + 1]])
+
+    def _key(self, document):
+        return bytes(self._key_text[self._key_offsets[document]:
+                                    self._key_offsets[document + 1]])
+
+    def _bisect(self, count, value_at, target):
+        low, high = 0, count
+        while low < high:
+            middle = (low + high) // 2
+            if value_at(middle) < target:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _range(self, count, value_at, prefix):
+        """Return the range of sorted entries that start with prefix.
+        """
+        # No UTF-8 sequence contains the byte 0xff.
+        return (self._bisect(count, value_at, prefix),
+                self._bisect(count, value_at, prefix + b"\xff"))
+
+    def key(self, document):
+        """Return the key of a document.
+        """
+        return self._key(document).decode("utf-8")
+
+    def postings(self, gram):
+        """Return the sorted documents containing gram, as a read-only view
+        of uint32. Grams shorter than n are looked up as prefixes, and their
+        documents are merged into a list.
+        """
+        target = gram.encode("utf-8")
+        count = len(self._gram_offsets) - 1
+        low, high = self._range(count, self._gram, target)
+        if high - low == 1 and self._gram(low) == target:
+            return self._postings[self._posting_offsets[low]:
+                                  self._posting_offsets[high]]
+        documents = set()
+        for index in range(low, high):
+            documents.update(self._postings[self._posting_offsets[index]:
+                                            self._posting_offsets[index + 1]])
+        return sorted(documents)
+
+    def search(self, query, verify=True):
+        """Return the sorted documents whose key contains the key of query.
+        Without verify, documents that merely contain all its n-grams are
+        returned too.
+        """
+        key = document_key(query, self.mode)
+        if not key:
+            return list(range(len(self)))
+        lists = sorted((self.postings(_)
+                        for _ in _query_grams(key, self.n)), key=len)
+        documents = set(lists[0])
+        for postings in lists[1:]:
+            if not documents:
+                break
+            documents.intersection_update(postings)
+        if verify and len(key) > self.n:
+            target = key.encode("utf-8")
+            documents = {_ for _ in documents if target in self._key(_)}
+        return sorted(documents)
+
+    def prefix(self, query):
+        """Return the sorted documents whose key starts with the key of query.
+        """
+        target = document_key(query, self.mode).encode("utf-8")
+        low, high = self._range(len(self._order),
+                                lambda _: self._key(self._order[_]), target)
+        return sorted(self._order[low:high])
+
+    def __len__(self):
+        return len(self._order)
+
+    def close(self):
+        """Release the views and close the underlying mapping, if any.
+        """
+        for view in (self._gram_offsets, self._gram_text,
+                     self._posting_offsets, self._postings,
+                     self._key_offsets, self._key_text, self._order,
+                     self._buffer):
+            view.release()
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def load(path):
+    """Map an index file written by build read-only and return an
+    InvertedIndex over it.
+    """
+    with open(path, "rb") as fin:
+        mapping = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+    return InvertedIndex(mapping, owner=mapping)
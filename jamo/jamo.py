@@ -7,27 +7,29 @@ For more information, see:
 http://python-jamo.readthedocs.org/ko/latest/
 """
 
-import os
 from sys import stderr
 from itertools import chain
-import json
-import re
 import unicodedata
 
+from . import _tables
 
-_ROOT = os.path.abspath(os.path.dirname(__file__))
 
 _JAMO_OFFSET = 44032
 _JAMO_LEAD_OFFSET = 0x10ff
 _JAMO_VOWEL_OFFSET = 0x1160
 _JAMO_TAIL_OFFSET = 0x11a7
 
-with open(os.path.join(_ROOT, 'data', "U+11xx.json"), 'r') as namedata:
-    _JAMO_TO_NAME = json.load(namedata)
-_JAMO_REVERSE_LOOKUP = {name: char for char, name in _JAMO_TO_NAME.items()}
-with open(os.path.join(_ROOT, 'data', "U+31xx.json"), 'r') as namedata:
-    _HCJ_TO_NAME = json.load(namedata)
-_HCJ_REVERSE_LOOKUP = {name: char for char, name in _HCJ_TO_NAME.items()}
+# Generated from tools/data/HangulJamoData.txt by tools/parse.py; covers the
+# Hangul Jamo, HCJ, and Jamo Extended-A/B blocks. The name tables are in
+# _names and only imported by _get_name_tables.
+_JAMO_TO_HCJ = _tables.JAMO_TO_HCJ
+_HCJ_TO_JAMO = {"lead": _tables.HCJ_TO_JAMO_LEAD,
+                "vowel": _tables.HCJ_TO_JAMO_VOWEL,
+                "tail": _tables.HCJ_TO_JAMO_TAIL}
+
+# Engine behind the string converters, set by jamo.backends.set_backend.
+# None selects the reference implementation in this module.
+_BACKEND = None
 
 JAMO_LEADS = [chr(_) for _ in range(0x1100, 0x115F)]
 JAMO_LEADS_MODERN = [chr(_) for _ in range(0x1100, 0x1113)]
@@ -81,6 +83,22 @@ JAMO_COMPOUNDS_MODERN_DICTIONARY = {
         "ㅚ": ("ㅗ", "ㅣ"), "ㅝ": ("ㅜ", "ㅓ"), "ㅞ": ("ㅜ", "ㅔ"),
         "ㅟ": ("ㅜ", "ㅣ"), "ㅢ": ("ㅡ", "ㅣ")}
 
+# Zero-based lead, vowel and tail indices of modern HCJ, for composing
+# syllables arithmetically. Tail indices start at 1; 0 means no tail.
+_HCJ_LEAD_INDEX = {_JAMO_TO_HCJ[_]: index
+                   for index, _ in enumerate(JAMO_LEADS_MODERN)}
+_HCJ_VOWEL_INDEX = {_JAMO_TO_HCJ[_]: index
+                    for index, _ in enumerate(JAMO_VOWELS_MODERN)}
+_HCJ_TAIL_INDEX = {_JAMO_TO_HCJ[_]: index + 1
+                   for index, _ in enumerate(JAMO_TAILS_MODERN)}
+_HCJ_COMPOUNDS = {parts: compound for compound, parts in
+                  JAMO_COMPOUNDS_MODERN_DICTIONARY.items()}
+# The pairs of consonants hcj_to_hangul merges into a tail: clusters only,
+# never a double consonant.
+_HCJ_TAIL_CLUSTERS = {parts: compound for parts, compound in
+                      _HCJ_COMPOUNDS.items()
+                      if compound in JAMO_CONSONANT_CLUSTERS_MODERN}
+
 JAMO_DOUBLE_CONSONANTS_ARCHAIC = ["ㅥ", "ᄙ", "ㅹ", "ᄽ", "ᄿ", "ᅇ", "ᇮ", "ᅏ",
                                   "ᅑ", "ㆅ"]
 JAMO_TWO_CONSONANT_CLUSTERS_ARCHAIC = [
@@ -144,24 +162,27 @@ def _jamo_to_hangul_char(lead, vowel, tail=0):
 
 
 def _jamo_char_to_hcj(char):
-    if is_jamo(char):
-        hcj_name = re.sub("(?<=HANGUL )(\w+)",
-                          "LETTER",
-                          _get_unicode_name(char))
-        if hcj_name in _HCJ_REVERSE_LOOKUP.keys():
-            return _HCJ_REVERSE_LOOKUP[hcj_name]
-    return char
+    return _JAMO_TO_HCJ.get(char, char)
+
+
+def _get_name_tables():
+    """Return the {jamo: name} and {hcj: name} tables, imported on first use.
+    Processes working from jamo.shared tables never import them.
+    """
+    from . import _names
+    return _names.JAMO_TO_NAME, _names.HCJ_TO_NAME
 
 
 def _get_unicode_name(char):
     """Fetch the unicode name for jamo characters.
     """
-    if char not in _JAMO_TO_NAME.keys() and char not in _HCJ_TO_NAME.keys():
+    jamo_to_name, hcj_to_name = _get_name_tables()
+    if char not in jamo_to_name.keys() and char not in hcj_to_name.keys():
         raise InvalidJamoError("Not jamo or nameless jamo character", char)
     else:
         if is_hcj(char):
-            return _HCJ_TO_NAME[char]
-        return _JAMO_TO_NAME[char]
+            return hcj_to_name[char]
+        return jamo_to_name[char]
 
 
 def is_jamo(character):
@@ -247,6 +268,65 @@ def is_jamo_compound(character):
     return False
 
 
+# Tails of the usual Korean readings of digits and Latin letter names, used
+# when a word does not end in Hangul. '' means the reading ends in a vowel.
+_READING_TAILS = {"0": "\u11bc", "1": "\u11af", "3": "\u11b7",
+                  "6": "\u11a8", "7": "\u11af", "8": "\u11af",
+                  "l": "\u11af", "m": "\u11b7", "n": "\u11ab",
+                  "r": "\u11af"}
+_READING_TAILS.update({_: "" for _ in "2459abcdefghijkopqstuvwxyz"})
+# Tails of 십, 백 and 천, then of 만, 억, 조 and 경, for numbers ending in
+# zeros.
+_ZEROS_TAILS = ["\u11b8", "\u11a8", "\u11ab"]
+_MYRIADS_TAILS = ["\u11ab", "\u11a8", "", "\u11bc"]
+_TRAILING_PUNCTUATION = " \t\n\r.,!?;:)]}>\"'\u2019\u201d\u00bb\u300b\u300d" +\
+    "\u300f\u3009"
+
+
+def tail_of(word):
+    """Return the tail jamo of the last syllable of word.
+    Returns '' if the last syllable has no tail, and None if it cannot be
+    determined.
+
+    Precomposed syllables are read with the same rem % 28 arithmetic as
+    _hangul_char_to_jamo, without decomposing. Trailing punctuation is
+    skipped, words ending in U+11xx jamo are read as decomposed syllables,
+    and digits and Latin letters are read by their Korean names.
+    """
+    word = word.rstrip(_TRAILING_PUNCTUATION)
+    if not word:
+        return None
+    char = word[-1]
+    code = ord(char)
+    if 0xAC00 <= code <= 0xD7A3:
+        tail = (code - _JAMO_OFFSET) % 28
+        return chr(tail + _JAMO_TAIL_OFFSET) if tail else ""
+    if 0x11A8 <= code <= 0x11FF or 0xD7CB <= code <= 0xD7FB:
+        return char
+    if 0x1160 <= code <= 0x11A7 or 0xD7B0 <= code <= 0xD7C6:
+        return ""
+    if char == "0":
+        # Thousands separators are skipped. From 만 on, a number is read
+        # ending in the largest myriad it reaches: 십만, 백만 and 천만
+        # all end in 만.
+        digits = word[len(word.rstrip("0123456789,_")):]
+        digits = digits.replace(",", "").replace("_", "")
+        zeros = len(digits) - len(digits.rstrip("0"))
+        if zeros < len(digits):
+            if zeros < 4:
+                return _ZEROS_TAILS[zeros - 1]
+            return _MYRIADS_TAILS[min(zeros // 4, len(_MYRIADS_TAILS)) - 1]
+    return _READING_TAILS.get(char.lower())
+
+
+def has_tail(word):
+    """Test if the last syllable of word has a tail (batchim).
+    Returns None if it cannot be determined; see tail_of.
+    """
+    tail = tail_of(word)
+    return None if tail is None else bool(tail)
+
+
 def get_jamo_class(jamo):
     """Determine if a jamo character is a lead, vowel, or tail.
     Integers and U+11xx characters are valid arguments. HCJ consonants are not
@@ -283,7 +363,17 @@ def jamo_to_hcj(data):
     return (_jamo_char_to_hcj(_) for _ in data)
 
 
-def j2hcj(jamo):
+def _get_backend(backend):
+    """Return the engine for a per-call backend override, or the process-wide
+    default when backend is None. None means the reference code.
+    """
+    if backend is None:
+        return _BACKEND
+    from .backends import get_backend
+    return get_backend(backend)
+
+
+def j2hcj(jamo, backend=None):
     """Convert jamo into HCJ.
     Arguments may be iterables or single characters.
 
@@ -291,7 +381,11 @@ def j2hcj(jamo):
     possible. Anything else is unchanged.
 
     j2hcj is the string version of jamo_to_hcj, the generator version.
+    backend overrides the engine chosen with jamo.set_backend for this call.
     """
+    engine = _get_backend(backend)
+    if engine is not None:
+        return engine.j2hcj(jamo)
     return ''.join(jamo_to_hcj(jamo))
 
 
@@ -299,21 +393,17 @@ def hcj_to_jamo(hcj_char, position="vowel"):
     """Convert a HCJ character to a jamo character.
     Arguments may be single characters along with the desired jamo class
     (lead, vowel, tail). Non-mappable input will raise an InvalidJamoError.
+    Letters without a jamo of that class in the Hangul Jamo block map to
+    Jamo Extended-A/B, e.g. ㄸ as a tail is U+D7CD.
     """
-    if position == "lead":
-        jamo_class = "CHOSEONG"
-    elif position == "vowel":
-        jamo_class = "JUNGSEONG"
-    elif position == "tail":
-        jamo_class = "JONGSEONG"
-    else:
+    if position not in _HCJ_TO_JAMO:
         raise InvalidJamoError("No mapping from input to jamo.", hcj_char)
-    jamo_name = re.sub("(?<=HANGUL )(\w+)",
-                       jamo_class,
-                       _get_unicode_name(hcj_char))
+    jamo_char = _HCJ_TO_JAMO[position].get(hcj_char)
+    if jamo_char is not None:
+        return jamo_char
     # TODO: add tests that test non entries.
-    if jamo_name in _JAMO_REVERSE_LOOKUP.keys():
-        return _JAMO_REVERSE_LOOKUP[jamo_name]
+    # Raises InvalidJamoError for characters without a jamo name.
+    _get_unicode_name(hcj_char)
     return hcj_char
 
 
@@ -338,7 +428,7 @@ def hangul_to_jamo(hangul_string):
                                 hangul_string))
 
 
-def h2j(hangul_string):
+def h2j(hangul_string, backend=None):
     """Convert a string of Hangul to jamo.
     Arguments may be iterables of characters.
 
@@ -346,10 +436,115 @@ def h2j(hangul_string):
     string. Non-hangul characters are not touched.
 
     h2j is the string version of hangul_to_jamo, the generator version.
+    backend overrides the engine chosen with jamo.set_backend for this call.
     """
+    engine = _get_backend(backend)
+    if engine is not None:
+        return engine.h2j(hangul_string)
     return ''.join(hangul_to_jamo(hangul_string))
 
 
+def _convert_chunks(convert, chunks, chunk_size, backend):
+    """Regroup chunks into pieces of exactly chunk_size characters (only the
+    last piece may be shorter) and feed them through a string converter, so
+    no single conversion exceeds chunk_size characters.
+    """
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive")
+    buffered, length = [], 0
+    for chunk in chunks:
+        buffered.append(chunk)
+        length += len(chunk)
+        if length >= chunk_size:
+            text = ''.join(buffered)
+            full = len(text) - len(text) % chunk_size
+            for start in range(0, full, chunk_size):
+                yield convert(text[start:start + chunk_size], backend)
+            # The remainder waits for the next chunks.
+            buffered, length = [text[full:]], len(text) - full
+    if length:
+        yield convert(''.join(buffered), backend)
+
+
+def hangul_to_jamo_chunks(chunks, chunk_size=8192, backend=None):
+    """Convert an iterable of strings of Hangul to jamo, chunk by chunk.
+    Arguments may be any iterable of strings, such as lines or file chunks.
+
+    hangul_to_jamo_chunks yields converted strings of about chunk_size
+    characters instead of single characters, so the per-item cost of
+    hangul_to_jamo is paid once per chunk. Input is regrouped, so output
+    chunks do not line up with input chunks.
+    """
+    return _convert_chunks(h2j, chunks, chunk_size, backend)
+
+
+def jamo_to_hcj_chunks(chunks, chunk_size=8192, backend=None):
+    """Convert an iterable of strings of jamo to HCJ, chunk by chunk.
+    Arguments may be any iterable of strings, such as lines or file chunks.
+
+    jamo_to_hcj_chunks is the chunked version of jamo_to_hcj; see
+    hangul_to_jamo_chunks.
+    """
+    return _convert_chunks(j2hcj, chunks, chunk_size, backend)
+
+
+# Syllable and jamo to HCJ tables for h2hcj, keyed by split_compounds.
+_HCJ_TABLES = {}
+
+
+def _get_hcj_table(split_compounds=False):
+    """Return the str.translate table used by h2hcj, built on first use.
+    Every syllable maps straight to its HCJ letters, and jamo map to HCJ as
+    in j2hcj. With split_compounds, compound letters such as ㄳ and ㅘ are
+    further split using JAMO_COMPOUNDS_MODERN_DICTIONARY.
+    """
+    if split_compounds not in _HCJ_TABLES:
+        table = {ord(char): hcj for char, hcj in _JAMO_TO_HCJ.items()}
+        for code in range(_JAMO_OFFSET, _JAMO_OFFSET + 11172):
+            table[code] = ''.join(_jamo_char_to_hcj(_) for _ in
+                                  _hangul_char_to_jamo(chr(code)))
+        if split_compounds:
+            split = {ord(compound): ''.join(parts) for compound, parts in
+                     JAMO_COMPOUNDS_MODERN_DICTIONARY.items()}
+            table = {code: char.translate(split)
+                     for code, char in table.items()}
+            table.update(split)
+        _HCJ_TABLES[split_compounds] = table
+    return _HCJ_TABLES[split_compounds]
+
+
+def hangul_to_hcj(hangul_string, split_compounds=False):
+    """Convert a string of Hangul to HCJ.
+    Arguments may be iterables of characters.
+
+    hangul_to_hcj should split every Hangul character into HCJ, and convert
+    jamo into HCJ, in a single pass. It is equivalent to
+    jamo_to_hcj(hangul_to_jamo(hangul_string)). With split_compounds,
+    compound letters such as ㄳ and ㅘ are split into their parts.
+
+    hangul_to_hcj is the generator version of h2hcj, the string version.
+    """
+    table = _get_hcj_table(split_compounds)
+    return (_ for _ in
+            chain.from_iterable(table.get(ord(_), _) for _ in
+                                hangul_string))
+
+
+def h2hcj(hangul_string, split_compounds=False):
+    """Convert a string of Hangul to HCJ.
+    Arguments may be iterables of characters.
+
+    h2hcj is the same as j2hcj(h2j(hangul_string)), done in a single
+    str.translate pass over a precomputed table. With split_compounds,
+    compound letters such as ㄳ and ㅘ are split into their parts.
+
+    h2hcj is the string version of hangul_to_hcj, the generator version.
+    """
+    if not isinstance(hangul_string, str):
+        hangul_string = ''.join(hangul_string)
+    return hangul_string.translate(_get_hcj_table(split_compounds))
+
+
 def jamo_to_hangul(lead, vowel, tail=''):
     """Return the Hangul character for the given jamo input.
     Integers corresponding to U+11xx jamo codepoints, U+11xx jamo characters,
@@ -389,6 +584,101 @@ def j2h(lead, vowel, tail=0):
     return jamo_to_hangul(lead, vowel, tail)
 
 
+def _hcj_syllable(lead, vowel, tail=None):
+    """Compose a syllable from modern HCJ lead, vowel, and optional tail.
+    Lone leads or vowels are returned as they are.
+    """
+    if lead is None:
+        return vowel
+    if vowel is None:
+        return lead
+    return chr(_JAMO_OFFSET + _HCJ_TAIL_INDEX.get(tail, 0) +
+               (_HCJ_LEAD_INDEX[lead] * 21 + _HCJ_VOWEL_INDEX[vowel]) * 28)
+
+
+def _hcj_tail(tail):
+    """Return the tail for a list of up to two typed consonants.
+    """
+    if len(tail) == 2:
+        return _HCJ_TAIL_CLUSTERS[tuple(tail)]
+    return tail[0] if tail else None
+
+
+def hcj_to_hangul(data):
+    """Compose a stream of HCJ into Hangul, inferring the position of every
+    consonant.
+    Arguments may be strings or iterables of strings, such as file chunks.
+
+    hcj_to_hangul composes syllables in a single pass: a consonant followed
+    by a vowel is a lead, otherwise it is the tail of the preceding syllable.
+    Compound vowels and consonant clusters are merged using
+    JAMO_COMPOUNDS_MODERN_DICTIONARY (ㅗ, ㅏ -> ㅘ; ㄹ, ㄱ -> ㄺ). Double
+    consonants are never merged from two letters, as lead or as tail: only
+    ㄲ itself gives ㄲ, so ㄱㅏㄱㄱ is 각ㄱ and ㄱㄱㅏ is ㄱ가.
+    Characters that cannot be composed are passed through unchanged.
+
+    hcj_to_hangul is the generator version of hcj2h, the string version.
+    """
+    lead = vowel = None
+    # Consonants typed into the tail; two means they were merged.
+    tail = []
+    for chunk in data:
+        for char in chunk:
+            if char in _HCJ_VOWEL_INDEX:
+                if tail:
+                    # The last consonant of the tail leads the new syllable.
+                    if len(tail) == 1 and tail[0] in _HCJ_LEAD_INDEX:
+                        yield _hcj_syllable(lead, vowel)
+                        lead = tail[0]
+                    else:
+                        first, second = tail if len(tail) == 2 else\
+                            JAMO_COMPOUNDS_MODERN_DICTIONARY[tail[0]]
+                        yield _hcj_syllable(lead, vowel, first)
+                        lead = second
+                    vowel, tail = char, []
+                elif lead is not None and lead not in _HCJ_LEAD_INDEX:
+                    # A tail-only cluster such as ㄳ cannot lead.
+                    first, lead = JAMO_COMPOUNDS_MODERN_DICTIONARY[lead]
+                    yield first
+                    vowel = char
+                elif vowel is None:
+                    vowel = char
+                elif (vowel, char) in _HCJ_COMPOUNDS:
+                    vowel = _HCJ_COMPOUNDS[(vowel, char)]
+                else:
+                    yield _hcj_syllable(lead, vowel)
+                    lead, vowel = None, char
+            elif char in _HCJ_LEAD_INDEX or char in _HCJ_TAIL_INDEX:
+                if lead is None or vowel is None:
+                    if lead is not None or vowel is not None:
+                        yield _hcj_syllable(lead, vowel)
+                    lead, vowel = char, None
+                elif not tail and char in _HCJ_TAIL_INDEX:
+                    tail = [char]
+                elif len(tail) == 1 and (tail[0], char) in _HCJ_TAIL_CLUSTERS:
+                    tail.append(char)
+                else:
+                    yield _hcj_syllable(lead, vowel, _hcj_tail(tail))
+                    lead, vowel, tail = char, None, []
+            else:
+                if lead is not None or vowel is not None:
+                    yield _hcj_syllable(lead, vowel, _hcj_tail(tail))
+                lead = vowel = None
+                tail = []
+                yield char
+    if lead is not None or vowel is not None:
+        yield _hcj_syllable(lead, vowel, _hcj_tail(tail))
+
+
+def hcj2h(data):
+    """Compose a string of HCJ into Hangul, inferring consonant positions.
+    Arguments may be strings or iterables of strings.
+
+    hcj2h is the string version of hcj_to_hangul, the generator version.
+    """
+    return ''.join(hcj_to_hangul(data))
+
+
 def decompose_jamo(compound):
     """Return a tuple of jamo character constituents of a compound.
     Note: Non-compound characters are echoed back.
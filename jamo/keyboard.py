@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Dubeolsik (standard Korean) keyboard transliteration on a QWERTY layout.
+
+    >>> from jamo.keyboard import h2keys, keys2h, detect_wrong_layout
+    >>> h2keys("안녕")
+    'dkssud'
+    >>> keys2h("dkssud")
+    '안녕'
+    >>> detect_wrong_layout(["dkssud", "hello"])
+    ['안녕', None]
+
+Hangul is turned into keystrokes through a table built from h2j and
+decompose_jamo. Keystrokes are turned back into Hangul in a single pass of
+the hcj_to_hangul composer. It follows Dubeolsik for where syllables break,
+compound vowels and consonant clusters, and like Dubeolsik only gives a
+double consonant for its shifted key, so "rkrr" is 각ㄱ and "rkR" is 갂.
+Editing keys such as backspace are not modelled.
+"""
+
+from .jamo import (JAMO_COMPOUNDS_MODERN,
+                   h2j, j2hcj, decompose_jamo, hcj_to_hangul,
+                   is_hangul_char, _JAMO_OFFSET, _JAMO_TO_HCJ)
+
+
+_KEY_TO_HCJ = dict(zip("qwertyuiopasdfghjklzxcvbnmQWERTOP",
+                       "ㅂㅈㄷㄱㅅㅛㅕㅑㅐㅔㅁㄴㅇㄹㅎㅗㅓㅏㅣㅋㅌㅊㅍㅠㅜㅡ"
+                       "ㅃㅉㄸㄲㅆㅒㅖ"))
+# Shift only matters for the seven shifted letters; caps lock is forgiven.
+_KEY_TO_HCJ.update({key.upper(): hcj for key, hcj in _KEY_TO_HCJ.items()
+                    if key.upper() not in _KEY_TO_HCJ})
+_HCJ_TO_KEY = {hcj: key for key, hcj in _KEY_TO_HCJ.items()
+               if key in "qwertyuiopasdfghjklzxcvbnmQWERTOP"}
+
+# Frequent modern syllables, used to tell mistyped Korean from English.
+_COMMON_SYLLABLES = frozenset(
+    "가각간갈감갑강개거건걸것게겠격결경계고공과관광교구국군권그근글금기긴"
+    "길김까나난날남내너넘네녀년노녕는능니다단달담당대더데도독동되된될두드"
+    "들등디따때또라락란람랑래러런럼렇레려력련렬령로록론료루류르른를름리린"
+    "립마만많말망매머먼메면명모목무문물미민및바박반받발방배백버번법변별병"
+    "보복본부북분불비사산살상새생서선설성세소속손수순술스습시식신실심써아"
+    "안않알암압앞애야약양어언얼업없었에여역연열영예오온올완외요용우운울움"
+    "원월위유육으은을음응의이인일임입있자작잔장재저적전절점정제조족존종주"
+    "준중즐지직진집차찰참창책처천철청체초총최추출충취치친칙카커코크타탄태"
+    "터토통투트특파판패퍼편평포표프피필하학한할함합항해했행향허현형호화확"
+    "환활회효후히")
+
+
+def _keys_for(hcj):
+    """Return the keystrokes for one HCJ letter, splitting clusters and
+    compound vowels that have no key of their own.
+    """
+    if hcj in _HCJ_TO_KEY:
+        return _HCJ_TO_KEY[hcj]
+    if hcj not in JAMO_COMPOUNDS_MODERN:
+        # Archaic letters cannot be typed.
+        return hcj
+    return ''.join(_keys_for(_) for _ in decompose_jamo(hcj))
+
+
+_KEYS_TABLE = {}
+
+
+def _get_keys_table():
+    """Return the str.translate table from syllables, jamo and HCJ to
+    keystrokes, built on first use.
+    """
+    if not _KEYS_TABLE:
+        for code in range(_JAMO_OFFSET, _JAMO_OFFSET + 11172):
+            _KEYS_TABLE[code] = ''.join(_keys_for(_)
+                                        for _ in j2hcj(h2j(chr(code))))
+        for jamo, hcj in _JAMO_TO_HCJ.items():
+            keys = _keys_for(hcj)
+            if keys != hcj:
+                _KEYS_TABLE[ord(jamo)] = keys
+        for hcj in list(_HCJ_TO_KEY) + JAMO_COMPOUNDS_MODERN:
+            _KEYS_TABLE[ord(hcj)] = _keys_for(hcj)
+    return _KEYS_TABLE
+
+
+def h2keys(hangul_string):
+    """Return the Dubeolsik QWERTY keystrokes that type hangul_string.
+    Syllables, U+11xx jamo and HCJ are converted; anything else is unchanged.
+    """
+    return hangul_string.translate(_get_keys_table())
+
+
+def hangul_to_keys(data):
+    """Convert an iterable of strings to keystrokes, one string at a time.
+    hangul_to_keys is the generator version of h2keys.
+    """
+    table = _get_keys_table()
+    return (_.translate(table) for _ in data)
+
+
+def keys_to_hangul(data):
+    """Compose Hangul from Dubeolsik QWERTY keystrokes in a single pass.
+    Arguments may be strings or iterables of strings. Keys other than
+    letters are passed through.
+
+    keys_to_hangul is the generator version of keys2h, the string version.
+    """
+    return hcj_to_hangul(_KEY_TO_HCJ.get(char, char)
+                         for chunk in data for char in chunk)
+
+
+def keys2h(keys):
+    """Compose Hangul from Dubeolsik QWERTY keystrokes.
+    keys2h is the string version of keys_to_hangul.
+    """
+    return ''.join(keys_to_hangul(keys))
+
+
+def wrong_layout_score(string):
+    """Score from 0 to 1 how likely string is Korean typed with an English
+    keyboard layout.
+
+    The score is the share of letters that compose into complete syllables,
+    weighted by how many of those syllables are frequent ones. Strings that
+    already contain Hangul score 0.
+    """
+    letters = sum(char in _KEY_TO_HCJ for char in string)
+    if not letters or any(is_hangul_char(char) for char in string):
+        return 0.0
+    syllables = [_ for _ in keys2h(string) if is_hangul_char(_)]
+    if not syllables:
+        return 0.0
+    composed = len(h2keys(''.join(syllables))) / letters
+    common = sum(_ in _COMMON_SYLLABLES for _ in syllables) / len(syllables)
+    return composed * (0.5 + 0.5 * common)
+
+
+def detect_wrong_layout(strings, threshold=0.75):
+    """Return, for every string, its Hangul reading if it scores at least
+    threshold with wrong_layout_score, otherwise None.
+    """
+    return [keys2h(_) if wrong_layout_score(_) >= threshold else None
+            for _ in strings]
@@ -0,0 +1,214 @@
+# -*- coding: utf-8 -*-
+"""Near-duplicate detection with MinHash over jamo shingles.
+
+Text is decomposed with h2j before shingling, so documents that differ by a
+single tail or vowel still share most of their shingles. Signatures are
+compared through an LSH banding index, which returns candidate duplicates
+without comparing every pair:
+
+    >>> from jamo.minhash import MinHasher, LSHIndex
+    >>> hasher = MinHasher()
+    >>> index = LSHIndex(threshold=0.5)
+    >>> index.insert("a", hasher.signature("오늘은 날씨가 정말 좋습니다"))
+    >>> index.query(hasher.signature("오늘은 날씨가 정말 좋읍니다"))
+    {'a'}
+
+Signatures are computed with NumPy when it is installed and in pure Python
+otherwise; both give the same values, so signatures made on different
+machines or processes can be mixed.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+import random
+import re
+import zlib
+
+from .jamo import h2j
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+_PRIME = (1 << 61) - 1
+_MASK64 = (1 << 64) - 1
+_MASK32 = (1 << 32) - 1
+_SPACE = re.compile(r"\s+")
+# Shingles hashed per NumPy block, which bounds the num_perm x block matrix.
+_BLOCK = 1024
+
+
+def shingles(text, k=5):
+    """Return the set of k-jamo shingles of text, after decomposition with
+    h2j and collapsing whitespace. Texts shorter than k are one shingle.
+    """
+    text = _SPACE.sub(" ", h2j(text)).strip()
+    if len(text) <= k:
+        return {text} if text else set()
+    return {text[_:_ + k] for _ in range(len(text) - k + 1)}
+
+
+def _hash(shingle):
+    return zlib.crc32(shingle.encode("utf-8"))
+
+
+class MinHasher(object):
+    """MinHash signatures of num_perm 32-bit values over k-jamo shingles.
+    Hashers with the same num_perm, k and seed give the same signatures.
+    """
+    def __init__(self, num_perm=128, k=5, seed=1):
+        self.num_perm = num_perm
+        self.k = k
+        self.seed = seed
+        rng = random.Random(seed)
+        self._perms = [(rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+                       for _ in range(num_perm)]
+        if numpy is not None:
+            self._a = numpy.array([_[0] for _ in self._perms],
+                                  dtype=numpy.uint64)[:, None]
+            self._b = numpy.array([_[1] for _ in self._perms],
+                                  dtype=numpy.uint64)[:, None]
+
+    def signature(self, text):
+        """Return the signature of text as a tuple of num_perm integers.
+        Empty texts have a signature of all 0xffffffff.
+        """
+        hashes = [_hash(_) for _ in shingles(text, self.k)]
+        if not hashes:
+            return (_MASK32,) * self.num_perm
+        if numpy is not None:
+            hashes = numpy.array(hashes, dtype=numpy.uint64)
+            result = numpy.full(self.num_perm, _MASK32, dtype=numpy.uint64)
+            for start in range(0, len(hashes), _BLOCK):
+                values = hashes[None, start:start + _BLOCK]
+                with numpy.errstate(over="ignore"):
+                    values = (self._a * values + self._b) %\
+                        numpy.uint64(_PRIME)
+                values &= numpy.uint64(_MASK32)
+                numpy.minimum(result, values.min(axis=1), out=result)
+            return tuple(result.tolist())
+        return tuple(min(((a * _ + b) & _MASK64) % _PRIME & _MASK32
+                         for _ in hashes)
+                     for a, b in self._perms)
+
+    def signatures(self, texts, processes=None, chunksize=64):
+        """Return the signatures of an iterable of texts, as a list.
+        With processes, the texts are hashed in that many worker processes.
+        """
+        if not processes or processes == 1:
+            return [self.signature(_) for _ in texts]
+        with ProcessPoolExecutor(processes) as executor:
+            return list(executor.map(self.signature, texts,
+                                     chunksize=chunksize))
+
+
+def similarity(first, second):
+    """Estimate the Jaccard similarity of two signatures.
+    """
+    if len(first) != len(second):
+        raise ValueError("Signatures have different lengths.")
+    return sum(a == b for a, b in zip(first, second)) / len(first)
+
+
+def _bands_for(num_perm, threshold):
+    """Return the number of bands whose LSH S-curve crosses 1/2 closest to
+    threshold. Only band counts that divide num_perm are considered.
+    """
+    options = [_ for _ in range(1, num_perm + 1) if not num_perm % _]
+    return min(options, key=lambda bands: abs(
+        (1 / bands) ** (bands / num_perm) - threshold))
+
+
+class LSHIndex(object):
+    """An LSH banding index over MinHash signatures.
+
+    Each signature is cut into bands of equal width; two signatures are
+    candidates when any band matches. The number of bands is derived from
+    threshold unless given. Keys are inserted one at a time, so the index can
+    grow while documents stream in, and indexes built separately, e.g. in
+    different processes, are combined with update.
+    """
+    def __init__(self, threshold=0.8, num_perm=128, bands=None):
+        if bands is None:
+            bands = _bands_for(num_perm, threshold)
+        if num_perm % bands:
+            raise ValueError("bands must divide num_perm.")
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self._buckets = [{} for _ in range(bands)]
+        self._keys = {}
+
+    def _band_keys(self, signature):
+        if len(signature) != self.num_perm:
+            raise ValueError("Expected a signature of {} values.".format(
+                self.num_perm))
+        rows = self.rows
+        return [tuple(signature[_ * rows:(_ + 1) * rows])
+                for _ in range(self.bands)]
+
+    def insert(self, key, signature):
+        """Add a signature under key. Keys must be unique and hashable.
+        """
+        if key in self._keys:
+            raise ValueError("Key {!r} is already in the index.".format(key))
+        self._keys[key] = signature
+        for buckets, band in zip(self._buckets, self._band_keys(signature)):
+            buckets.setdefault(band, []).append(key)
+
+    def insert_many(self, items):
+        """Add every (key, signature) pair of an iterable.
+        """
+        for key, signature in items:
+            self.insert(key, signature)
+
+    def query(self, signature):
+        """Return the set of keys that share a band with signature.
+        """
+        candidates = set()
+        for buckets, band in zip(self._buckets, self._band_keys(signature)):
+            candidates.update(buckets.get(band, ()))
+        return candidates
+
+    def duplicates(self, signature, threshold=None):
+        """Return [(key, similarity)] for the candidates whose estimated
+        similarity to signature is at least threshold, most similar first.
+        """
+        if threshold is None:
+            threshold = self.threshold
+        scored = [(key, similarity(signature, self._keys[key]))
+                  for key in self.query(signature)]
+        return sorted((_ for _ in scored if _[1] >= threshold),
+                      key=lambda _: -_[1])
+
+    def update(self, other):
+        """Add every key of another index with the same layout.
+        """
+        if (other.num_perm, other.bands) != (self.num_perm, self.bands):
+            raise ValueError("Indexes have different layouts.")
+        self.insert_many(other._keys.items())
+
+    def __contains__(self, key):
+        return key in self._keys
+
+    def __len__(self):
+        return len(self._keys)
+
+
+def find_duplicates(texts, threshold=0.8, num_perm=128, k=5, seed=1,
+                    processes=None):
+    """Return (i, j, similarity) for every pair of positions i < j in texts
+    whose estimated similarity is at least threshold. Each text is compared
+    with the earlier ones as it is inserted.
+    """
+    hasher = MinHasher(num_perm, k, seed)
+    index = LSHIndex(threshold, num_perm)
+    pairs = []
+    for position, signature in enumerate(hasher.signatures(texts,
+                                                           processes)):
+        for key, score in index.duplicates(signature):
+            pairs.append((key, position, score))
+        index.insert(position, signature)
+    return sorted(pairs)
@@ -0,0 +1,160 @@
+# -*- coding: utf-8 -*-
+"""Hangul-specialized NFC normalization.
+
+Text and file names produced on macOS store Hangul in NFD, as conjoining
+U+11xx jamo. normalize() composes exactly the sequences that Unicode NFC
+composes for Hangul: a modern lead and vowel, optionally followed by a modern
+tail, or a tailless syllable followed by a modern tail. Everything else is
+left alone, so non-Hangul combining sequences still need unicodedata.
+
+    >>> from jamo import h2j
+    >>> from jamo.normalize import is_normalized, normalize
+    >>> is_normalized(h2j("한글"))
+    False
+    >>> normalize(h2j("한글")) == "한글"
+    True
+
+repair_tree() applies the same to the names, and optionally the contents, of
+everything below a directory; see tools/normalize.py for the command line.
+"""
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import os
+import re
+import shutil
+import tempfile
+
+from .jamo import (_JAMO_OFFSET, _JAMO_LEAD_OFFSET, _JAMO_VOWEL_OFFSET,
+                   _JAMO_TAIL_OFFSET)
+
+
+_LEADS = "\u1100-\u1112"
+_VOWELS = "\u1161-\u1175"
+_TAILS = "\u11a8-\u11c2"
+_TAILLESS = ''.join(chr(_) for _ in range(_JAMO_OFFSET, 0xd7a4, 28))
+_COMPOSABLE = re.compile("[{0}][{1}][{2}]?|[{3}][{2}]".format(
+    _LEADS, _VOWELS, _TAILS, _TAILLESS))
+_CONJOINING = re.compile("[\u1100-\u11ff]")
+
+Change = namedtuple("Change", ["kind", "path", "target"])
+
+
+def is_normalized(string):
+    """Test if string contains no Hangul that NFC would compose.
+    The string is first scanned for any conjoining jamo, a single character
+    class that is cheaper to search for than the composable sequences, which
+    are only matched when there is one.
+    """
+    if not _CONJOINING.search(string):
+        return True
+    return not _COMPOSABLE.search(string)
+
+
+def _compose(match):
+    sequence = match.group()
+    if len(sequence) == 2 and sequence[1] > "\u11a7":
+        return chr(ord(sequence[0]) + ord(sequence[1]) - _JAMO_TAIL_OFFSET)
+    lead = ord(sequence[0]) - _JAMO_LEAD_OFFSET
+    vowel = ord(sequence[1]) - _JAMO_VOWEL_OFFSET
+    tail = ord(sequence[2]) - _JAMO_TAIL_OFFSET if len(sequence) == 3 else 0
+    return chr(tail + (vowel - 1) * 28 + (lead - 1) * 588 + _JAMO_OFFSET)
+
+
+def normalize(string):
+    """Compose conjoining Hangul jamo in string into syllables, as NFC does.
+    Already normalized strings are returned as they are.
+    """
+    if not _CONJOINING.search(string):
+        return string
+    return _COMPOSABLE.sub(_compose, string)
+
+
+def _scan(root, workers):
+    """Return every (directory, name, is_directory) entry below root.
+    Directories are listed concurrently.
+    """
+    entries = []
+    with ThreadPoolExecutor(workers) as executor:
+        pending = [executor.submit(_list_directory, root)]
+        while pending:
+            future = pending.pop()
+            for directory, name, is_directory in future.result():
+                entries.append((directory, name, is_directory))
+                if is_directory:
+                    pending.append(executor.submit(
+                        _list_directory, os.path.join(directory, name)))
+    return entries
+
+
+def _list_directory(directory):
+    with os.scandir(directory) as it:
+        return [(directory, entry.name, entry.is_dir(follow_symlinks=False))
+                for entry in it]
+
+
+def _rewrite_file(path, dry_run):
+    """Normalize a UTF-8 text file in place. Returns whether it needed it.
+    Files that are not valid UTF-8 are skipped.
+    """
+    try:
+        with open(path, "r", encoding="utf-8", newline="") as fin:
+            text = fin.read()
+    except (UnicodeDecodeError, OSError):
+        return False
+    if is_normalized(text):
+        return False
+    if not dry_run:
+        directory = os.path.dirname(path)
+        fd, temporary = tempfile.mkstemp(dir=directory)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8", newline="") as fout:
+                fout.write(normalize(text))
+            shutil.copymode(path, temporary)
+            os.replace(temporary, path)
+        except BaseException:
+            os.remove(temporary)
+            raise
+    return True
+
+
+def repair_tree(root, rename=True, rewrite=False, dry_run=True,
+                workers=None):
+    """Normalize the Hangul in names, and with rewrite also in UTF-8 file
+    contents, everywhere below root.
+
+    Returns a list of Change(kind, path, target) with kind "rewrite",
+    "rename" or "conflict" (the normalized name already exists). Nothing is
+    modified when dry_run is set. Directories are scanned with a thread pool
+    and files are rewritten in a process pool of the given size; renames are
+    applied deepest first so that pending paths stay valid.
+    """
+    entries = _scan(root, workers)
+    changes = []
+    if rewrite:
+        files = [os.path.join(directory, name)
+                 for directory, name, is_directory in entries
+                 if not is_directory]
+        files = [_ for _ in files if not os.path.islink(_)]
+        with ProcessPoolExecutor(workers) as executor:
+            results = executor.map(_rewrite_file, files,
+                                   [dry_run] * len(files),
+                                   chunksize=max(1, len(files) // 256))
+            changes.extend(Change("rewrite", path, path)
+                           for path, changed in zip(files, results)
+                           if changed)
+    if rename:
+        entries.sort(key=lambda _: _[0].count(os.sep), reverse=True)
+        for directory, name, is_directory in entries:
+            target = normalize(name)
+            if target == name:
+                continue
+            path = os.path.join(directory, name)
+            target = os.path.join(directory, target)
+            if os.path.lexists(target):
+                changes.append(Change("conflict", path, target))
+                continue
+            changes.append(Change("rename", path, target))
+            if not dry_run:
+                os.rename(path, target)
+    return changes
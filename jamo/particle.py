@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Choose the allomorph of a Korean particle for the word it follows.
+
+Particles such as 은/는, 이/가, 을/를 and (으)로 change form depending on
+whether the preceding syllable has a tail. The choice only needs the final
+syllable's tail, read arithmetically by jamo.tail_of, so no decomposition is
+done:
+
+    >>> from jamo.particle import attach_particle
+    >>> attach_particle(["책", "사과", "서울"], "을/를")
+    ['책을', '사과를', '서울을']
+    >>> attach_particle(["책", "사과", "서울"], "(으)로")
+    ['책으로', '사과로', '서울로']
+
+Particles may be written as either form ("을"), as a pair ("을/를") or with
+the optional part in parentheses ("(으)로"). Words whose final sound cannot
+be determined get the combined notation, e.g. "字을(를)".
+"""
+
+from functools import lru_cache
+import re
+
+from .jamo import _JAMO_OFFSET, tail_of
+
+
+# (after a tail, after no tail) for particles whose forms are not related by
+# an optional prefix.
+_PAIRS = [("은", "는"), ("이", "가"), ("을", "를"), ("과", "와"),
+          ("아", "야"), ("이에요", "예요"), ("이었다", "였다")]
+# Optional prefix, rest: "(이)랑" is 이랑 after a tail and 랑 otherwise.
+_PREFIXED = [("으", "로"), ("으", "로서"), ("으", "로써"), ("으", "로부터"),
+             ("이", "랑"), ("이", "나"), ("이", "며"), ("이", "다"),
+             ("이", "여"), ("이", "나마"), ("이", "든지"), ("이", "라도")]
+_RIEUL_TAIL = "\u11af"
+
+_FORMS = {form: pair for pair in _PAIRS for form in pair}
+_FORMS.update({form: (prefix + rest, rest) for prefix, rest in _PREFIXED
+               for form in (prefix + rest, rest)})
+_OPTIONAL = re.compile(r"\((.+)\)(.+)$")
+
+
+@lru_cache(maxsize=256)
+def _parse_particle(particle):
+    """Return (form after a tail, form after no tail, notation) for any
+    accepted spelling of a particle.
+    """
+    if "/" in particle:
+        first, second = particle.split("/", 1)
+        if _FORMS.get(first) == (second, first):
+            first, second = second, first
+        consonant, vowel = first, second
+    elif _OPTIONAL.match(particle):
+        prefix, rest = _OPTIONAL.match(particle).groups()
+        consonant, vowel = prefix + rest, rest
+    elif particle in _FORMS:
+        consonant, vowel = _FORMS[particle]
+    else:
+        raise ValueError("Unknown particle: " + particle)
+    if consonant.endswith(vowel) and consonant != vowel:
+        notation = "({}){}".format(consonant[:-len(vowel)], vowel)
+    else:
+        notation = "{}({})".format(consonant, vowel)
+    return consonant, vowel, notation
+
+
+def select_particle(word, particle):
+    """Return the form of particle that follows word.
+
+    Forms starting with 으 are dropped after a ㄹ tail as after a vowel
+    (서울로, not 서울으로). If the final sound of word is unknown, the
+    combined notation such as 을(를) is returned.
+    """
+    consonant, vowel, notation = _parse_particle(particle)
+    tail = tail_of(word)
+    if tail is None:
+        return notation
+    if not tail or (tail == _RIEUL_TAIL and consonant.startswith("으")):
+        return vowel
+    return consonant
+
+
+def attach_particle(words, particle):
+    """Return a list with the right form of particle appended to every word.
+    """
+    consonant, vowel, notation = _parse_particle(particle)
+    rieul_drops = consonant.startswith("으")
+    results = []
+    for word in words:
+        code = ord(word[-1]) - _JAMO_OFFSET if word else -1
+        if 0 <= code < 11172:
+            # Fast path for the common case of a word ending in a syllable.
+            tail = code % 28
+            if not tail or (tail == 8 and rieul_drops):
+                results.append(word + vowel)
+            else:
+                results.append(word + consonant)
+        else:
+            results.append(word + select_particle(word, particle))
+    return results
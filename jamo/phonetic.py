@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+"""Phonetic keys for Korean, for blocking records that sound alike.
+
+Every syllable is mapped to a representative syllable: plain, tense and
+aspirated leads are merged, vowels that are commonly confused are merged and
+tails are reduced to their sound class. Strings with equal keys are then
+candidates for the same record, and only they need an exact comparison.
+
+    >>> from jamo.phonetic import phonetic_key, block
+    >>> phonetic_key("김명수") == phonetic_key("낌면쑤")
+    True
+    >>> block(["김명수", "낌면쑤", "이영희"])
+    {'깅명수': [0, 1], '이영이': [2]}
+
+The key of every modern syllable is computed once from its lead, vowel and
+tail indices, so keys are made with a single str.translate.
+"""
+
+import re
+
+from .jamo import (_JAMO_OFFSET, _HCJ_LEAD_INDEX, _HCJ_VOWEL_INDEX,
+                   _HCJ_TAIL_INDEX)
+from .normalize import normalize
+
+
+# Representative of every lead: plain, tense and aspirated stops and
+# affricates are merged, and ㅎ with the silent ㅇ.
+_LEADS = dict(zip("ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ",
+                  "ㄱㄱㄴㄷㄷㄹㅁㅂㅂㅅㅅㅇㅈㅈㅈㄱㄷㅂㅇ"))
+# Representative of every vowel: ㅐ/ㅔ, ㅒ/ㅖ and ㅙ/ㅚ/ㅞ are merged, and
+# ㅢ with ㅣ.
+_VOWELS = dict(zip("ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ",
+                   "ㅏㅔㅑㅖㅓㅔㅕㅖㅗㅘㅞㅞㅛㅜㅝㅞㅟㅠㅡㅣㅣ"))
+# Representative of every tail: nasals are merged into ㅇ, stops into ㄱ,
+# liquids into ㄹ. The weak tail ㅎ is dropped.
+_TAILS = dict(zip("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ",
+                  ["ㄱ", "ㄱ", "ㄱ", "ㅇ", "ㅇ", "ㅇ", "ㄱ", "ㄹ", "ㄱ", "ㅇ",
+                   "ㄹ", "ㄹ", "ㄹ", "ㄱ", "ㄹ", "ㅇ", "ㄱ", "ㄱ", "ㄱ", "ㄱ",
+                   "ㅇ", "ㄱ", "ㄱ", "ㄱ", "ㄱ", "ㄱ", ""]))
+_OTHER = re.compile("[^가-힣]+")
+
+
+def _build_table():
+    """Return the str.translate table from every syllable to its key.
+    """
+    leads = [_HCJ_LEAD_INDEX[_LEADS[_]]
+             for _ in sorted(_HCJ_LEAD_INDEX, key=_HCJ_LEAD_INDEX.get)]
+    vowels = [_HCJ_VOWEL_INDEX[_VOWELS[_]]
+              for _ in sorted(_HCJ_VOWEL_INDEX, key=_HCJ_VOWEL_INDEX.get)]
+    tails = [0] + [_HCJ_TAIL_INDEX.get(_TAILS[_], 0)
+                   for _ in sorted(_HCJ_TAIL_INDEX, key=_HCJ_TAIL_INDEX.get)]
+    table = {}
+    for rem in range(11172):
+        key = _JAMO_OFFSET + leads[rem // 588] * 588 +\
+            vowels[(rem % 588) // 28] * 28 + tails[rem % 28]
+        if key != _JAMO_OFFSET + rem:
+            table[_JAMO_OFFSET + rem] = chr(key)
+    return table
+
+
+_TABLE = _build_table()
+
+
+def phonetic_key(string, max_length=None):
+    """Return the phonetic key of string, as a string of syllables.
+    Conjoining jamo are composed first; anything that is not a Hangul
+    syllable is ignored. max_length truncates the key, in syllables.
+    """
+    key = _OTHER.sub("", normalize(string)).translate(_TABLE)
+    if max_length is not None:
+        key = key[:max_length]
+    return key
+
+
+def phonetic_keys(strings, max_length=None):
+    """Return the phonetic key of every string in an iterable, as a list.
+    """
+    return [phonetic_key(_, max_length) for _ in strings]
+
+
+def block(strings, max_length=None):
+    """Group the positions of strings by phonetic key.
+    Returns {key: [index, ...]}, in order of first appearance.
+    """
+    blocks = {}
+    for index, key in enumerate(phonetic_keys(strings, max_length)):
+        blocks.setdefault(key, []).append(index)
+    return blocks
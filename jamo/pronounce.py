@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+"""Surface pronunciation of Hangul text, written in Hangul.
+
+    >>> from jamo.pronounce import pronounce
+    >>> pronounce("같이 학교 국물 신라")
+    '가치 학꾜 궁물 실라'
+    >>> pronounce("좋고", trace=True)
+    ('조코', [(0, ('aspiration',))])
+
+The sound changes between two syllables depend only on the tail of the first
+and the lead of the second (and, for palatalization, on whether the second
+vowel is ㅣ). Every rule is compiled ahead of time into one table over the
+(tail, next lead) index pairs, which gives the new tail, the new lead and the
+names of the rules that fired. Text is then rewritten in a single
+left-to-right pass over syllable indices.
+
+The rules are liaison (연음), nasalization (비음화), tensification after
+obstruents (경음화), palatalization (구개음화), lateralization (유음화),
+aspiration (격음화), ㅎ deletion and tail neutralization (음절의 끝소리).
+Changes that depend on morphology, such as tensification after verb stems,
+are not made. Rules apply within runs of Hangul syllables only.
+"""
+
+from .jamo import _JAMO_OFFSET, _HCJ_LEAD_INDEX, _HCJ_TAIL_INDEX
+
+
+RULES = ("liaison", "nasalization", "tensification", "palatalization",
+         "lateralization", "aspiration", "h-deletion", "neutralization")
+
+# Representative sound of every tail.
+_NEUTRAL = dict(zip("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ",
+                    "ㄱㄱㄱㄴㄴㄴㄷㄹㄱㅁㄹㄹㄹㅂㄹㅁㅂㅂㄷㄷㅇㄷㄷㄱㄷㅂㄷ"))
+# Tails before a silent ㅇ: (what stays, what moves to the next lead).
+_LIAISON = {"ㄱ": ("", "ㄱ"), "ㄲ": ("", "ㄲ"), "ㄳ": ("ㄱ", "ㅆ"),
+            "ㄴ": ("", "ㄴ"), "ㄵ": ("ㄴ", "ㅈ"), "ㄶ": ("", "ㄴ"),
+            "ㄷ": ("", "ㄷ"), "ㄹ": ("", "ㄹ"), "ㄺ": ("ㄹ", "ㄱ"),
+            "ㄻ": ("ㄹ", "ㅁ"), "ㄼ": ("ㄹ", "ㅂ"), "ㄽ": ("ㄹ", "ㅆ"),
+            "ㄾ": ("ㄹ", "ㅌ"), "ㄿ": ("ㄹ", "ㅍ"), "ㅀ": ("", "ㄹ"),
+            "ㅁ": ("", "ㅁ"), "ㅂ": ("", "ㅂ"), "ㅄ": ("ㅂ", "ㅆ"),
+            "ㅅ": ("", "ㅅ"), "ㅆ": ("", "ㅆ"), "ㅈ": ("", "ㅈ"),
+            "ㅊ": ("", "ㅊ"), "ㅋ": ("", "ㅋ"), "ㅌ": ("", "ㅌ"),
+            "ㅍ": ("", "ㅍ")}
+# Tails before ㅎ: (what stays, aspirated lead).
+_BEFORE_HIEUH = {"ㄱ": ("", "ㅋ"), "ㄲ": ("", "ㅋ"), "ㄳ": ("", "ㅋ"),
+                 "ㄷ": ("", "ㅌ"), "ㅅ": ("", "ㅌ"), "ㅈ": ("", "ㅊ"),
+                 "ㅊ": ("", "ㅊ"), "ㅌ": ("", "ㅌ"), "ㅂ": ("", "ㅍ"),
+                 "ㅍ": ("", "ㅍ"), "ㅄ": ("", "ㅍ"), "ㄵ": ("ㄴ", "ㅊ"),
+                 "ㄺ": ("ㄹ", "ㅋ"), "ㄼ": ("ㄹ", "ㅍ")}
+# Palatalization before 이 and 히.
+_PALATAL = {("ㄷ", "ㅇ"): ("", "ㅈ"), ("ㅌ", "ㅇ"): ("", "ㅊ"),
+            ("ㄾ", "ㅇ"): ("ㄹ", "ㅊ"), ("ㄷ", "ㅎ"): ("", "ㅊ")}
+_ASPIRATED = {"ㄱ": "ㅋ", "ㄷ": "ㅌ", "ㅈ": "ㅊ"}
+_TENSE = {"ㄱ": "ㄲ", "ㄷ": "ㄸ", "ㅂ": "ㅃ", "ㅅ": "ㅆ", "ㅈ": "ㅉ"}
+_NASAL = {"ㄱ": "ㅇ", "ㄷ": "ㄴ", "ㅂ": "ㅁ"}
+
+
+def _transition(tail, lead):
+    """Return (tail, lead, rules) after the sound changes between a tail and
+    the lead of the next syllable. Tails and leads are HCJ, '' for no tail.
+    """
+    if not tail:
+        return "", lead, ()
+    if lead == "ㅇ":
+        if tail == "ㅇ":
+            return tail, lead, ()
+        if tail == "ㅎ":
+            return "", lead, ("h-deletion",)
+        rest, moved = _LIAISON[tail]
+        rules = ("liaison",)
+        if tail in "ㄶㅀ":
+            rules += ("h-deletion",)
+        elif moved == "ㅆ" and tail != "ㅆ":
+            rules += ("tensification",)
+        return rest, moved, rules
+    sound = _NEUTRAL[tail]
+    rules = ("neutralization",) if sound != tail else ()
+    if tail in "ㅎㄶㅀ":
+        rest = {"ㅎ": "", "ㄶ": "ㄴ", "ㅀ": "ㄹ"}[tail]
+        if lead in _ASPIRATED:
+            return rest, _ASPIRATED[lead], ("aspiration",)
+        if lead == "ㅅ":
+            return rest, "ㅆ", ("h-deletion", "tensification")
+        if lead == "ㄴ":
+            if tail == "ㅀ":
+                return "ㄹ", "ㄹ", ("h-deletion", "lateralization")
+            return "ㄴ", "ㄴ", ("nasalization",) if tail == "ㅎ"\
+                else ("h-deletion",)
+    elif lead == "ㅎ" and tail in _BEFORE_HIEUH:
+        rest, lead = _BEFORE_HIEUH[tail]
+        return rest, lead, ("aspiration",)
+    if lead in "ㄴㅁ":
+        if sound == "ㄹ" and lead == "ㄴ":
+            return sound, "ㄹ", rules + ("lateralization",)
+        if sound in _NASAL:
+            return _NASAL[sound], lead, rules + ("nasalization",)
+    elif lead == "ㄹ":
+        if sound == "ㄹ":
+            return sound, lead, rules
+        if sound == "ㄴ":
+            return "ㄹ", lead, rules + ("lateralization",)
+        return _NASAL.get(sound, sound), "ㄴ", rules + ("nasalization",)
+    elif sound in _NASAL and lead in _TENSE:
+        return sound, _TENSE[lead], rules + ("tensification",)
+    return sound, lead, rules
+
+
+def _build_tables():
+    """Return (finals, transitions, palatal overrides) over indices.
+    Transitions are a flat list indexed by tail * 19 + lead; entries are
+    (tail, lead, rules).
+    """
+    tails = [""] + sorted(_HCJ_TAIL_INDEX, key=_HCJ_TAIL_INDEX.get)
+    leads = sorted(_HCJ_LEAD_INDEX, key=_HCJ_LEAD_INDEX.get)
+
+    def indices(tail, lead, rules):
+        return _HCJ_TAIL_INDEX.get(tail, 0), _HCJ_LEAD_INDEX[lead], rules
+
+    finals = [(_HCJ_TAIL_INDEX[_NEUTRAL[_]],
+               ("neutralization",) if _NEUTRAL[_] != _ else ())
+              if _ else (0, ()) for _ in tails]
+    transitions = [indices(*_transition(tail, lead))
+                   for tail in tails for lead in leads]
+    palatal = {_HCJ_TAIL_INDEX[tail] * 19 + _HCJ_LEAD_INDEX[lead]:
+               indices(*result, rules=("palatalization",))
+               for (tail, lead), result in _PALATAL.items()}
+    return finals, transitions, palatal
+
+
+_FINALS, _TRANSITIONS, _PALATAL_TRANSITIONS = _build_tables()
+# Vowel index of ㅣ, which triggers palatalization.
+_VOWEL_I = 20
+
+
+def pronounce(string, trace=False):
+    """Rewrite the Hangul in string as it is pronounced.
+
+    With trace, return (pronunciation, trace) where trace lists
+    (index, rules) for every syllable boundary at which rules fired; index is
+    the position of the syllable before the boundary.
+    """
+    out = []
+    fired = []
+    lead = None
+    length = len(string)
+    for index, char in enumerate(string):
+        rem = ord(char) - _JAMO_OFFSET
+        if not 0 <= rem < 11172:
+            out.append(char)
+            lead = None
+            continue
+        if lead is None:
+            lead = rem // 588
+        vowel = (rem % 588) // 28
+        following = ord(string[index + 1]) - _JAMO_OFFSET\
+            if index + 1 < length else -1
+        if 0 <= following < 11172:
+            key = rem % 28 * 19 + following // 588
+            if (following % 588) // 28 == _VOWEL_I and\
+                    key in _PALATAL_TRANSITIONS:
+                tail, following_lead, rules = _PALATAL_TRANSITIONS[key]
+            else:
+                tail, following_lead, rules = _TRANSITIONS[key]
+        else:
+            tail, rules = _FINALS[rem % 28]
+            following_lead = None
+        out.append(chr(_JAMO_OFFSET + lead * 588 + vowel * 28 + tail))
+        if rules and trace:
+            fired.append((index, rules))
+        lead = following_lead
+    result = ''.join(out)
+    if trace:
+        return result, fired
+    return result
+
+
+def pronounce_batch(strings, trace=False):
+    """Pronounce every string in an iterable, returning a list.
+    Repeated strings are converted once.
+    """
+    cache = {}
+    results = []
+    for string in strings:
+        if string not in cache:
+            cache[string] = pronounce(string, trace)
+        results.append(cache[string])
+    return results
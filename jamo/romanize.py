@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+"""Revised Romanization of Korean, driven by precomputed transition tables.
+
+Syllables are read arithmetically as lead, vowel and tail indices, as in
+_hangul_char_to_jamo. Sound changes between syllables depend only on the
+tail of one syllable and the lead of the next, so every (tail, next lead)
+pair is resolved ahead of time into the romanized coda and onset. A string
+is then romanized in one left-to-right pass:
+
+    >>> from jamo.romanize import romanize
+    >>> romanize("한국어")
+    'hangugeo'
+    >>> romanize("신라 종로 같이")
+    'silla jongno gachi'
+    >>> romanize("한국어", mode="strict")
+    'hangug-eo'
+
+"pronunciation" mode follows the standard rules, which romanize liaison,
+nasalization, lateralization, aspiration and palatalization but not
+tensification. Its pairs are read off the transition tables of
+jamo.pronounce, so both modules agree on every sound change. "strict" mode is the letter-by-letter transliteration of
+the same system.
+"""
+
+from .jamo import _JAMO_OFFSET, _HCJ_LEAD_INDEX, _HCJ_TAIL_INDEX
+from .pronounce import _FINALS, _TRANSITIONS, _PALATAL_TRANSITIONS
+
+
+MODES = ("pronunciation", "strict")
+
+_VOWELS = ["a", "ae", "ya", "yae", "eo", "e", "yeo", "ye", "o", "wa", "wae",
+           "oe", "yo", "u", "wo", "we", "wi", "yu", "eu", "ui", "i"]
+_LEADS = dict(zip("ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ",
+                  ["g", "kk", "n", "d", "tt", "r", "m", "b", "pp", "s", "ss",
+                   "", "j", "jj", "ch", "k", "t", "p", "h"]))
+# Letter-by-letter spelling of every tail, for strict mode.
+_TAIL_LETTERS = dict(zip("ㄱㄲㄳㄴㄵㄶㄷㄹㄺㄻㄼㄽㄾㄿㅀㅁㅂㅄㅅㅆㅇㅈㅊㅋㅌㅍㅎ",
+                         ["g", "kk", "gs", "n", "nj", "nh", "d", "l", "lg",
+                          "lm", "lb", "ls", "lt", "lp", "lh", "m", "b", "bs",
+                          "s", "ss", "ng", "j", "ch", "k", "t", "p", "h"]))
+# Romanized sound of the tails left by pronounce, which are all neutral.
+_CODAS = dict(zip("ㄱㄴㄷㄹㅁㅂㅇ", ["k", "n", "t", "l", "m", "p", "ng"]))
+# Tensification is not romanized: plain sound of every tense lead.
+_PLAIN = dict(zip("ㄲㄸㅃㅆㅉ", "ㄱㄷㅂㅅㅈ"))
+_TAIL_LIST = [""] + sorted(_HCJ_TAIL_INDEX, key=_HCJ_TAIL_INDEX.get)
+_LEAD_LIST = sorted(_HCJ_LEAD_INDEX, key=_HCJ_LEAD_INDEX.get)
+
+
+def _pronounced(tail, lead, rules):
+    """Return the romanized (coda, onset) for a transition of pronounce,
+    given as tail and lead indices and the rules that fired.
+    """
+    coda = _CODAS[_TAIL_LIST[tail]] if tail else ""
+    lead = _LEAD_LIST[lead]
+    if "tensification" in rules:
+        lead = _PLAIN.get(lead, lead)
+    if coda == "l" and lead == "ㄹ":
+        return coda, "l"
+    return coda, _LEADS[lead]
+
+
+def _transliterated(tail, lead):
+    """Return the letter-by-letter (coda, onset) for tail followed by lead.
+    A hyphen marks a silent ㅇ after a tail.
+    """
+    onset = "l" if lead == "ㄹ" else _LEADS[lead]
+    if not tail:
+        return "", onset
+    return _TAIL_LETTERS[tail], onset or "-"
+
+
+def _build_tables():
+    """Return per mode (initials, finals, transitions, palatal overrides).
+    Transitions are flat lists indexed by tail * 19 + lead.
+    """
+    tables = {}
+    tables["pronunciation"] = (
+        [_LEADS[_] for _ in _LEAD_LIST],
+        [_CODAS[_TAIL_LIST[tail]] if tail else "" for tail, _ in _FINALS],
+        [_pronounced(*_) for _ in _TRANSITIONS],
+        {key: _pronounced(*_) for key, _ in _PALATAL_TRANSITIONS.items()})
+    tables["strict"] = (
+        [_transliterated("", _)[1] for _ in _LEAD_LIST],
+        [_TAIL_LETTERS.get(_, "") for _ in _TAIL_LIST],
+        [_transliterated(tail, lead)
+         for tail in _TAIL_LIST for lead in _LEAD_LIST],
+        {})
+    return tables
+
+
+_TABLES = _build_tables()
+# Vowel index of ㅣ, which triggers palatalization.
+_VOWEL_I = 20
+
+
+def romanize(string, mode="pronunciation", hyphenate=False,
+             capitalize=False):
+    """Romanize the Hangul in string; anything else is passed through.
+    Sound changes apply within runs of Hangul syllables.
+
+    With hyphenate, pronunciation mode separates syllables whose reading is
+    ambiguous, e.g. jung-ang for 중앙. With capitalize, every
+    whitespace-separated word starts with a capital letter.
+    """
+    if mode not in _TABLES:
+        raise ValueError("mode must be one of " + ", ".join(MODES))
+    initials, finals, transitions, palatal = _TABLES[mode]
+    out = []
+    onset = None
+    length = len(string)
+    for index, char in enumerate(string):
+        rem = ord(char) - _JAMO_OFFSET
+        if not 0 <= rem < 11172:
+            out.append(char)
+            onset = None
+            continue
+        tail = rem % 28
+        out.append(initials[rem // 588] if onset is None else onset)
+        out.append(_VOWELS[(rem % 588) // 28])
+        following = ord(string[index + 1]) - _JAMO_OFFSET\
+            if index + 1 < length else -1
+        if 0 <= following < 11172:
+            key = tail * 19 + following // 588
+            if (following % 588) // 28 == _VOWEL_I and key in palatal:
+                coda, onset = palatal[key]
+            else:
+                coda, onset = transitions[key]
+            out.append(coda)
+            if hyphenate and coda and (not onset or
+                                       (coda[-1] == "n" and onset == "g")):
+                out.append("-")
+        else:
+            out.append(finals[tail])
+            onset = None
+    result = ''.join(out)
+    if capitalize:
+        result = ' '.join(_[:1].upper() + _[1:] for _ in result.split(' '))
+    return result
+
+
+def romanize_batch(strings, mode="pronunciation", hyphenate=False,
+                   capitalize=False):
+    """Romanize every string in an iterable, returning a list.
+    Repeated strings, common in name and address data, are romanized once.
+    """
+    cache = {}
+    results = []
+    for string in strings:
+        if string not in cache:
+            cache[string] = romanize(string, mode, hyphenate, capitalize)
+        results.append(cache[string])
+    return results
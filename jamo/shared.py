@@ -0,0 +1,254 @@
+# -*- coding: utf-8 -*-
+"""Precomputed conversion tables that can be shared between processes.
+
+Every process looking up jamo names imports its own name dictionaries. A
+parent process can instead pack the tables once into a flat, read-only buffer
+and publish it through multiprocessing.shared_memory or an mmapped file;
+workers then attach to it without copying, and never import the
+dictionaries:
+
+    >>> from jamo import shared
+    >>> tables = shared.create_shared("jamo-tables")   # parent
+    >>> tables = shared.attach_shared("jamo-tables")   # each worker
+    >>> tables.h2j("한굴") == "\u1112\u1161\u11ab\u1100\u116e\u11af"
+    True
+
+get_tables() attaches when it can and falls back to private in-process
+tables otherwise.
+"""
+
+import mmap
+import struct
+
+from .jamo import (_get_name_tables, _JAMO_OFFSET, _JAMO_LEAD_OFFSET,
+                   _JAMO_VOWEL_OFFSET, _JAMO_TAIL_OFFSET,
+                   InvalidJamoError)
+
+
+_MAGIC = b"JAMT"
+_VERSION = 2
+# magic, version, syllable count, syllable offset, name count,
+# codepoint offset, name offset offset, name text offset, by-name offset
+_HEADER = struct.Struct("<4sHHIIIIII")
+_SYLLABLE_COUNT = 11172
+
+
+def _align(data):
+    data.extend(b"\0" * (-len(data) % 4))
+    return len(data)
+
+
+def build_tables():
+    """Pack the syllable decomposition table and the jamo/HCJ name tables
+    into a single bytes object, the format read by JamoTables.
+
+    Syllables are stored as (lead, vowel, tail) codepoint triples of
+    little-endian uint16, with 0 for no tail. Names are stored as a sorted
+    uint32 codepoint array, uint32 offsets into a UTF-8 text blob, and a
+    uint32 permutation ordering the entries by name for reverse lookups.
+    """
+    data = bytearray(_HEADER.size)
+    syllable_offset = _align(data)
+    for rem in range(_SYLLABLE_COUNT):
+        tail = rem % 28
+        vowel = 1 + ((rem - tail) % 588) // 28
+        lead = 1 + rem // 588
+        data.extend(struct.pack("<3H", lead + _JAMO_LEAD_OFFSET,
+                                vowel + _JAMO_VOWEL_OFFSET,
+                                tail + _JAMO_TAIL_OFFSET if tail else 0))
+
+    jamo_to_name, hcj_to_name = _get_name_tables()
+    names = dict(jamo_to_name)
+    names.update(hcj_to_name)
+    codes = sorted(ord(_) for _ in names)
+    encoded = [names[chr(_)].encode("utf-8") for _ in codes]
+
+    code_offset = _align(data)
+    data.extend(struct.pack("<%dI" % len(codes), *codes))
+    name_offset_offset = _align(data)
+    position = 0
+    offsets = [position]
+    for name in encoded:
+        position += len(name)
+        offsets.append(position)
+    data.extend(struct.pack("<%dI" % len(offsets), *offsets))
+    by_name_offset = _align(data)
+    by_name = sorted(range(len(codes)), key=encoded.__getitem__)
+    data.extend(struct.pack("<%dI" % len(by_name), *by_name))
+    text_offset = _align(data)
+    data.extend(b"".join(encoded))
+
+    _HEADER.pack_into(data, 0, _MAGIC, _VERSION, _SYLLABLE_COUNT,
+                      syllable_offset, len(codes), code_offset,
+                      name_offset_offset, text_offset, by_name_offset)
+    return bytes(data)
+
+
+class JamoTables(object):
+    """Read-only view over a buffer produced by build_tables.
+
+    The buffer is never copied: lookups index straight into it, so many
+    processes attached to the same shared memory block or mmapped file share
+    a single physical copy of the tables.
+    """
+    def __init__(self, buffer, owner=None):
+        self._buffer = memoryview(buffer)
+        self._owner = owner
+        (magic, version, syllables, syllable_offset, count, code_offset,
+         name_offset_offset, text_offset,
+         by_name_offset) = _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC or version != _VERSION or\
+                syllables != _SYLLABLE_COUNT:
+            raise ValueError("Not a jamo table buffer.")
+        self._syllables = self._array(syllable_offset, 3 * _SYLLABLE_COUNT,
+                                      "H")
+        self._codes = self._array(code_offset, count, "I")
+        self._name_offsets = self._array(name_offset_offset, count + 1, "I")
+        self._by_name = self._array(by_name_offset, count, "I")
+        self._text = self._buffer[text_offset:
+                                  text_offset + self._name_offsets[count]]
+
+    def _array(self, offset, count, fmt):
+        size = struct.calcsize(fmt)
+        return self._buffer[offset:offset + count * size].cast(fmt)
+
+    def _name_at(self, index):
+        return bytes(self._text[self._name_offsets[index]:
+                                self._name_offsets[index + 1]])
+
+    def hangul_char_to_jamo(self, syllable):
+        """Table-backed equivalent of jamo._hangul_char_to_jamo.
+        """
+        index = 3 * (ord(syllable) - _JAMO_OFFSET)
+        if 0 <= index < len(self._syllables):
+            lead, vowel, tail = self._syllables[index:index + 3]
+            if tail:
+                return chr(lead), chr(vowel), chr(tail)
+            return chr(lead), chr(vowel)
+        return syllable
+
+    def h2j(self, hangul_string):
+        """Table-backed equivalent of jamo.h2j.
+        """
+        return ''.join(''.join(self.hangul_char_to_jamo(_))
+                       for _ in hangul_string)
+
+    def get_unicode_name(self, char):
+        """Table-backed equivalent of jamo._get_unicode_name.
+        """
+        code = ord(char)
+        low, high = 0, len(self._codes)
+        while low < high:
+            middle = (low + high) // 2
+            if self._codes[middle] < code:
+                low = middle + 1
+            else:
+                high = middle
+        if low == len(self._codes) or self._codes[low] != code:
+            raise InvalidJamoError("Not jamo or nameless jamo character",
+                                   char)
+        return self._name_at(low).decode("utf-8")
+
+    def lookup_name(self, name):
+        """Return the jamo or HCJ character with the given Unicode name, or
+        None if there is none.
+        """
+        target = name.encode("utf-8")
+        low, high = 0, len(self._by_name)
+        while low < high:
+            middle = (low + high) // 2
+            if self._name_at(self._by_name[middle]) < target:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(self._by_name):
+            index = self._by_name[low]
+            if self._name_at(index) == target:
+                return chr(self._codes[index])
+        return None
+
+    def close(self):
+        """Release the views and detach from the underlying buffer.
+        Shared memory is detached but not unlinked.
+        """
+        for view in (self._syllables, self._codes, self._name_offsets,
+                     self._by_name, self._text, self._buffer):
+            view.release()
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def create_shared(name=None):
+    """Build the tables into a new shared memory block and return a
+    JamoTables over it. The block lives on until unlink_shared is called.
+    """
+    from multiprocessing import shared_memory
+    data = build_tables()
+    block = shared_memory.SharedMemory(name=name, create=True,
+                                       size=len(data))
+    block.buf[:len(data)] = data
+    return JamoTables(block.buf[:len(data)], owner=block)
+
+
+def attach_shared(name):
+    """Attach to a shared memory block created by create_shared.
+    """
+    from multiprocessing import shared_memory
+    try:
+        block = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        # Before Python 3.13 every attaching process registers the block
+        # with its resource tracker, which would unlink it on exit.
+        from multiprocessing import resource_tracker
+        block = shared_memory.SharedMemory(name=name)
+        resource_tracker.unregister(block._name, "shared_memory")
+    return JamoTables(block.buf, owner=block)
+
+
+def unlink_shared(name):
+    """Destroy a shared memory block created by create_shared.
+    """
+    from multiprocessing import shared_memory
+    block = shared_memory.SharedMemory(name=name)
+    block.close()
+    block.unlink()
+
+
+def save(path):
+    """Write the tables to a file suitable for load.
+    """
+    with open(path, "wb") as fout:
+        fout.write(build_tables())
+
+
+def load(path):
+    """Map a file written by save read-only and return a JamoTables over it.
+    """
+    with open(path, "rb") as fin:
+        mapping = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+    return JamoTables(mapping, owner=mapping)
+
+
+def get_tables(name=None, path=None):
+    """Return shared tables from the named shared memory block or the mmapped
+    file at path, whichever is given and available, falling back to private
+    in-process tables.
+    """
+    if name is not None:
+        try:
+            return attach_shared(name)
+        except (ImportError, OSError, ValueError):
+            pass
+    if path is not None:
+        try:
+            return load(path)
+        except (OSError, ValueError):
+            pass
+    return JamoTables(build_tables())
@@ -0,0 +1,118 @@
+# -*- coding: utf-8 -*-
+"""SQL functions and a collation for Hangul in sqlite3.
+
+    >>> import sqlite3
+    >>> from jamo.sqlite import register
+    >>> connection = sqlite3.connect(":memory:")
+    >>> register(connection)
+    >>> connection.execute("SELECT chosung('한국어'), "
+    ...                    "jamo_distance('학교', '핵교')").fetchone()
+    ('ㅎㄱㅇ', 1)
+
+register() adds h2j(text), j2hcj(text), chosung(text), hangul_key(text)
+and jamo_distance(text, text[, limit]), all deterministic so that SQLite may
+use them in indexes, and the collation "hangul" for ORDER BY name COLLATE
+hangul. The functions run on the str.translate tables of the "table"
+backend and of jamo.index, since SQLite calls them once per row. See
+tools/sqlite_benchmark.py to time them on a large table.
+"""
+
+from functools import lru_cache
+import sqlite3
+
+from .backends import get_backend
+from .collate import sort_key
+from .index import _get_chosung_table
+from .trie import letters
+
+
+def _text_function(convert):
+    """Wrap a str -> str converter to pass NULL and non-text values through.
+    """
+    def function(value):
+        return convert(value) if isinstance(value, str) else value
+    return function
+
+
+def chosung(string):
+    """Replace every syllable of string with its lead as HCJ.
+    """
+    return string.translate(_get_chosung_table())
+
+
+def jamo_distance(first, second, limit=None):
+    """Return the Levenshtein distance between the typed letters of two
+    strings, so that 학교 and 핵교 are one edit apart.
+
+    With limit, any distance above limit is returned as limit + 1, which
+    lets most unrelated pairs be rejected after a few letters.
+    """
+    first, second = letters(first), letters(second)
+    start = 0
+    while start < min(len(first), len(second)) and\
+            first[start] == second[start]:
+        start += 1
+    first, second = first[start:], second[start:]
+    while first and second and first[-1] == second[-1]:
+        first, second = first[:-1], second[:-1]
+    if len(first) < len(second):
+        first, second = second, first
+    if limit is not None and len(first) - len(second) > limit:
+        return limit + 1
+    previous = list(range(len(second) + 1))
+    for row, char in enumerate(first, 1):
+        current = [row]
+        for column, other in enumerate(second, 1):
+            current.append(min(previous[column] + 1, current[-1] + 1,
+                               previous[column - 1] + (char != other)))
+        previous = current
+        if limit is not None and min(current) > limit:
+            return limit + 1
+    if limit is not None:
+        return min(previous[-1], limit + 1)
+    return previous[-1]
+
+
+@lru_cache(maxsize=65536)
+def _cached_sort_key(string):
+    return sort_key(string)
+
+
+def _collate(first, second):
+    first, second = _cached_sort_key(first), _cached_sort_key(second)
+    return (first > second) - (first < second)
+
+
+def _distance(first, second, limit=None):
+    if isinstance(first, str) and isinstance(second, str):
+        return jamo_distance(first, second, limit)
+    return None
+
+
+def _key(value):
+    return sort_key(value) if isinstance(value, str) else value
+
+
+def register(connection, deterministic=True):
+    """Register the jamo functions and the "hangul" collation on a
+    sqlite3.Connection. deterministic is dropped on SQLite versions that do
+    not support it.
+
+    hangul_key(text) returns the jamo.collate key as a BLOB; an index on it
+    gives the same order as the collation without calling back into Python
+    on every comparison.
+    """
+    table = get_backend("table")
+    functions = [("h2j", 1, _text_function(table.h2j)),
+                 ("j2hcj", 1, _text_function(table.j2hcj)),
+                 ("chosung", 1, _text_function(chosung)),
+                 ("jamo_distance", 2, _distance),
+                 ("jamo_distance", 3, _distance),
+                 ("hangul_key", 1, _key)]
+    for name, count, function in functions:
+        try:
+            connection.create_function(name, count, function,
+                                       deterministic=deterministic)
+        except sqlite3.NotSupportedError:
+            connection.create_function(name, count, function)
+    connection.create_collation("hangul", _collate)
@@ -0,0 +1,246 @@
+# -*- coding: utf-8 -*-
+"""Lead, vowel, tail and compound frequencies of Hangul text.
+
+    >>> from jamo.stats import JamoStats
+    >>> stats = JamoStats().update("한국어")
+    >>> stats.syllables, stats.tailless
+    (3, 1)
+    >>> stats.classes()
+    Counter({'lead': 3, 'vowel': 3, 'tail': 2})
+
+Syllables are counted by their lead, vowel and tail indices, computed with
+the syllable arithmetic of _hangul_char_to_jamo over whole strings at once:
+with numpy.bincount when NumPy is installed, and otherwise from a
+collections.Counter of the distinct characters. Conjoining jamo in the text
+are counted with the syllables they would belong to; HCJ letters, whose
+position is unknown, are counted apart.
+
+Results are mergeable, so a corpus can be counted in shards, in several
+processes or files, and the partial results added up with merge() or +.
+"""
+
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from .jamo import (_JAMO_OFFSET, _JAMO_LEAD_OFFSET, _JAMO_VOWEL_OFFSET,
+                   _JAMO_TAIL_OFFSET, is_hcj, is_jamo_compound)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def _position(code):
+    """Return "leads", "vowels" or "tails" for a conjoining jamo codepoint,
+    "hcj" for HCJ, or None.
+    """
+    if 0x1100 <= code <= 0x115f or 0xa960 <= code <= 0xa97c:
+        return "leads"
+    if 0x1160 <= code <= 0x11a7 or 0xd7b0 <= code <= 0xd7c6:
+        return "vowels"
+    if 0x11a8 <= code <= 0x11ff or 0xd7cb <= code <= 0xd7fb:
+        return "tails"
+    if is_hcj(chr(code)):
+        return "hcj"
+    return None
+
+
+class JamoStats(object):
+    """Jamo frequencies of the text counted so far.
+
+    leads, vowels and tails are Counters keyed by U+11xx jamo, hcj a Counter
+    keyed by HCJ. syllables counts precomposed syllables, tailless those
+    without a tail, and characters every character seen.
+    """
+    def __init__(self):
+        self.leads = Counter()
+        self.vowels = Counter()
+        self.tails = Counter()
+        self.hcj = Counter()
+        self.syllables = 0
+        self.tailless = 0
+        self.characters = 0
+
+    def _add_syllables(self, lead_counts, vowel_counts, tail_counts):
+        """Add per-index counts of syllables, as sequences indexed from 0.
+        """
+        for counter, counts, offset in (
+                (self.leads, lead_counts, _JAMO_LEAD_OFFSET + 1),
+                (self.vowels, vowel_counts, _JAMO_VOWEL_OFFSET + 1),
+                (self.tails, tail_counts, _JAMO_TAIL_OFFSET)):
+            for index, count in enumerate(counts):
+                if count and (index or counter is not self.tails):
+                    counter[chr(offset + index)] += int(count)
+        self.syllables += int(sum(lead_counts))
+        self.tailless += int(tail_counts[0])
+
+    def _add_others(self, items):
+        """Add (codepoint, count) pairs of characters that are not
+        syllables.
+        """
+        for code, count in items:
+            position = _position(code)
+            if position is not None:
+                getattr(self, position)[chr(code)] += int(count)
+
+    def update(self, text):
+        """Count the jamo of a string. Returns self.
+        """
+        self.characters += len(text)
+        if numpy is not None:
+            codes = numpy.frombuffer(text.encode("utf-32-le", "surrogatepass"),
+                                     dtype="<u4")
+            syllable = (codes >= _JAMO_OFFSET) &\
+                (codes < _JAMO_OFFSET + 11172)
+            rem = codes[syllable].astype(numpy.int64) - _JAMO_OFFSET
+            self._add_syllables(numpy.bincount(rem // 588, minlength=19),
+                                numpy.bincount(rem % 588 // 28, minlength=21),
+                                numpy.bincount(rem % 28, minlength=28))
+            others = codes[~syllable]
+            others = others[((others >= 0x1100) & (others < 0x1200)) |
+                            ((others >= 0x3131) & (others < 0x318f)) |
+                            ((others >= 0xa960) & (others < 0xa97d)) |
+                            ((others >= 0xd7b0) & (others < 0xd7fc))]
+            self._add_others(zip(*numpy.unique(others, return_counts=True)))
+            return self
+        leads, vowels, tails = [0] * 19, [0] * 21, [0] * 28
+        others = []
+        for char, count in Counter(text).items():
+            rem = ord(char) - _JAMO_OFFSET
+            if 0 <= rem < 11172:
+                leads[rem // 588] += count
+                vowels[rem % 588 // 28] += count
+                tails[rem % 28] += count
+            else:
+                others.append((ord(char), count))
+        self._add_syllables(leads, vowels, tails)
+        self._add_others(others)
+        return self
+
+    def update_many(self, texts, chunk_size=1 << 20):
+        """Count the jamo of an iterable of strings, in chunks of about
+        chunk_size characters. Returns self.
+        """
+        chunk, size = [], 0
+        for text in texts:
+            chunk.append(text)
+            size += len(text)
+            if size >= chunk_size:
+                self.update(''.join(chunk))
+                chunk, size = [], 0
+        if chunk:
+            self.update(''.join(chunk))
+        return self
+
+    def merge(self, other):
+        """Add the counts of another JamoStats to this one. Returns self.
+        """
+        for name in ("leads", "vowels", "tails", "hcj"):
+            getattr(self, name).update(getattr(other, name))
+        self.syllables += other.syllables
+        self.tailless += other.tailless
+        self.characters += other.characters
+        return self
+
+    def __add__(self, other):
+        return JamoStats().merge(self).merge(other)
+
+    def __eq__(self, other):
+        return isinstance(other, JamoStats) and\
+            self.to_dict() == other.to_dict()
+
+    def compounds(self):
+        """Return a Counter of the compound leads, vowels, tails and HCJ:
+        double consonants, consonant clusters and diphthongs.
+        """
+        counts = Counter()
+        for counter in (self.leads, self.vowels, self.tails, self.hcj):
+            for char, count in counter.items():
+                if is_jamo_compound(char):
+                    counts[char] += count
+        return counts
+
+    def classes(self):
+        """Return the total number of leads, vowels and tails, as a Counter
+        keyed by "lead", "vowel" and "tail". HCJ is not included.
+        """
+        return Counter({"lead": sum(self.leads.values()),
+                        "vowel": sum(self.vowels.values()),
+                        "tail": sum(self.tails.values())})
+
+    def to_dict(self):
+        """Return the counts as a JSON-serializable dict.
+        """
+        return {"leads": dict(self.leads), "vowels": dict(self.vowels),
+                "tails": dict(self.tails), "hcj": dict(self.hcj),
+                "syllables": self.syllables, "tailless": self.tailless,
+                "characters": self.characters}
+
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a JamoStats from the output of to_dict.
+        """
+        stats = cls()
+        for name in ("leads", "vowels", "tails", "hcj"):
+            getattr(stats, name).update(data[name])
+        stats.syllables = data["syllables"]
+        stats.tailless = data["tailless"]
+        stats.characters = data["characters"]
+        return stats
+
+
+def _count_texts(texts):
+    return JamoStats().update_many(texts)
+
+
+def _count_file(args):
+    path, encoding = args
+    stats = JamoStats()
+    with open(path, "r", encoding=encoding) as fin:
+        while True:
+            chunk = fin.read(1 << 20)
+            if not chunk:
+                return stats
+            stats.update(chunk)
+
+
+def _merge_counts(count, jobs, processes):
+    """Return the merged count(job) of every job, reading jobs lazily. With
+    processes, at most twice that many jobs are in flight at a time, and
+    results are merged in job order.
+    """
+    total = JamoStats()
+    if not processes or processes == 1:
+        for job in jobs:
+            total.merge(count(job))
+        return total
+    with ProcessPoolExecutor(processes) as executor:
+        pending = deque()
+        for job in jobs:
+            pending.append(executor.submit(count, job))
+            if len(pending) >= 2 * processes:
+                total.merge(pending.popleft().result())
+        while pending:
+            total.merge(pending.popleft().result())
+    return total
+
+
+def collect(texts, processes=None, shard_size=10000):
+    """Count the jamo of an iterable of strings. With processes, shards of
+    shard_size strings are read as they are needed and counted in that many
+    worker processes.
+    """
+    if not processes or processes == 1:
+        return JamoStats().update_many(texts)
+    texts = iter(texts)
+    shards = iter(lambda: list(islice(texts, shard_size)), [])
+    return _merge_counts(_count_texts, shards, processes)
+
+
+def collect_files(paths, processes=None, encoding="utf-8"):
+    """Count the jamo of text files, one file per worker process at a time.
+    """
+    return _merge_counts(_count_file, ((path, encoding) for path in paths),
+                         processes)
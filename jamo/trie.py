@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+"""Autocomplete over Hangul that matches syllables still being composed.
+
+Words are keyed on their letters: syllables are decomposed with h2j, turned
+into HCJ, and compound vowels and tails are split into the letters that are
+typed for them. A query that ends in a partial syllable is then an ordinary
+prefix of the words it may become:
+
+    >>> from jamo.trie import JamoTrie
+    >>> trie = JamoTrie.from_words({"한국": 5, "학교": 3, "하늘": 2})
+    >>> trie.complete("한ㄱ")
+    [('한국', 5.0)]
+    >>> trie.complete("학")
+    [('학교', 3.0)]
+    >>> trie.complete("하", k=2)
+    [('한국', 5.0), ('학교', 3.0)]
+
+The trie is packed into flat arrays, built once with build(), and read in
+place, so save() and load() give an mmapped trie that loads in constant
+time and is shared between processes through the page cache.
+"""
+
+import heapq
+import mmap
+import struct
+
+from .jamo import (JAMO_COMPOUNDS_MODERN, decompose_jamo, h2j, j2hcj,
+                   _JAMO_OFFSET, _JAMO_TO_HCJ)
+
+
+_MAGIC = b"JTRI"
+_VERSION = 1
+# magic, version, reserved, node count, word count, offsets of the label,
+# first child, child count, first word, word count, best weight, weight,
+# text offset and text arrays
+_HEADER = struct.Struct("<4sHHII9I")
+
+_LETTERS = {}
+
+
+def _split(hcj):
+    """Return the letters typed for one HCJ character.
+    """
+    if hcj not in JAMO_COMPOUNDS_MODERN:
+        return hcj
+    return ''.join(_split(_) for _ in decompose_jamo(hcj))
+
+
+def _get_letters_table():
+    """Return the str.translate table from syllables, jamo and compound HCJ
+    to letters, built on first use.
+    """
+    if not _LETTERS:
+        for code in range(_JAMO_OFFSET, _JAMO_OFFSET + 11172):
+            _LETTERS[code] = ''.join(_split(_)
+                                     for _ in j2hcj(h2j(chr(code))))
+        for jamo, hcj in _JAMO_TO_HCJ.items():
+            _LETTERS[ord(jamo)] = _split(hcj)
+        for hcj in JAMO_COMPOUNDS_MODERN:
+            _LETTERS[ord(hcj)] = _split(hcj)
+    return _LETTERS
+
+
+def letters(string):
+    """Return the key under which string is stored in a JamoTrie.
+    """
+    return string.translate(_get_letters_table())
+
+
+def _align(data, size=8):
+    data.extend(b"\0" * (-len(data) % size))
+    return len(data)
+
+
+def build(words):
+    """Pack words into a bytes object, the format read by JamoTrie.
+
+    words is a mapping or an iterable of words or (word, weight) pairs; the
+    weights of repeated words are added, and plain words weigh 1. Nodes are
+    laid out breadth first, so the children of a node are contiguous and
+    sorted by label. Words are sorted by key, so words with the same key,
+    such as "닭" and "달ㄱ", are contiguous too.
+    """
+    if hasattr(words, "items"):
+        words = words.items()
+    weights = {}
+    for item in words:
+        word, weight = (item, 1) if isinstance(item, str) else item
+        weights[word] = weights.get(word, 0) + weight
+    ordered = sorted(weights, key=lambda _: (letters(_), _))
+
+    root = {}
+    for index, word in enumerate(ordered):
+        node = root
+        for char in letters(word):
+            node = node.setdefault(char, {})
+        node.setdefault(None, []).append(index)
+
+    # Store the best weight under every node in post-order, with an explicit
+    # stack since keys may be longer than the recursion limit.
+    stack = [(root, False)]
+    while stack:
+        node, visited = stack.pop()
+        if not visited:
+            stack.append((node, True))
+            stack.extend((child, False) for label, child in node.items()
+                         if label is not None)
+            continue
+        value = max([child[""] for label, child in node.items() if label] or
+                    [float("-inf")])
+        for index in node.get(None, ()):
+            value = max(value, weights[ordered[index]])
+        node[""] = value
+    labels, first_child, child_count, bests = [], [], [], []
+    first_word, word_count = [], []
+    queue = [(0, root)]
+    for label, node in queue:
+        children = sorted(_ for _ in node if _)
+        labels.append(ord(label) if label else 0)
+        first_child.append(len(queue))
+        child_count.append(len(children))
+        first_word.append(node[None][0] if None in node else 0)
+        word_count.append(len(node.get(None, ())))
+        bests.append(node[""])
+        queue.extend((_, node[_]) for _ in children)
+
+    text = bytearray()
+    text_offsets = [0]
+    for word in ordered:
+        text.extend(word.encode("utf-8"))
+        text_offsets.append(len(text))
+
+    data = bytearray(_HEADER.size)
+    offsets = []
+    for fmt, values in (("I", labels), ("I", first_child),
+                        ("I", child_count), ("I", first_word),
+                        ("I", word_count), ("d", bests),
+                        ("d", [weights[_] for _ in ordered]),
+                        ("I", text_offsets)):
+        offsets.append(_align(data))
+        data.extend(struct.pack("<%d%s" % (len(values), fmt), *values))
+    offsets.append(_align(data))
+    data.extend(text)
+    _HEADER.pack_into(data, 0, _MAGIC, _VERSION, 0, len(labels),
+                      len(ordered), *offsets)
+    return bytes(data)
+
+
+class JamoTrie(object):
+    """Read-only autocomplete trie over a buffer produced by build.
+    The buffer is never copied.
+    """
+    def __init__(self, buffer, owner=None):
+        self._buffer = memoryview(buffer)
+        self._owner = owner
+        (magic, version, _, nodes, words, label_offset, first_offset,
+         count_offset, first_word_offset, word_count_offset, best_offset,
+         weight_offset, text_offset_offset, text_offset) =\
+            _HEADER.unpack_from(self._buffer, 0)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Not a jamo trie buffer.")
+        self._labels = self._array(label_offset, nodes, "I")
+        self._first_child = self._array(first_offset, nodes, "I")
+        self._child_count = self._array(count_offset, nodes, "I")
+        self._first_word = self._array(first_word_offset, nodes, "I")
+        self._word_count = self._array(word_count_offset, nodes, "I")
+        self._best = self._array(best_offset, nodes, "d")
+        self._weights = self._array(weight_offset, words, "d")
+        self._text_offsets = self._array(text_offset_offset, words + 1, "I")
+        self._text = self._buffer[text_offset:
+                                  text_offset + self._text_offsets[words]]
+
+    @classmethod
+    def from_words(cls, words):
+        """Build an in-memory trie; see build for the form of words.
+        """
+        return cls(build(words))
+
+    def _array(self, offset, count, fmt):
+        size = struct.calcsize(fmt)
+        return self._buffer[offset:offset + count * size].cast(fmt)
+
+    def _word(self, index):
+        return bytes(self._text[self._text_offsets[index]:
+                                self._text_offsets[index + 1]]
+                     ).decode("utf-8")
+
+    def _find(self, key):
+        """Return the node reached by key, or None.
+        """
+        node = 0
+        for char in key:
+            code = ord(char)
+            low = self._first_child[node]
+            high = low + self._child_count[node]
+            while low < high:
+                middle = (low + high) // 2
+                if self._labels[middle] < code:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low == self._first_child[node] + self._child_count[node] or\
+                    self._labels[low] != code:
+                return None
+            node = low
+        return node
+
+    def _ranked(self, node):
+        """Yield (word, weight) below node, heaviest first, ties in key
+        order.
+        """
+        heap = [(-self._best[node], 1, node)]
+        while heap:
+            _, kind, item = heapq.heappop(heap)
+            if kind == 0:
+                yield self._word(item), self._weights[item]
+                continue
+            first = self._first_word[item]
+            for word in range(first, first + self._word_count[item]):
+                heapq.heappush(heap, (-self._weights[word], 0, word))
+            first = self._first_child[item]
+            for child in range(first, first + self._child_count[item]):
+                heapq.heappush(heap, (-self._best[child], 1, child))
+
+    def complete(self, prefix, k=10, partial=True):
+        """Return up to k (word, weight) completions of prefix, heaviest
+        first.
+
+        With partial, the last syllable or letter of prefix may still be
+        completed, so "학" also finds "하구" and "호" finds "화분".
+        Otherwise words must start with prefix as it is written.
+        """
+        node = self._find(letters(prefix))
+        results = []
+        if node is None or k <= 0:
+            return results
+        for word, weight in self._ranked(node):
+            if partial or word.startswith(prefix):
+                results.append((word, weight))
+                if len(results) == k:
+                    break
+        return results
+
+    def __contains__(self, word):
+        node = self._find(letters(word))
+        if node is None:
+            return False
+        first = self._first_word[node]
+        return any(self._word(_) == word
+                   for _ in range(first, first + self._word_count[node]))
+
+    def __len__(self):
+        return len(self._weights)
+
+    def close(self):
+        """Release the views and close the underlying mapping, if any.
+        """
+        for view in (self._labels, self._first_child, self._child_count,
+                     self._first_word, self._word_count, self._best,
+                     self._weights,
+                     self._text_offsets, self._text, self._buffer):
+            view.release()
+        if self._owner is not None:
+            self._owner.close()
+            self._owner = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def save(path, words):
+    """Build a trie from words and write it to a file suitable for load.
+    """
+    with open(path, "wb") as fout:
+        fout.write(build(words))
+
+
+def load(path):
+    """Map a file written by save read-only and return a JamoTrie over it.
+    """
+    with open(path, "rb") as fin:
+        mapping = mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ)
+    return JamoTrie(mapping, owner=mapping)
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+"""Hangul decomposition and composition of UTF-8 bytes.
+
+Every syllable is three bytes of UTF-8 and decomposes into two or three
+conjoining jamo of three bytes each, so decomposed text is never more than
+three times as long as its input. decompose_into() and compose_into() read
+any bytes-like object, including a read-only mmap, and write straight into a
+caller's buffer, such as a reused bytearray or a writable mmap:
+
+    >>> from jamo import h2j
+    >>> from jamo.utf8 import compose, decompose
+    >>> data = "한국 ok".encode("utf-8")
+    >>> decompose(data) == h2j("한국 ok").encode("utf-8")
+    True
+    >>> compose(decompose(data)) == data
+    True
+
+Bytes that are not Hangul, including invalid UTF-8, are copied through
+unchanged. With NumPy, syllables are decomposed with vectorized arithmetic
+on the bytes. Otherwise the input is converted in chunks of chunk_size
+bytes with the str.translate table of the "table" backend, so no str larger
+than a chunk is ever built. Composition looks up the UTF-8 of the sequences
+that jamo.normalize.normalize composes, and gives the same result.
+
+transcode_file() converts a whole file through an mmap.
+"""
+
+import mmap
+import os
+import re
+
+from .backends import get_backend
+from .jamo import (_JAMO_OFFSET, _JAMO_LEAD_OFFSET, _JAMO_VOWEL_OFFSET,
+                   _JAMO_TAIL_OFFSET)
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+MODES = ("decompose", "compose")
+
+_TAIL = b"(?:\xe1\x86[\xa8-\xbf]|\xe1\x87[\x80-\x82])"
+_SYLLABLE = (b"(?:\xea[\xb0-\xbf][\x80-\xbf]|[\xeb\xec][\x80-\xbf]{2}|"
+             b"\xed[\x80-\x9d][\x80-\xbf]|\xed\x9e[\x80-\xa3])")
+# The sequences normalize() composes, as UTF-8.
+_COMPOSABLE = re.compile(b"\xe1\x84[\x80-\x92]\xe1\x85[\xa1-\xb5]" + _TAIL +
+                         b"?|" + _SYLLABLE + _TAIL)
+_COMPOSED = {}
+
+
+def _get_composed_table():
+    """Return {UTF-8 jamo sequence: UTF-8 syllable}, for every sequence
+    _COMPOSABLE matches, built on first use.
+    """
+    if not _COMPOSED:
+        for rem in range(11172):
+            syllable = chr(_JAMO_OFFSET + rem).encode("utf-8")
+            lead = chr(_JAMO_LEAD_OFFSET + 1 + rem // 588)
+            vowel = chr(_JAMO_VOWEL_OFFSET + 1 + rem % 588 // 28)
+            if rem % 28:
+                tail = chr(_JAMO_TAIL_OFFSET + rem % 28)
+                tailless = chr(_JAMO_OFFSET + rem - rem % 28)
+                _COMPOSED[(lead + vowel + tail).encode("utf-8")] = syllable
+                _COMPOSED[(tailless + tail).encode("utf-8")] = syllable
+            else:
+                _COMPOSED[(lead + vowel).encode("utf-8")] = syllable
+    return _COMPOSED
+
+
+def _compose(match):
+    return _COMPOSED.get(match.group(), match.group())
+
+
+def _splits(source, cut, mode):
+    """Test if source can be cut before offset cut: not inside a character,
+    nor in "compose" mode before a vowel or tail that may join a syllable.
+    """
+    byte = source[cut]
+    if 0x80 <= byte < 0xc0:
+        return False
+    return not (mode == "compose" and byte == 0xe1 and
+                cut + 1 < len(source) and
+                source[cut + 1] in (0x85, 0x86, 0x87))
+
+
+def _boundary(source, start, end, mode):
+    """Return the last offset in (start, end] where source can be cut, or
+    the first one after end if there is none.
+    """
+    if end >= len(source):
+        return len(source)
+    cut = end
+    while cut > start and not _splits(source, cut, mode):
+        cut -= 1
+    if cut > start:
+        return cut
+    cut = end
+    while cut < len(source) and not _splits(source, cut, mode):
+        cut += 1
+    return cut
+
+
+def _syllables(data):
+    """Return the offsets of the syllables in a uint8 array of UTF-8, their
+    indices from U+AC00, and the bytes each one grows by when decomposed.
+    """
+    if len(data) < 3:
+        empty = numpy.zeros(0, dtype=numpy.int64)
+        return empty, empty, empty
+    starts = numpy.flatnonzero((data[:-2] >= 0xea) & (data[:-2] <= 0xed))
+    first = data[starts].astype(numpy.int64)
+    second = data[starts + 1].astype(numpy.int64)
+    third = data[starts + 2].astype(numpy.int64)
+    code = (first & 0x0f) << 12 | (second & 0x3f) << 6 | third & 0x3f
+    syllable = (second & 0xc0 == 0x80) & (third & 0xc0 == 0x80) &\
+        (code >= _JAMO_OFFSET) & (code < _JAMO_OFFSET + 11172)
+    starts, code = starts[syllable], code[syllable]
+    rem = code - _JAMO_OFFSET
+    return starts, rem, numpy.where(rem % 28 > 0, 6, 3)
+
+
+def _decompose_numpy(source, target):
+    """Decompose the syllables of source into target with NumPy. Returns
+    the number of bytes written.
+    """
+    data = numpy.frombuffer(source, dtype=numpy.uint8)
+    size = len(data)
+    starts, rem, growth = _syllables(data)
+    tails = rem % 28
+    total = size + int(growth.sum())
+    if total > len(target):
+        raise ValueError("Output buffer too small.")
+    extra = numpy.zeros(size, dtype=numpy.int64)
+    extra[starts] = growth
+    shift = numpy.cumsum(extra)
+    covered = numpy.zeros(size, dtype=bool)
+    for index in range(3):
+        covered[starts + index] = True
+    out = numpy.frombuffer(target, dtype=numpy.uint8, count=total)
+    plain = numpy.flatnonzero(~covered)
+    out[plain + shift[plain]] = data[plain]
+    positions = starts + shift[starts] - growth
+    tailed = tails > 0
+    for where, jamo in ((positions, 0x1100 + rem // 588),
+                        (positions + 3, 0x1161 + rem % 588 // 28),
+                        (positions[tailed] + 6, 0x11a7 + tails[tailed])):
+        out[where] = 0xe1
+        out[where + 1] = 0x80 | (jamo >> 6) & 0x3f
+        out[where + 2] = 0x80 | jamo & 0x3f
+    return total
+
+
+def _decompose_str(source):
+    string = str(source, "utf-8", "surrogateescape")
+    return get_backend("table").h2j(string).encode("utf-8", "surrogateescape")
+
+
+def _transcode(data, out, offset, chunk_size, mode):
+    if mode == "compose":
+        _get_composed_table()
+    with memoryview(data) as source, memoryview(out) as target:
+        if source.format != "B":
+            source = source.cast("B")
+        if target.format != "B":
+            target = target.cast("B")
+        position = offset
+        start = 0
+        while start < len(source):
+            end = _boundary(source, start, start + chunk_size, mode)
+            if mode == "decompose" and numpy is not None:
+                position += _decompose_numpy(source[start:end],
+                                             target[position:])
+            else:
+                if mode == "decompose":
+                    converted = _decompose_str(source[start:end])
+                else:
+                    converted = _COMPOSABLE.sub(_compose, source[start:end])
+                if position + len(converted) > len(target):
+                    raise ValueError("Output buffer too small.")
+                target[position:position + len(converted)] = converted
+                position += len(converted)
+            start = end
+        return position - offset
+
+
+def decompose_into(data, out, offset=0, chunk_size=65536):
+    """Write the UTF-8 of data with its syllables decomposed into conjoining
+    jamo, as h2j does, into the writable buffer out from offset on.
+    Returns the number of bytes written.
+
+    3 * len(data) bytes of room are always enough. Raises ValueError if out
+    is too small, after writing what fitted.
+    """
+    return _transcode(data, out, offset, chunk_size, "decompose")
+
+
+def compose_into(data, out, offset=0, chunk_size=65536):
+    """Write the UTF-8 of data with its conjoining jamo composed into
+    syllables, as normalize does, into the writable buffer out from offset
+    on. Returns the number of bytes written, never more than len(data).
+    """
+    return _transcode(data, out, offset, chunk_size, "compose")
+
+
+def decompose(data):
+    """Return the UTF-8 bytes of data with its syllables decomposed.
+    """
+    out = bytearray(3 * len(data))
+    with memoryview(out) as view:
+        return bytes(view[:decompose_into(data, out)])
+
+
+def compose(data):
+    """Return the UTF-8 bytes of data with its conjoining jamo composed.
+    """
+    out = bytearray(len(data))
+    with memoryview(out) as view:
+        return bytes(view[:compose_into(data, out)])
+
+
+def transcode_file(source, target, mode="decompose", chunk_size=1 << 20):
+    """Decompose or compose the UTF-8 file at path source into a new file at
+    path target. source is mapped into memory and converted a chunk at a
+    time through a single reused buffer. Returns the size of target.
+    """
+    if mode not in MODES:
+        raise ValueError("Unknown mode {!r}, expected one of {}.".format(
+            mode, ", ".join(MODES)))
+    convert = decompose_into if mode == "decompose" else compose_into
+    factor = 3 if mode == "decompose" else 1
+    buffer = bytearray(factor * chunk_size)
+    written = 0
+    with open(source, "rb") as fin, open(target, "wb") as fout:
+        if not os.fstat(fin.fileno()).st_size:
+            return 0
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            with memoryview(data) as view:
+                start = 0
+                while start < len(view):
+                    end = _boundary(view, start, start + chunk_size, mode)
+                    if factor * (end - start) > len(buffer):
+                        buffer = bytearray(factor * (end - start))
+                    count = convert(view[start:end], buffer,
+                                    chunk_size=end - start)
+                    with memoryview(buffer) as output:
+                        fout.write(output[:count])
+                    written += count
+                    start = end
+    return written
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""Well-formedness of conjoining jamo sequences.
+
+A conjoining syllable is well formed when it follows the Unicode grammar
+L+ V+ T* | L* LV V* T* | L* LVT T*, where LV and LVT are precomposed
+syllables. Since every rule only relates neighbouring characters, a single
+pass over the string finds every problem:
+
+    >>> from jamo.validate import is_well_formed, validate
+    >>> is_well_formed("\\u1112\\u1161\\u11ab")
+    True
+    >>> validate("\\u11ab\\u1112")
+    [(0, 'orphan tail'), (1, 'missing vowel')]
+
+The problems are:
+
+    "orphan vowel"   a vowel that does not follow a lead or a vowel;
+    "orphan tail"    a tail that does not follow a vowel or a syllable, such
+                     as a tail typed before its lead;
+    "missing vowel"  a lead that is not followed by a vowel;
+    "mixed"          a run of HCJ written next to conjoining jamo.
+
+Text without conjoining jamo, including plain syllables and HCJ, is always
+well formed, and is recognized without a full scan.
+"""
+
+import re
+
+from .jamo import _JAMO_OFFSET, _HCJ_TO_JAMO
+
+PROBLEMS = ("orphan vowel", "orphan tail", "missing vowel", "mixed")
+
+_L = "\u1100-\u115f\ua960-\ua97c"
+_V = "\u1160-\u11a7\ud7b0-\ud7c6"
+_T = "\u11a8-\u11ff\ud7cb-\ud7fb"
+_SYLLABLES = "\uac00-\ud7a3"
+_LV = ''.join(chr(_) for _ in range(_JAMO_OFFSET, 0xd7a4, 28))
+_HCJ = "\u3131-\u318e"
+_CONJOINING = re.compile("[{}{}{}]".format(_L, _V, _T))
+_VOWEL = re.compile("[{}]".format(_V))
+_PROBLEM = re.compile(
+    "(?P<orphan_vowel>[{V}](?<![{L}{V}{LV}].))|"
+    "(?P<orphan_tail>[{T}](?<![{V}{T}{S}].))|"
+    "(?P<missing_vowel>[{L}](?![{L}{V}{S}]))|"
+    "(?P<mixed>[{H}](?<=[{L}{V}{T}].)[{H}]*|[{H}]+(?=[{L}{V}{T}]))".format(
+        L=_L, V=_V, T=_T, S=_SYLLABLES, LV=_LV, H=_HCJ))
+_MIXED = re.compile("[{1}](?<=[{0}].)[{1}]*|[{1}]+(?=[{0}])".format(
+    _L + _V + _T, _HCJ))
+
+
+def _position(char):
+    """Return "lead", "vowel" or "tail" for conjoining jamo, the position of
+    the last jamo of a syllable, or None.
+    """
+    code = ord(char) if char else 0
+    if 0x1100 <= code <= 0x115f or 0xa960 <= code <= 0xa97c:
+        return "lead"
+    if 0x1160 <= code <= 0x11a7 or 0xd7b0 <= code <= 0xd7c6:
+        return "vowel"
+    if 0x11a8 <= code <= 0x11ff or 0xd7cb <= code <= 0xd7fb:
+        return "tail"
+    if _JAMO_OFFSET <= code < _JAMO_OFFSET + 11172:
+        return "tail" if (code - _JAMO_OFFSET) % 28 else "vowel"
+    return None
+
+
+def _convert(match):
+    """Replace a run of HCJ next to conjoining jamo with conjoining jamo,
+    inferring the position of every consonant as hcj_to_hangul does.
+    """
+    string, run = match.string, match.group()
+    previous = string[match.start() - 1] if match.start() else ""
+    after = string[match.end():match.end() + 1]
+    result = []
+    for index, char in enumerate(run):
+        following = run[index + 1] if index + 1 < len(run) else after
+        following_vowel = following in _HCJ_TO_JAMO["vowel"] or\
+            _VOWEL.match(following) is not None
+        if char in _HCJ_TO_JAMO["vowel"]:
+            jamo = _HCJ_TO_JAMO["vowel"][char]
+        elif _position(previous) in ("vowel", "tail") and\
+                not following_vowel and char in _HCJ_TO_JAMO["tail"]:
+            jamo = _HCJ_TO_JAMO["tail"][char]
+        elif char in _HCJ_TO_JAMO["lead"]:
+            jamo = _HCJ_TO_JAMO["lead"][char]
+        else:
+            jamo = _HCJ_TO_JAMO["tail"].get(char, char)
+        result.append(jamo)
+        previous = jamo
+    return ''.join(result)
+
+
+def _fill(match):
+    """Insert the fillers that complete a syllable around a problem.
+    """
+    char, kind = match.group(), match.lastgroup
+    if kind == "orphan_vowel":
+        return "\u115f" + char
+    if kind == "orphan_tail":
+        # A lead right before gets its vowel filler from missing_vowel.
+        if _position(match.string[match.start() - 1:match.start()]) ==\
+                "lead":
+            return char
+        return "\u115f\u1160" + char
+    if kind == "missing_vowel":
+        return char + "\u1160"
+    return char
+
+
+def is_well_formed(string):
+    """Test if every conjoining jamo sequence in string is well formed.
+    """
+    if not _CONJOINING.search(string):
+        return True
+    return not _PROBLEM.search(string)
+
+
+def validate(string, repair=False):
+    """Return the problems of string as a list of (index, problem) pairs,
+    problem being one of PROBLEMS. A "mixed" problem is reported once, at
+    the start of the HCJ run.
+
+    With repair, return (repaired string, problems) instead. HCJ next to
+    conjoining jamo is converted to conjoining jamo, then syllables are
+    completed with the lead and vowel fillers U+115F and U+1160, so the
+    result is well formed. normalize() composes what can be composed.
+    """
+    if not _CONJOINING.search(string):
+        return (string, []) if repair else []
+    problems = [(match.start(), match.lastgroup.replace("_", " "))
+                for match in _PROBLEM.finditer(string)]
+    if not repair:
+        return problems
+    if problems:
+        string = _PROBLEM.sub(_fill, _MIXED.sub(_convert, string))
+    return string, problems
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the asyncio streaming adapters.
+"""
+import unittest
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo import aio
+from jamo.normalize import normalize
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+async def _source(chunks):
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+
+
+def _random_chunks(data, rng):
+    """Cut data into randomly sized pieces.
+    """
+    chunks = []
+    while data:
+        size = rng.randint(1, 7)
+        chunks.append(data[:size])
+        data = data[size:]
+    return chunks
+
+
+def _collect(stream):
+    async def run():
+        return ''.join([chunk async for chunk in stream])
+    return asyncio.run(run())
+
+
+class TestAio(unittest.TestCase):
+    def test_bytes_and_str_chunks(self):
+        """Converted chunks concatenate to the converted whole, even when
+        bytes chunks split UTF-8 sequences.
+        """
+        rng = random.Random(0)
+        text = "자모=字母 한국어 Do you speak 한국어?" * 20
+        for data in (text, text.encode("utf-8")):
+            chunks = _random_chunks(data, rng)
+            assert _collect(aio.h2j_stream(_source(chunks))) ==\
+                jamo.h2j(text)
+            assert _collect(aio.h2hcj_stream(_source(chunks),
+                                             max_chunk=5)) ==\
+                jamo.h2hcj(text)
+
+    def test_composing_streams(self):
+        """Composition is not cut apart at chunk boundaries.
+        """
+        rng = random.Random(1)
+        text = "한국어 닭이 달가 있어 과자!" * 20
+        hcj = jamo.h2hcj(text)
+        for _ in range(20):
+            chunks = _random_chunks(hcj, rng)
+            assert _collect(aio.hcj2h_stream(_source(chunks))) == text
+        nfd = jamo.h2j(text)
+        chunks = _random_chunks(nfd.encode("utf-8"), rng)
+        assert _collect(aio.normalize_stream(_source(chunks),
+                                             max_chunk=4)) ==\
+            normalize(nfd)
+
+    def test_bounded_pending(self):
+        """A run of conjoining jamo is passed on before the stream ends,
+        and still composes as a whole.
+        """
+        rng = random.Random(2)
+        text = ''.join(rng.choice(["\u1100", "\u1161", "\u11a8", "\u1175",
+                                   "\uac00", "\uac01", "a"])
+                       for _ in range(5000))
+        for chunks in (_random_chunks(text, rng), [text]):
+            assert _collect(aio.normalize_stream(_source(chunks),
+                                                 max_chunk=16)) ==\
+                normalize(text)
+        done = []
+
+        async def vowels():
+            for _ in range(100):
+                await asyncio.sleep(0)
+                yield "\u1161" * 1000
+            done.append(True)
+
+        async def first():
+            async for chunk in aio.normalize_stream(vowels()):
+                return chunk, bool(done)
+        chunk, finished = asyncio.run(first())
+        assert chunk == "\u1161" * 1000 and not finished
+
+    def test_offload(self):
+        """Large chunks are converted in the given executor.
+        """
+        text = "한국어" * 1000
+        with ThreadPoolExecutor(1) as executor:
+            assert _collect(aio.j2hcj_stream(
+                _source([jamo.h2j(text)]), offload_threshold=100,
+                executor=executor)) == jamo.h2hcj(text)
+
+
+if __name__ == "__main__":
+    unittest.main()
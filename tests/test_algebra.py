@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for syllable algebra.
+"""
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo.algebra import SyllableMap, substitute, variants
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+def _reference_substitute(string, leads, vowels, tails):
+    """Substitute through h2j and jamo_to_hangul, one syllable at a time.
+    """
+    result = []
+    for char in string:
+        if not jamo.is_hangul_char(char):
+            result.append(char)
+            continue
+        parts = jamo.j2hcj(jamo.h2j(char)) + " "
+        lead = leads.get(parts[0], parts[0])
+        vowel = vowels.get(parts[1], parts[1])
+        tail = tails.get(parts[2].strip(), parts[2].strip())
+        result.append(jamo.jamo_to_hangul(lead, vowel, tail))
+    return ''.join(result)
+
+
+class TestAlgebra(unittest.TestCase):
+    def test_substitute(self):
+        """substitute agrees with a decompose/recompose round trip.
+        """
+        every_hangul = ''.join(chr(_) for _ in range(0xac00, 0xd7a4))
+        mappings = [({}, {"ㅐ": "ㅔ", "ㅔ": "ㅐ"}, {}),
+                    ({"ㄱ": "ㄲ"}, {}, {"ㅆ": "ㅅ", "": "ㄴ"}),
+                    ({}, {}, {"ㄺ": ""})]
+        for leads, vowels, tails in mappings:
+            assert substitute(every_hangul + "자모=字母", leads, vowels,
+                              tails) ==\
+                _reference_substitute(every_hangul + "자모=字母", leads,
+                                      vowels, tails)
+        # U+11xx jamo work as mapping keys too.
+        assert substitute("있었다", tails={chr(0x11bb): chr(0x11ba)}) ==\
+            "잇엇다"
+        self.assertRaises(jamo.InvalidJamoError, SyllableMap,
+                          tails={"ㅆ": "ㄸ"})
+
+    def test_variants(self):
+        """variants yields the original first, then every combination.
+        """
+        trial = variants("개게", vowels={"ㅐ": "ㅔ", "ㅔ": "ㅐ"})
+        assert trial.__name__ == "<genexpr>"
+        assert list(trial) == ["개게", "개개", "게게", "게개"]
+        assert list(variants("한 a", leads={"ㅎ": "ㄱㄴ"},
+                             tails={"ㄴ": ["", "ㅇ"]})) ==\
+            ["한 a", "하 a", "항 a", "간 a", "가 a", "강 a",
+             "난 a", "나 a", "낭 a"]
+        assert list(variants("abc")) == ["abc"]
+
+
+if __name__ == "__main__":
+    unittest.main()
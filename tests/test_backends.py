@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""Differential tests for the selectable conversion backends.
+"""
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo import backends
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+class TestBackends(unittest.TestCase):
+    def tearDown(self):
+        jamo.set_backend("reference")
+
+    def test_differential(self):
+        """Every available backend agrees with the reference backend.
+        """
+        report = backends.differential_check(2000, seed=0)
+        assert "table" in report
+        for name, entry in report.items():
+            assert not entry["divergences"] and not entry["count"],\
+                "{} diverged: {}".format(name, entry["divergences"][:3])
+
+    @unittest.skipIf(backends.numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        """The numpy backend agrees with the reference backend.
+        """
+        report = backends.differential_check(2000, ["numpy"], seed=1)
+        assert not report["numpy"]["divergences"]
+
+    def test_surrogates(self):
+        """Lone surrogates pass through every backend unchanged.
+        """
+        for name in backends.available_backends():
+            assert jamo.h2j("a\ud800가", backend=name) ==\
+                "a\ud800\u1100\u1161", name
+            assert jamo.j2hcj("\udfff\u1100", backend=name) ==\
+                "\udfffㄱ", name
+
+    def test_divergence_count(self):
+        """Every divergence is counted, beyond the reported ones.
+        """
+        class Broken(object):
+            name = "broken"
+
+            def h2j(self, string):
+                return string + "!"
+
+        backends._BACKEND_TYPES["broken"] = Broken
+        try:
+            report = backends.differential_check(50, ["broken"], ("h2j",),
+                                                 seed=2, max_reports=3)
+        finally:
+            del backends._BACKEND_TYPES["broken"]
+            backends._INSTANCES.pop("broken", None)
+        assert report["broken"]["count"] == 50
+        assert len(report["broken"]["divergences"]) == 3
+
+    def test_set_backend(self):
+        """set_backend switches the process default; backend= overrides it
+        per call.
+        """
+        jamo.set_backend("table")
+        assert jamo.jamo._BACKEND is backends.get_backend("table")
+        decomposed = "\u1112\u1161\u11ab\u1100\u116e\u11af"
+        assert jamo.h2j("한굴") == decomposed
+        assert jamo.j2hcj(iter(decomposed)) == "ㅎㅏㄴㄱㅜㄹ"
+        assert jamo.h2j("한굴", backend="reference") == decomposed
+        jamo.set_backend("reference")
+        assert jamo.jamo._BACKEND is None
+        self.assertRaises(ValueError, jamo.set_backend, "fortran")
+        self.assertRaises(ValueError, jamo.h2j, "한", backend="fortran")
+
+
+if __name__ == "__main__":
+    unittest.main()
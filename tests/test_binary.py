@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the compact binary text format.
+"""
+import unittest
+import io
+import random
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo import binary
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+def _get_random_text(length, seed=0):
+    """Mix syllables, conjoining and compatibility jamo, and other text.
+    """
+    rng = random.Random(seed)
+    pools = [[chr(_) for _ in range(0xac00, 0xd7a4)],
+             [chr(_) for _ in range(0x1100, 0x1200)],
+             [chr(_) for _ in range(0x3131, 0x318f)],
+             list("abc 123\n字母é\U0001f600")]
+    return ''.join(rng.choice(rng.choice(pools)) for _ in range(length))
+
+
+class TestBinary(unittest.TestCase):
+    def test_round_trip(self):
+        """encode/decode and dumps/loads reproduce the input in both modes.
+        """
+        text = _get_random_text(5000) + jamo.h2j("한국어") + "a" * 20000
+        for mode in binary.MODES:
+            assert binary.decode(binary.encode(text, mode), mode) == text
+            assert binary.loads(binary.dumps(text, mode, 777)) == text
+        assert binary.loads(binary.dumps("")) == ""
+
+    def test_surrogates(self):
+        """Lone surrogates round-trip, alone and as a split pair.
+        """
+        text = "a\ud800\ud55c\udfff\u1100\ud83d\ude00" + "\udc00" * 5000
+        for mode in binary.MODES:
+            assert binary.decode(binary.encode(text, mode), mode) == text
+            assert binary.loads(binary.dumps(text, mode, 3)) == text
+
+    def test_jamo_runs(self):
+        """Jamo runs of every length take 7 bits per jamo plus padding.
+        """
+        rng = random.Random(2)
+        modern = jamo.h2j(''.join(chr(_) for _ in range(0xac00, 0xd7a4)))
+        for length in list(range(1, 40)) + [16383, 16384, 20000]:
+            run = ''.join(rng.choice(modern) for _ in range(length))
+            data = binary.encode(run, "jamo")
+            assert binary.decode(data, "jamo") == run
+            if length <= 16383:
+                assert len(data) == 2 + (7 * length + 7) // 8
+
+    def test_compact(self):
+        """Syllables take two bytes instead of three.
+        """
+        text = ''.join(chr(_) for _ in range(0xac00, 0xd7a4))
+        assert len(binary.encode(text)) == 2 * len(text)
+        decomposed = jamo.h2j(text)
+        assert len(binary.encode(decomposed, "jamo")) <\
+            len(decomposed.encode("utf-8")) // 3
+
+    def test_random_access(self):
+        """read(start, length) agrees with slicing the original text.
+        """
+        text = _get_random_text(3000, seed=1)
+        stream = io.BytesIO()
+        with binary.JamoWriter(stream, "jamo", chunk_size=100) as writer:
+            for start in range(0, len(text), 37):
+                writer.write(text[start:start + 37])
+        reader = binary.JamoReader(io.BytesIO(stream.getvalue()))
+        assert len(reader) == len(text)
+        assert reader.mode == "jamo"
+        for start, length in [(0, 10), (99, 2), (100, 100), (250, 1000),
+                              (2990, 50), (5000, 10)]:
+            assert reader.read(start, length) ==\
+                text[start:start + length], (start, length)
+        assert ''.join(reader.iter_chunks()) == text
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the conversion cache.
+"""
+import unittest
+import threading
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo.cache import cached
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+class TestCache(unittest.TestCase):
+    def test_cached_matches_converter(self):
+        """cached tests
+        A cached converter returns exactly what the wrapped converter does,
+        and counts hits and misses.
+        """
+        fast_h2j = cached(jamo.h2j)
+        for test in ["한국어", "자모=字母", "", "한국어"]:
+            assert fast_h2j(test) == jamo.h2j(test)
+        info = fast_h2j.cache_info()
+        assert (info.hits, info.misses, info.currsize) == (1, 3, 3), info
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted first, by count or bytes.
+        """
+        fast = cached(jamo.j2hcj, maxsize=2)
+        fast("가")
+        fast("나")
+        fast("가")
+        fast("다")
+        info = fast.cache_info()
+        assert info.evictions == 1 and info.currsize == 2, info
+        fast("가")
+        assert fast.cache_info().hits == 2
+        fast("나")
+        assert fast.cache_info().misses == 4
+
+        tiny = cached(jamo.h2j, maxsize=None, maxbytes=1)
+        tiny("한")
+        assert tiny.cache_info().currsize == 0
+        fast.cache_clear()
+        assert fast.cache_info() == (0, 0, 0, 2, 0, None, 0)
+
+    def test_tokenize(self):
+        """Tokenizing mode caches per whitespace-delimited word and keeps the
+        whitespace intact.
+        """
+        fast_h2j = cached(jamo.h2j, tokenize=True)
+        text = " 한국어  공부\n한국어\t"
+        assert fast_h2j(text) == jamo.h2j(text)
+        info = fast_h2j.cache_info()
+        assert (info.hits, info.misses) == (1, 2), info
+
+    def test_threads(self):
+        """Concurrent use keeps the statistics consistent.
+        """
+        fast = cached(jamo.h2j, maxsize=8)
+        words = [chr(0xac00 + _) for _ in range(32)]
+
+        def work():
+            for word in words * 10:
+                assert fast(word) == jamo.h2j(word)
+        threads = [threading.Thread(target=work) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        info = fast.cache_info()
+        assert info.hits + info.misses == 4 * 320
+        assert info.currsize <= 8
+
+
+if __name__ == "__main__":
+    unittest.main()
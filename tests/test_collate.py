@@ -0,0 +1,57 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for Hangul collation keys.
+"""
+import random
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo.collate import sort_key, sort_keys, hangul_sorted
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+class TestCollate(unittest.TestCase):
+    def test_sort_key(self):
+        """sort_key tests
+        Syllables, conjoining jamo and HCJ written alone collate together.
+        """
+        assert sort_key("한국") == sort_key(jamo.h2j("한국"))
+        assert sort_key("\u1100") == sort_key("ㄱ") ==\
+            sort_key("\u1100\u1160")
+        assert sort_key("ㄱㅏ") != sort_key("가")
+        assert len(sort_key("가A")) == 8
+        assert isinstance(sort_key(""), bytes)
+
+    def test_order(self):
+        """hangul_sorted tests
+        Other characters come first, letters before their syllables, and
+        archaic letters after the modern ones of their position.
+        """
+        assert hangul_sorted(["각", "ㄱ", "가나", "가", "A", "ㄲ", "ㅏ"]) ==\
+            ["A", "ㄱ", "가", "가나", "각", "ㄲ", "ㅏ"]
+        # 가 with an archaic tail, and an archaic lead with ㅏ.
+        archaic = ["가\u11eb", "\u1140\u1161"]
+        assert hangul_sorted(archaic + ["갛", "하"]) ==\
+            ["갛", archaic[0], "하", archaic[1]]
+        assert hangul_sorted(["가", "나"], reverse=True) == ["나", "가"]
+
+    def test_modern(self):
+        """Modern syllables collate in code point order, and so do their
+        decompositions.
+        """
+        rng = random.Random(0)
+        strings = [''.join(chr(rng.randrange(0xac00, 0xd7a4))
+                           for _ in range(rng.randrange(4)))
+                   for _ in range(2000)]
+        assert hangul_sorted(strings) == sorted(strings)
+        keys = sort_keys(jamo.h2j(_) for _ in strings)
+        assert keys == sort_keys(strings)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the pandas and Arrow column operations.
+"""
+import os
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo import columns
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+ROWS = ["한국어 사전", None, "", "Korean", "각.", "값", "ㄱ", "3", "ok 각"]
+
+
+@unittest.skipIf(columns.pyarrow is None or columns.numpy is None,
+                 "pyarrow is not installed")
+class TestArrow(unittest.TestCase):
+    def _expected(self, convert):
+        return [None if row is None else convert(row) for row in ROWS]
+
+    def test_h2j(self):
+        """h2j tests
+        Every chunk size and string type gives the results of jamo.h2j.
+        """
+        pyarrow = columns.pyarrow
+        for type in (pyarrow.string(), pyarrow.large_string()):
+            array = pyarrow.array(ROWS * 3, type=type)
+            for chunk_size in (1, 4, 65536):
+                result = columns.h2j(array, chunk_size=chunk_size)
+                assert result.type == type
+                assert result.to_pylist() == self._expected(jamo.h2j) * 3
+        sliced = pyarrow.array(ROWS).slice(3)
+        assert columns.h2j(sliced).to_pylist() ==\
+            self._expected(jamo.h2j)[3:]
+
+    def test_chosung(self):
+        """chosung tests
+        """
+        pyarrow = columns.pyarrow
+        array = pyarrow.chunked_array([ROWS[:4], ROWS[4:], []],
+                                      type=pyarrow.string())
+        result = columns.chosung(array, chunk_size=2)
+        assert isinstance(result, pyarrow.ChunkedArray)
+        assert result.to_pylist()[:4] == ["ㅎㄱㅇ ㅅㅈ", None, "", "Korean"]
+        assert result.to_pylist()[4:] == ["ㄱ.", "ㄱ", "ㄱ", "3", "ok ㄱ"]
+
+    def test_has_tail(self):
+        """has_tail tests
+        Rows not ending in a syllable give the results of jamo.has_tail.
+        """
+        pyarrow = columns.pyarrow
+        for chunk_size in (1, 4, 65536):
+            result = columns.has_tail(pyarrow.array(ROWS),
+                                      chunk_size=chunk_size)
+            assert result.type == pyarrow.bool_()
+            assert result.to_pylist() == self._expected(jamo.has_tail)
+        assert len(columns.has_tail(pyarrow.array([], pyarrow.string()))) == 0
+
+
+@unittest.skipIf(columns.pandas is None, "pandas is not installed")
+class TestPandas(unittest.TestCase):
+    def test_accessor(self):
+        """Series.jamo tests
+        """
+        series = columns.pandas.Series(["한국어", "사전", "3"], name="word",
+                                       index=[3, 1, 2])
+        result = series.jamo.h2j()
+        assert list(result) == [jamo.h2j(_) for _ in series]
+        assert list(result.index) == [3, 1, 2] and result.name == "word"
+        assert list(series.jamo.chosung()) == ["ㅎㄱㅇ", "ㅅㅈ", "3"]
+        assert list(series.jamo.has_tail()) == [False, True, True]
+
+    def test_accessor_missing(self):
+        """Series.jamo keeps missing rows as they were
+        """
+        series = columns.pandas.Series(["한국어", None, float("nan"), "각"],
+                                       dtype=object)
+        for name, function in (("h2j", jamo.h2j),
+                               ("chosung", columns._chosung),
+                               ("has_tail", jamo.has_tail)):
+            result = getattr(series.jamo, name)()
+            expected = series.map(function, na_action="ignore")
+            assert result[1] is None and result[2] != result[2], name
+            assert list(result[[0, 3]]) == list(expected[[0, 3]]), name
+
+if __name__ == "__main__":
+    unittest.main()
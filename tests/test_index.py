@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the on-disk inverted index.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+from jamo import index
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+TITLES = ["한국어 사전", "학교 급식", "한글", "국어 교과서", "Korean 사전"]
+
+
+class TestIndex(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def _build(self, texts, **kwargs):
+        path = os.path.join(self.directory, "titles.idx")
+        index.build(texts, path, **kwargs)
+        return index.load(path)
+
+    def test_document_key(self):
+        """document_key tests
+        """
+        assert index.document_key("한국 A") == "ㅎㅏㄴㄱㅜㄱ A"
+        assert index.document_key("한국 A", mode="chosung") == "ㅎㄱ A"
+        self.assertRaises(ValueError, index.document_key, "한", mode="x")
+
+    def test_jamo(self):
+        """InvertedIndex tests in jamo mode
+        Queries may end in a syllable that is still being composed.
+        """
+        with self._build(TITLES) as titles:
+            assert len(titles) == 5 and titles.mode == "jamo"
+            assert titles.search("국어") == [0, 3]
+            assert titles.search("사전") == [0, 4]
+            assert titles.search("국ㅇ") == [0, 3]
+            assert titles.search("ㄴ") == [0, 2, 4]
+            assert titles.search("어학") == []
+            assert titles.search("") == [0, 1, 2, 3, 4]
+            assert titles.prefix("한ㄱ") == [0, 2]
+            assert titles.prefix("학") == [1]
+            assert titles.prefix("Kor") == [4]
+            assert list(titles.postings("ㄱㅡㄹ")) == [2]
+            assert titles.key(2) == "ㅎㅏㄴㄱㅡㄹ"
+
+    def test_chosung(self):
+        """InvertedIndex tests in chosung mode
+        """
+        with self._build(TITLES, mode="chosung", n=2) as titles:
+            assert titles.prefix("ㅎㄱ") == [0, 1, 2]
+            assert titles.prefix("한국") == [0, 1, 2]
+            assert titles.search("ㄱㅅ") == [1, 3]
+            assert titles.search("ㅅㅈ") == [0, 4]
+
+    def test_parallel_build(self):
+        """Indexes built in parallel chunks are identical.
+        """
+        texts = TITLES * 20
+        serial = os.path.join(self.directory, "serial.idx")
+        parallel = os.path.join(self.directory, "parallel.idx")
+        index.build(texts, serial)
+        index.build(iter(texts), parallel, processes=2, chunk_size=7)
+        with open(serial, "rb") as first, open(parallel, "rb") as second:
+            assert first.read() == second.read()
+        with index.load(parallel) as titles:
+            assert titles.search("급식") == list(range(1, 100, 5))
+
+    def test_spilled_runs(self):
+        """Indexes merged from many spilled runs, over several levels when
+        there are more than can be open at once, are identical, and the runs
+        are removed.
+        """
+        texts = TITLES * 7 + ["\U0001f600 사전", ""]
+        whole = os.path.join(self.directory, "whole.idx")
+        runs = os.path.join(self.directory, "runs.idx")
+        index.build(texts, whole)
+        index.build((_ for _ in texts), runs, chunk_size=3)
+        with open(whole, "rb") as first, open(runs, "rb") as second:
+            assert first.read() == second.read()
+        fan_in, index._FAN_IN = index._FAN_IN, 2
+        try:
+            index.build((_ for _ in texts), runs, chunk_size=3)
+        finally:
+            index._FAN_IN = fan_in
+        with open(whole, "rb") as first, open(runs, "rb") as second:
+            assert first.read() == second.read()
+        assert sorted(os.listdir(self.directory)) == ["runs.idx",
+                                                      "whole.idx"]
+        with index.load(runs) as titles:
+            assert titles.search("사전") == [0, 4, 5, 9, 10, 14, 15, 19,
+                                             20, 24, 25, 29, 30, 34, 35]
+        with self._build([]) as titles:
+            assert len(titles) == 0 and titles.search("사전") == []
+
+    def test_invalid(self):
+        """Buffers that are not indexes are rejected.
+        """
+        self.assertRaises(ValueError, index.InvertedIndex, b"\0" * 128)
+        self.assertRaises(ValueError, index.build, [], "unused", mode="x")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -7,6 +7,7 @@ import unittest
 import random
 import itertools
 import io
+import unicodedata
 
 # +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
 import os
@@ -449,6 +450,90 @@ class TestJamo(unittest.TestCase):
                                               trial=trial,
                                               target=target)
 
+    def test_hangul_to_jamo_chunks(self):
+        """hangul_to_jamo_chunks tests
+        Arguments may be any iterable of strings.
+
+        hangul_to_jamo_chunks should yield strings that concatenate to the
+        output of h2j, each at most chunk_size long.
+        """
+        lines = ["Do you speak 한국어?\n", "", "자모=字母\n" * 50,
+                 ''.join(_get_random_hangul(500))]
+        target = jamo.h2j(''.join(lines))
+        for chunk_size in (1, 7, 100, 8192):
+            trial = list(jamo.hangul_to_jamo_chunks(iter(lines), chunk_size))
+            assert ''.join(trial) == target
+            assert all(len(_) <= 3 * chunk_size for _ in trial)
+        assert list(jamo.hangul_to_jamo_chunks([])) == []
+        self.assertRaises(ValueError, list,
+                          jamo.hangul_to_jamo_chunks(lines, 0))
+
+    def test_jamo_to_hcj_chunks(self):
+        """jamo_to_hcj_chunks tests
+        jamo_to_hcj_chunks should yield strings that concatenate to the
+        output of j2hcj.
+        """
+        lines = [jamo.h2j(''.join(_get_random_hangul(100))), "abc", "\n"]
+        target = jamo.j2hcj(''.join(lines))
+        for chunk_size in (1, 30, 8192):
+            trial = jamo.jamo_to_hcj_chunks(lines, chunk_size,
+                                            backend="table")
+            assert ''.join(trial) == target
+        # Only the last chunk is short, however the input is split.
+        lines = ["\u1100" * 8193, "a" * 3000, "b" * 3000, "c"]
+        trial = list(jamo.jamo_to_hcj_chunks(lines, 8192))
+        assert [len(_) for _ in trial] == [8192, 6002]
+        assert ''.join(trial) == jamo.j2hcj(''.join(lines))
+        trial = jamo.jamo_to_hcj_chunks(["\u1100" * 8193], 8192)
+        assert [len(_) for _ in trial] == [8192, 1]
+
+    def test_hangul_to_hcj(self):
+        """hangul_to_hcj tests
+        Arguments may be iterables or characters.
+
+        hangul_to_hcj should give the same characters as
+        jamo_to_hcj(hangul_to_jamo(...)), optionally splitting compounds.
+        """
+        tests = ["한굴", "자모=字母", "닭", "", "ㄳ" + chr(0x11aa)]
+        for test in itertools.chain(tests, _get_random_hangul(100)):
+            trial = jamo.hangul_to_hcj(test)
+            assert trial.__name__ == "<genexpr>",\
+                ("hangul_to_hcj didn't return"
+                 "an instance of a generator.")
+            trial = tuple(trial)
+            target = tuple(jamo.jamo_to_hcj(jamo.hangul_to_jamo(test)))
+            assert trial == target,\
+                ("Converted {test} to {trial}, but "
+                 "expected {target}.").format(test=test, trial=trial,
+                                              target=target)
+        assert tuple(jamo.hangul_to_hcj("닭", split_compounds=True)) ==\
+            ("ㄷ", "ㅏ", "ㄹ", "ㄱ")
+
+    def test_h2hcj(self):
+        """h2hcj tests
+        Arguments may be iterables or characters.
+
+        h2hcj is the single pass equivalent of j2hcj(h2j(...)).
+        """
+        every_hangul = ''.join(chr(_) for _ in range(0xac00, 0xd7a4))
+        tests = [every_hangul, "자모=字母", "test123~", "ㄱㄲㄴㄷㆆㅿ",
+                 "한굴", list("한굴")]
+        for test in tests:
+            target = jamo.j2hcj(jamo.h2j(test))
+            trial = jamo.h2hcj(test)
+            assert trial == target,\
+                ("Converted {test} to {trial}, but "
+                 "expected {target}.").format(test=test, trial=trial,
+                                              target=target)
+        tests = ["닭과", "ㄲㅢ", "값" + chr(0x11aa)]
+        targets = ["ㄷㅏㄹㄱㄱㅗㅏ", "ㄱㄱㅡㅣ", "ㄱㅏㅂㅅㄱㅅ"]
+        for test, target in zip(tests, targets):
+            trial = jamo.h2hcj(test, split_compounds=True)
+            assert trial == target,\
+                ("Converted {test} to {trial}, but "
+                 "expected {target}.").format(test=test, trial=trial,
+                                              target=target)
+
     def test_jamo_to_hangul(self):
         """jamo_to_hangul tests
         Arguments may be jamo characters including HCJ. Throws an
@@ -541,6 +626,44 @@ class TestJamo(unittest.TestCase):
         assert jamo.j2h('ㅎ', 'ㅏ') == "하",\
             "j2h doesn't work. Hint: it's the same as jamo_to_hangul."
 
+    def test_hcj_to_hangul(self):
+        """hcj_to_hangul tests
+        Arguments may be strings or iterables of strings.
+
+        hcj_to_hangul should compose HCJ into Hangul, taking a consonant
+        before a vowel as a lead and merging compound vowels and consonant
+        clusters, but never two letters into a double consonant.
+        """
+        tests = ["ㅎㅏㄴㄱㅜㄱ", "ㄷㅏㄹㄱㅇㅣ", "ㄷㅏㄹㄱㅏ", "ㅇㅣㅅㅅㅓ",
+                 "ㄱㅗㅏㅇ", "ㅂㅏㄳㅣ", "ㅎㅏ ㄴㅏ!", "ㄱㄱㅏ", "ㅏㅏ", "",
+                 ["ㅎㅏ", "ㄴㄱㅜ", "ㄱ"], "ㄱㅏㄱㄱ", "ㅅㅏㅅㅅ", "ㄱㅏㄱㄱㅏ",
+                 "ㄱㅏㄲ", "ㄱㅏㄲㅏ", "ㄱㅏㄱㅅ", "ㅂㅏㅂㅂ", "ㄷㄷㅏㄷ", "ㅈㅏㅈㅈ"]
+        targets = ["한국", "닭이", "달가", "잇서", "광", "박시", "하 나!",
+                   "ㄱ가", "ㅏㅏ", "", "한국", "각ㄱ", "삿ㅅ", "각가", "갂",
+                   "가까", "갃", "밥ㅂ", "ㄷ닫", "잦ㅈ"]
+        for test, target in zip(tests, targets):
+            trial = jamo.hcj_to_hangul(test)
+            assert trial.__name__ == "hcj_to_hangul",\
+                ("hcj_to_hangul didn't return"
+                 "an instance of a generator.")
+            trial = ''.join(trial)
+            assert trial == target,\
+                ("Composed {test} to {trial}, but "
+                 "expected {target}.").format(test=test, trial=trial,
+                                              target=target)
+
+    def test_hcj2h(self):
+        """hcj2h tests
+        hcj2h is the inverse of h2hcj for modern Hangul.
+        """
+        for _ in range(20):
+            test = ''.join(_get_random_hangul(50)) + " 값이 " +\
+                ''.join(_get_random_hangul(50))
+            trial = jamo.hcj2h(jamo.h2hcj(test))
+            assert trial == test,\
+                ("Composed {test} to {trial}.").format(test=test,
+                                                       trial=trial)
+
     def test_decompose_jamo(self):
         """decompose_jamo tests
         Arguments should be compound jamo - double consonants, consonant
@@ -697,6 +820,56 @@ class TestJamo(unittest.TestCase):
                 ("Incorrectly decided U+{} "
                  "was jamo.").format(hex(ord(invalid_case))[2:])
 
+    def test_tail_of(self):
+        """tail_of and has_tail tests
+        The tail of the last syllable is read without decomposition. Digits
+        and Latin letters are read by their Korean names; anything else is
+        undetermined.
+        """
+        for syllable in _get_random_hangul(100):
+            target = jamo.h2j(syllable)[2:]
+            assert jamo.tail_of("단어" + syllable + ")") == target
+            assert jamo.has_tail(syllable) == bool(target)
+        tests = ["서울", "사과", jamo.h2j("밥"), "CD", "Excel", "7", "100",
+                 "1000", "字", "", "!"]
+        targets = [chr(0x11af), "", chr(0x11b8), "", chr(0x11af),
+                   chr(0x11af), chr(0x11a8), chr(0x11ab), None, None, None]
+        for test, target in zip(tests, targets):
+            trial = jamo.tail_of(test)
+            assert trial == target,\
+                ("tail_of({test}) returned {trial}, but expected "
+                 "{target}.").format(test=test, trial=trial, target=target)
+        assert jamo.has_tail("字") is None
+        # Numbers ending in zeros end in their largest unit.
+        for number, target in [("10", 0x11b8), ("100000", 0x11ab),
+                               ("1000000", 0x11ab), ("12000000", 0x11ab),
+                               ("1,000", 0x11ab), ("1,000,000", 0x11ab),
+                               ("10_000", 0x11ab), ("3,200", 0x11a8),
+                               ("100000000", 0x11a8), ("10" + "0" * 11, 0),
+                               ("1" + "0" * 16, 0x11bc),
+                               ("5" + "0" * 20, 0x11bc), ("0", 0x11bc),
+                               ("1,0", 0x11b8), ("a,000", 0x11bc)]:
+            target = chr(target) if target else ""
+            assert jamo.tail_of(number) == target, number
+
+    def test_unicode_names(self):
+        """_get_unicode_name tests
+        Every character accepted by is_jamo, including Hangul Jamo
+        Extended-A and Extended-B, has its Unicode name available.
+        """
+        valid_extA = (chr(_) for _ in range(0xa960, 0xa97d))
+        valid_extB = itertools.chain((chr(_) for _ in range(0xd7b0, 0xd7c7)),
+                                     (chr(_) for _ in range(0xd7cb, 0xd7fc)))
+        all_jamo = (chr(_) for _ in range(0x1100, 0xd800))
+        for char in itertools.chain(valid_extA, valid_extB, all_jamo):
+            if jamo.is_jamo(char):
+                assert jamo.jamo._get_unicode_name(char) ==\
+                    unicodedata.name(char),\
+                    "Wrong name for U+{}.".format(hex(ord(char))[2:])
+        # Extended jamo have no HCJ equivalent and are echoed back.
+        assert jamo.j2hcj("\ua960\ud7b0\ud7cb") == "\ua960\ud7b0\ud7cb"
+        assert jamo.hcj_to_jamo("ㄸ", "tail") == "\ud7cd"
+
     def test_synth_hangul(self):
         # To be implemented in a future version
         pass
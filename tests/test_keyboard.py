@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for keyboard transliteration.
+"""
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo.keyboard import (h2keys, hangul_to_keys, keys2h, keys_to_hangul,
+                           wrong_layout_score, detect_wrong_layout)
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+class TestKeyboard(unittest.TestCase):
+    def test_h2keys(self):
+        """h2keys tests
+        Compound letters without a key of their own are split.
+        """
+        tests = ["안녕하세요", "닭", "과자", "꽃", "값", "ㅘㄳ",
+                 jamo.h2j("한글"), "a1 !"]
+        targets = ["dkssudgktpdy", "ekfr", "rhkwk", "Rhc", "rkqt", "hkrt",
+                   "gksrmf", "a1 !"]
+        for test, target in zip(tests, targets):
+            assert h2keys(test) == target, (test, h2keys(test))
+        assert list(hangul_to_keys(["안녕", "!"])) == ["dkssud", "!"]
+
+    def test_keys2h(self):
+        """keys2h tests
+        keys2h composes keystrokes and inverts h2keys on modern Hangul.
+        """
+        every_hangul = ''.join(chr(_) for _ in range(0xac00, 0xd7a4))
+        assert keys2h(h2keys(every_hangul)) == every_hangul
+        assert keys2h("DKSSUD") == "안녕"
+        assert keys2h("gksrmf 123") == "한글 123"
+        # Double consonants only come from the shifted keys.
+        for keys, hangul in [("rkrr", "각ㄱ"), ("tktt", "삿ㅅ"), ("rkR", "갂"),
+                             ("tkT", "샀"), ("rrk", "ㄱ가"), ("Rk", "까"),
+                             ("rkrt", "갃"), ("ekfr", "닭")]:
+            assert keys2h(keys) == hangul, (keys, keys2h(keys))
+        trial = keys_to_hangul(["dkss", "ud"])
+        assert trial.__name__ == "hcj_to_hangul"
+        assert ''.join(trial) == "안녕"
+
+    def test_detect_wrong_layout(self):
+        """Mistyped Korean scores high, English and Hangul score low.
+        """
+        assert wrong_layout_score("dkssudgktpdy") == 1.0
+        for english in ["hello", "python", "the", "apple", "test"]:
+            assert wrong_layout_score(english) < 0.75, english
+        assert wrong_layout_score("안녕") == 0.0
+        assert wrong_layout_score("123") == 0.0
+        assert detect_wrong_layout(["tjdnf", "hello", "한글", ""]) ==\
+            ["서울", None, None, None]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for MinHash near-duplicate detection.
+"""
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+from jamo import minhash
+from jamo.minhash import (MinHasher, LSHIndex, shingles, similarity,
+                          find_duplicates)
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+TEXTS = ["오늘은 날씨가 정말 좋습니다. 산책을 나가 볼까요?",
+         "전혀 관계없는 문장이 여기에 있습니다.",
+         "오늘은 날씨가 정말 좋읍니다. 산책을 나가 볼까요?",
+         "오늘은  날씨가 정말 좋습니다.  산책을 나가 볼까요?"]
+
+
+class TestMinHash(unittest.TestCase):
+    def test_shingles(self):
+        """shingles tests
+        Shingles are made of jamo, so one changed vowel keeps most of them.
+        """
+        assert shingles("한", k=5) == {"\u1112\u1161\u11ab"}
+        assert shingles("  ") == set()
+        first, second = shingles(TEXTS[0]), shingles(TEXTS[2])
+        assert len(first & second) / len(first | second) > 0.75
+        assert shingles(TEXTS[0]) == shingles(TEXTS[3])
+
+    def test_signature(self):
+        """MinHasher tests
+        Signatures are deterministic and estimate Jaccard similarity.
+        """
+        hasher = MinHasher(num_perm=64, seed=3)
+        signature = hasher.signature(TEXTS[0])
+        assert len(signature) == 64
+        assert signature == MinHasher(num_perm=64, seed=3).signature(TEXTS[0])
+        assert similarity(signature, hasher.signature(TEXTS[3])) == 1.0
+        assert similarity(signature, hasher.signature(TEXTS[2])) > 0.6
+        assert similarity(signature, hasher.signature(TEXTS[1])) < 0.2
+        assert hasher.signatures(TEXTS) ==\
+            [hasher.signature(_) for _ in TEXTS]
+        assert hasher.signatures(TEXTS, processes=2) ==\
+            hasher.signatures(TEXTS)
+        assert hasher.signature("") == (0xffffffff,) * 64
+
+    @unittest.skipIf(minhash.numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        """NumPy and pure Python signatures are the same.
+        """
+        hasher = MinHasher()
+        vectorized = hasher.signatures(TEXTS)
+        block, minhash._BLOCK = minhash._BLOCK, 3
+        try:
+            assert hasher.signatures(TEXTS) == vectorized
+        finally:
+            minhash._BLOCK = block
+        numpy, minhash.numpy = minhash.numpy, None
+        try:
+            assert hasher.signatures(TEXTS) == vectorized
+        finally:
+            minhash.numpy = numpy
+
+    def test_index(self):
+        """LSHIndex tests
+        Near duplicates are candidates; indexes can be filled separately and
+        merged.
+        """
+        hasher = MinHasher()
+        signatures = hasher.signatures(TEXTS)
+        index = LSHIndex(threshold=0.5)
+        index.insert_many(enumerate(signatures[:2]))
+        assert len(index) == 2 and 1 in index
+        assert 0 in index.query(signatures[2])
+        assert [key for key, _ in index.duplicates(signatures[3])] == [0]
+        self.assertRaises(ValueError, index.insert, 0, signatures[0])
+        self.assertRaises(ValueError, index.query, signatures[0][:10])
+        other = LSHIndex(threshold=0.5)
+        other.insert(2, signatures[2])
+        index.update(other)
+        assert index.query(signatures[0]) == {0, 2}
+        self.assertRaises(ValueError, index.update, LSHIndex(bands=4))
+        self.assertRaises(ValueError, LSHIndex, bands=5)
+
+    def test_find_duplicates(self):
+        """find_duplicates tests
+        """
+        pairs = find_duplicates(TEXTS, threshold=0.6)
+        assert [_[:2] for _ in pairs] == [(0, 2), (0, 3), (2, 3)]
+        assert pairs[1][2] == 1.0
+
+if __name__ == "__main__":
+    unittest.main()
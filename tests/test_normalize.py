@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for Hangul NFC normalization.
+"""
+import unittest
+import os
+import random
+import shutil
+import tempfile
+import unicodedata
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo.normalize import is_normalized, normalize, repair_tree
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+class TestNormalize(unittest.TestCase):
+    def test_normalize(self):
+        """normalize agrees with unicodedata NFC on Hangul text.
+        """
+        every_hangul = ''.join(chr(_) for _ in range(0xac00, 0xd7a4))
+        nfd = unicodedata.normalize("NFD", every_hangul)
+        assert normalize(nfd) == every_hangul
+        assert not is_normalized(nfd)
+        assert is_normalized(every_hangul)
+        assert is_normalized("plain ascii")
+        rng = random.Random(0)
+        pool = [chr(_) for _ in range(0x1100, 0x1200)] +\
+            [chr(_) for _ in range(0xac00, 0xac40)] + ["a", "ㄱ"]
+        for _ in range(5000):
+            test = ''.join(rng.choice(pool) for _ in range(rng.randint(0, 8)))
+            target = unicodedata.normalize("NFC", test)
+            assert normalize(test) == target, [hex(ord(_)) for _ in test]
+            assert is_normalized(test) == (test == target)
+
+    def test_repair_tree(self):
+        """repair_tree reports in dry runs and renames/rewrites otherwise.
+        """
+        root = tempfile.mkdtemp()
+        try:
+            directory = os.path.join(root, jamo.h2j("폴더"))
+            os.mkdir(directory)
+            with open(os.path.join(directory, jamo.h2j("한글.txt")), "w",
+                      encoding="utf-8") as fout:
+                fout.write(jamo.h2j("내용"))
+            with open(os.path.join(root, "plain.txt"), "w") as fout:
+                fout.write("plain")
+            changes = repair_tree(root, rewrite=True, workers=2)
+            assert sorted(_.kind for _ in changes) ==\
+                ["rename", "rename", "rewrite"], changes
+            assert os.path.isdir(directory)
+
+            repair_tree(root, rewrite=True, dry_run=False, workers=2)
+            path = os.path.join(root, "폴더", "한글.txt")
+            with open(path, encoding="utf-8") as fin:
+                assert fin.read() == "내용"
+            assert repair_tree(root, rewrite=True, workers=2) == []
+        finally:
+            shutil.rmtree(root)
+
+
+if __name__ == "__main__":
+    unittest.main()
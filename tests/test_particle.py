@@ -0,0 +1,58 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for particle selection.
+"""
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo.particle import attach_particle, select_particle
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+class TestParticle(unittest.TestCase):
+    def test_attach_particle(self):
+        """attach_particle tests
+        Every accepted spelling of a particle picks the same forms.
+        """
+        words = ["책", "사과", "서울", "물", ""]
+        for particle in ["을/를", "를/을", "을", "를"]:
+            assert attach_particle(words, particle) ==\
+                ["책을", "사과를", "서울을", "물을", "을(를)"]
+        assert attach_particle(words, "은/는") ==\
+            ["책은", "사과는", "서울은", "물은", "은(는)"]
+        assert attach_particle(words, "이/가") ==\
+            ["책이", "사과가", "서울이", "물이", "이(가)"]
+        assert attach_particle(words, "와") ==\
+            ["책과", "사과와", "서울과", "물과", "과(와)"]
+        # ㄹ tails take 로, not 으로.
+        assert attach_particle(words, "(으)로") ==\
+            ["책으로", "사과로", "서울로", "물로", "(으)로"]
+        assert attach_particle(words, "으로부터") ==\
+            ["책으로부터", "사과로부터", "서울로부터", "물로부터",
+             "(으)로부터"]
+        assert attach_particle(words, "(이)랑") ==\
+            ["책이랑", "사과랑", "서울이랑", "물이랑", "(이)랑"]
+        self.assertRaises(ValueError, attach_particle, words, "에게")
+
+    def test_select_particle(self):
+        """Non-Hangul and decomposed final characters are read sensibly.
+        """
+        cases = [("Apple", "을/를", "를"), ("URL", "은/는", "은"),
+                 ("10", "이/가", "이"), ("2", "이/가", "가"),
+                 ("'집'", "을/를", "을"), ("字", "을/를", "을(를)"),
+                 (jamo.h2j("물"), "(으)로", "로"),
+                 (jamo.h2j("사과"), "은/는", "는")]
+        for word, particle, target in cases:
+            assert select_particle(word, particle) == target,\
+                (word, particle, select_particle(word, particle))
+            assert attach_particle([word], particle) == [word + target]
+
+
+if __name__ == "__main__":
+    unittest.main()
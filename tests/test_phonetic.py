@@ -0,0 +1,45 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for phonetic keys.
+"""
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo.phonetic import phonetic_key, phonetic_keys, block
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+class TestPhonetic(unittest.TestCase):
+    def test_phonetic_key(self):
+        """phonetic_key tests
+        Names that sound alike get the same key, others do not.
+        """
+        alike = [("김", "낌"), ("명", "면"), ("박", "팍"), ("재", "제"),
+                 ("최", "췌"), ("정", "쩡"), ("의", "이"), ("좋", "조")]
+        for first, second in alike:
+            assert phonetic_key(first) == phonetic_key(second),\
+                (first, second)
+        different = [("김", "남"), ("박", "반"), ("이", "오"), ("길", "긴")]
+        for first, second in different:
+            assert phonetic_key(first) != phonetic_key(second),\
+                (first, second)
+        assert phonetic_key("김 명수") == phonetic_key(jamo.h2j("낌면쑤"))
+        assert phonetic_key("김명수", max_length=1) == phonetic_key("김")
+        assert phonetic_key("abc") == ""
+
+    def test_block(self):
+        """block tests
+        block groups positions by key in order of first appearance.
+        """
+        names = ["김명수", "이영희", "낌면쑤", "리영히"]
+        assert phonetic_keys(names) == [phonetic_key(_) for _ in names]
+        assert list(block(iter(names)).values()) == [[0, 2], [1], [3]]
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for surface pronunciation.
+"""
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+from jamo.pronounce import RULES, pronounce, pronounce_batch
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+class TestPronounce(unittest.TestCase):
+    def test_pronounce(self):
+        """pronounce tests
+        Each rule is applied between the syllables of a word.
+        """
+        tests = ["한국어", "값이", "국물", "독립문", "종로", "학교", "꽃병",
+                 "같이", "닫히다", "신라", "설날", "좋고", "축하", "좋아",
+                 "않아", "닭", "맛있다", "값하다", "넋하고"]
+        targets = ["한구거", "갑씨", "궁물", "동님문", "종노", "학꾜", "꼳뼝",
+                   "가치", "다치다", "실라", "설랄", "조코", "추카", "조아",
+                   "아나", "닥", "마싣따", "가파다", "너카고"]
+        for test, target in zip(tests, targets):
+            trial = pronounce(test)
+            assert trial == target, (test, trial)
+        assert pronounce("꽃 이름, abc") == "꼳 이름, abc"
+
+    def test_trace(self):
+        """pronounce tests with trace
+        The trace names the rules fired after each syllable.
+        """
+        assert pronounce("같이", trace=True) ==\
+            ("가치", [(0, ("palatalization",))])
+        assert pronounce("맛있다", trace=True) ==\
+            ("마싣따", [(0, ("liaison",)),
+                      (1, ("neutralization", "tensification"))])
+        assert pronounce("나무", trace=True) == ("나무", [])
+        _, trace = pronounce("값이 독립문 뚫는 좋아", trace=True)
+        assert all(rule in RULES for _, rules in trace for rule in rules)
+
+    def test_pronounce_batch(self):
+        """pronounce_batch tests
+        pronounce_batch returns one result per input.
+        """
+        tests = ["국물", "신라", "국물"]
+        assert pronounce_batch(tests) == ["궁물", "실라", "궁물"]
+        assert pronounce_batch(iter(tests), trace=True) ==\
+            [pronounce(_, trace=True) for _ in tests]
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for Revised Romanization.
+"""
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+from jamo.romanize import romanize, romanize_batch
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+class TestRomanize(unittest.TestCase):
+    def test_pronunciation(self):
+        """romanize tests in pronunciation mode
+        Liaison, nasalization, lateralization, aspiration and palatalization
+        are applied between syllables of a word, tensification is not.
+        """
+        tests = ["한국어", "신라", "설날", "종로", "백마", "합니다", "독립문",
+                 "좋고", "축하", "않아", "싫어", "값이", "같이", "굳이",
+                 "닫히다", "닭", "여덟", "압구정", "라면", "값하다", "넋하고",
+                 "앉히다"]
+        targets = ["hangugeo", "silla", "seollal", "jongno", "baengma",
+                   "hamnida", "dongnimmun", "joko", "chuka", "ana", "sireo",
+                   "gapsi", "gachi", "guji", "dachida", "dak", "yeodeol",
+                   "apgujeong", "ramyeon", "gapada", "neokago", "anchida"]
+        for test, target in zip(tests, targets):
+            trial = romanize(test)
+            assert trial == target, (test, trial)
+
+    def test_strict(self):
+        """romanize tests in strict mode
+        Letters are transliterated one by one; a hyphen marks a silent ㅇ
+        after a tail.
+        """
+        tests = ["한국어", "신라", "닭", "조랭이떡", "붓꽃", "라면"]
+        targets = ["hangug-eo", "sinla", "dalg", "jolaeng-itteog", "buskkoch",
+                   "lamyeon"]
+        for test, target in zip(tests, targets):
+            trial = romanize(test, mode="strict")
+            assert trial == target, (test, trial)
+        self.assertRaises(ValueError, romanize, "한", mode="yale")
+
+    def test_options(self):
+        """romanize tests with hyphenate and capitalize
+        Words are separated by anything that is not a syllable.
+        """
+        assert romanize("중앙 반구대", hyphenate=True) == "jung-ang ban-gudae"
+        assert romanize("서울 종로구", capitalize=True) == "Seoul Jongnogu"
+        assert romanize("신 라") == "sin ra"
+        assert romanize("KTX 역, 1번") == "KTX yeok, 1beon"
+
+    def test_romanize_batch(self):
+        """romanize_batch tests
+        romanize_batch returns one result per input.
+        """
+        tests = ["홍길동", "서울", "홍길동"]
+        assert romanize_batch(tests) == [romanize(_) for _ in tests]
+        assert romanize_batch(iter(tests), mode="strict", capitalize=True) ==\
+            ["Honggildong", "Seoul", "Honggildong"]
+
+if __name__ == "__main__":
+    unittest.main()
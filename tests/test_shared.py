@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for shareable conversion tables.
+"""
+import unittest
+import os
+import tempfile
+import multiprocessing
+import subprocess
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo import shared
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+# Run in a fresh interpreter: prints whether the name tables were imported
+# and the memory Python allocated, with tables attached from a file or not.
+_WORKER_SCRIPT = """
+import sys, tracemalloc
+tracemalloc.start()
+from jamo import shared
+import jamo
+if sys.argv[1] == "-":
+    jamo.h2j("\ud55c\uad74")
+    jamo.jamo._get_unicode_name("\u3131")
+else:
+    tables = shared.load(sys.argv[1])
+    tables.h2j("\ud55c\uad74")
+    tables.get_unicode_name("\u3131")
+print("jamo._names" in sys.modules, tracemalloc.get_traced_memory()[0])
+"""
+
+
+def _worker_memory(path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(jamo.__file__)))
+    output = subprocess.check_output(
+        [sys.executable, "-c", _WORKER_SCRIPT, path], cwd=root)
+    names, traced = output.split()
+    return names == b"True", int(traced)
+
+
+def _worker_h2j(name, text, queue):
+    tables = shared.attach_shared(name)
+    queue.put(tables.h2j(text))
+    tables.close()
+
+
+class TestShared(unittest.TestCase):
+    def test_tables_match_reference(self):
+        """JamoTables lookups agree with the in-process module tables.
+        """
+        tables = shared.JamoTables(shared.build_tables())
+        every_hangul = ''.join(chr(_) for _ in range(0xac00, 0xd7a4))
+        assert tables.h2j(every_hangul + "자모=字母") ==\
+            jamo.h2j(every_hangul + "자모=字母")
+        jamo_to_name, hcj_to_name = jamo.jamo._get_name_tables()
+        for char, name in jamo_to_name.items():
+            assert tables.get_unicode_name(char) == name
+            assert tables.lookup_name(name) == char
+        for char, name in hcj_to_name.items():
+            assert tables.get_unicode_name(char) == name
+            assert tables.lookup_name(name) == char
+        assert tables.lookup_name("LATIN SMALL LETTER A") is None
+        self.assertRaises(jamo.InvalidJamoError,
+                          tables.get_unicode_name, "a")
+
+    def test_header(self):
+        """Buffers with another magic, version or syllable count are
+        rejected.
+        """
+        data = shared.build_tables()
+        assert shared._HEADER.unpack_from(data)[2] == 11172
+        for offset, value in ((0, b"X"), (4, b"\x01"), (6, b"\x00")):
+            broken = bytearray(data)
+            broken[offset:offset + 1] = value
+            self.assertRaises(ValueError, shared.JamoTables, broken)
+
+    def test_mmap_file(self):
+        """Tables round-trip through an mmapped file.
+        """
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            shared.save(path)
+            with shared.load(path) as tables:
+                assert tables.h2j("한굴") == jamo.h2j("한굴")
+        finally:
+            os.remove(path)
+
+    def test_worker_memory(self):
+        """Workers attached to saved tables never import the name tables,
+        and allocate less than workers using the module tables.
+        """
+        fd, path = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            shared.save(path)
+            names, attached = _worker_memory(path)
+            assert not names
+        finally:
+            os.remove(path)
+        names, private = _worker_memory("-")
+        assert names
+        assert attached < private
+
+    def test_shared_memory(self):
+        """A worker process attaches to tables published by its parent.
+        """
+        name = "jamo-test-%d" % os.getpid()
+        tables = shared.create_shared(name)
+        try:
+            queue = multiprocessing.Queue()
+            worker = multiprocessing.Process(target=_worker_h2j,
+                                             args=(name, "한굴", queue))
+            worker.start()
+            result = queue.get(timeout=30)
+            worker.join()
+            assert result == jamo.h2j("한굴")
+        finally:
+            tables.close()
+            shared.unlink_shared(name)
+
+    def test_fallback(self):
+        """get_tables falls back to private tables when nothing is shared.
+        """
+        tables = shared.get_tables(name="jamo-missing-%d" % os.getpid(),
+                                   path=os.devnull + "-missing")
+        assert tables.h2j("자모") == jamo.h2j("자모")
+
+
+if __name__ == "__main__":
+    unittest.main()
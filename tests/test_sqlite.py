@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the sqlite3 functions and collation.
+"""
+import sqlite3
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import os
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo.collate import hangul_sorted, sort_key
+from jamo.sqlite import register, chosung, jamo_distance
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+NAMES = ["홍길동", "한국", "학교", "ㄱ", "가나", "A", "각"]
+
+
+class TestSqlite(unittest.TestCase):
+    def setUp(self):
+        self.connection = sqlite3.connect(":memory:")
+        register(self.connection)
+        self.connection.execute("CREATE TABLE names (name TEXT)")
+        self.connection.executemany("INSERT INTO names VALUES (?)",
+                                    [(_,) for _ in NAMES])
+
+    def tearDown(self):
+        self.connection.close()
+
+    def _query(self, sql, *parameters):
+        return [_[0] for _ in self.connection.execute(sql, parameters)]
+
+    def test_functions(self):
+        """The SQL functions agree with their Python counterparts and pass
+        NULL through.
+        """
+        assert self._query("SELECT h2j(name) FROM names") ==\
+            [jamo.h2j(_) for _ in NAMES]
+        assert self._query("SELECT j2hcj(h2j(name)) FROM names") ==\
+            [jamo.j2hcj(jamo.h2j(_)) for _ in NAMES]
+        assert self._query("SELECT hangul_key(name) FROM names") ==\
+            [sort_key(_) for _ in NAMES]
+        assert self._query("SELECT h2j(NULL), chosung(NULL), "
+                           "jamo_distance(NULL, 'a')") == [None]
+        assert self._query("SELECT name FROM names WHERE chosung(name) "
+                           "LIKE 'ㅎㄱ%'") == ["홍길동", "한국", "학교"]
+        assert self._query("SELECT name FROM names "
+                           "WHERE jamo_distance(name, '핵교', 1) <= 1") ==\
+            ["학교"]
+
+    def test_collation(self):
+        """ORDER BY ... COLLATE hangul and ORDER BY hangul_key agree with
+        jamo.collate.
+        """
+        expected = hangul_sorted(NAMES)
+        assert self._query("SELECT name FROM names "
+                           "ORDER BY name COLLATE hangul") == expected
+        assert self._query("SELECT name FROM names "
+                           "ORDER BY hangul_key(name)") == expected
+        self.connection.execute("CREATE INDEX by_key ON names "
+                                "(hangul_key(name))")
+
+    def test_chosung(self):
+        """chosung tests
+        """
+        assert chosung("한국어 사전!") == "ㅎㄱㅇ ㅅㅈ!"
+        assert chosung(jamo.h2j("한")) == jamo.h2j("한")
+
+    def test_jamo_distance(self):
+        """jamo_distance tests
+        Distances count typed letters; limit caps them.
+        """
+        assert jamo_distance("학교", "학교") == 0
+        assert jamo_distance("학교", "핵교") == 1
+        assert jamo_distance("과", "고") == 1
+        assert jamo_distance("", "한") == 3
+        assert jamo_distance("홍길동", "한국") == 7
+        assert jamo_distance("홍길동", "한국", limit=2) == 3
+        assert jamo_distance("학교", "핵교", limit=2) == 1
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for jamo frequency statistics.
+"""
+import os
+import shutil
+import tempfile
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo import stats
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+TEXTS = ["한국어 사전", "까닭 없이 왔다", "ㄳ ㅘ", "Korean"]
+
+
+class TestStats(unittest.TestCase):
+    def test_update(self):
+        """JamoStats.update tests
+        Syllables, conjoining jamo and HCJ are counted apart.
+        """
+        counts = stats.JamoStats().update("한국어")
+        assert counts.syllables == 3 and counts.tailless == 1
+        assert counts.characters == 3
+        assert counts.leads == {"\u1100": 1, "\u110b": 1, "\u1112": 1}
+        assert counts.vowels == {"\u1161": 1, "\u1165": 1, "\u116e": 1}
+        assert counts.tails == {"\u11a8": 1, "\u11ab": 1}
+        assert not counts.hcj
+
+        counts = stats.JamoStats().update("\u1112\u1161\u11ab ㄳ A")
+        assert counts.syllables == 0 and counts.characters == 7
+        assert counts.classes() == {"lead": 1, "vowel": 1, "tail": 1}
+        assert counts.hcj == {"ㄳ": 1}
+
+        counts = stats.JamoStats().update("\ud800한\udfff")
+        assert counts.syllables == 1 and counts.characters == 3
+
+    def test_decomposed(self):
+        """Decomposed text has the same lead, vowel and tail counts.
+        """
+        text = ''.join(TEXTS)
+        composed = stats.JamoStats().update(text)
+        decomposed = stats.JamoStats().update(jamo.h2j(text))
+        for name in ("leads", "vowels", "tails", "hcj"):
+            assert getattr(composed, name) == getattr(decomposed, name)
+
+    def test_compounds(self):
+        """JamoStats.compounds tests
+        """
+        counts = stats.JamoStats().update(''.join(TEXTS))
+        assert counts.compounds() == {"\u1101": 1, "\u11b0": 1, "\u11b9": 1,
+                                      "\u116a": 1, "\u11bb": 1, "ㄳ": 1, "ㅘ": 1}
+
+    def test_merge(self):
+        """Partial results add up to the result of a single pass.
+        """
+        whole = stats.JamoStats().update(''.join(TEXTS))
+        parts = [stats.JamoStats().update(_) for _ in TEXTS]
+        total = stats.JamoStats()
+        for part in parts:
+            total.merge(part)
+        assert total == whole
+        assert parts[0] + parts[1] + parts[2] + parts[3] == whole
+        assert stats.JamoStats().update_many(TEXTS, chunk_size=4) == whole
+        assert stats.JamoStats.from_dict(whole.to_dict()) == whole
+
+    def test_collect(self):
+        """collect and collect_files tests
+        """
+        whole = stats.JamoStats().update(''.join(TEXTS * 10))
+        assert stats.collect(TEXTS * 10) == whole
+        assert stats.collect(iter(TEXTS * 10), processes=2,
+                             shard_size=3) == whole
+        directory = tempfile.mkdtemp()
+        try:
+            paths = []
+            for number, text in enumerate(TEXTS):
+                paths.append(os.path.join(directory, "{}.txt".format(number)))
+                with open(paths[-1], "w", encoding="utf-8") as fout:
+                    fout.write(text * 10)
+            assert stats.collect_files(paths) == whole
+            assert stats.collect_files(paths, processes=2) == whole
+        finally:
+            shutil.rmtree(directory)
+
+    @unittest.skipIf(stats.numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        """The NumPy and pure Python counts agree.
+        """
+        text = ''.join(TEXTS) + jamo.h2j(''.join(TEXTS)) + "\ud800a\udfff"
+        fast = stats.JamoStats().update(text)
+        numpy, stats.numpy = stats.numpy, None
+        try:
+            assert stats.JamoStats().update(text) == fast
+        finally:
+            stats.numpy = numpy
+
+if __name__ == "__main__":
+    unittest.main()
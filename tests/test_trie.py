@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the autocomplete trie.
+"""
+import os
+import tempfile
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo import trie
+from jamo.trie import JamoTrie, letters
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+WORDS = {"한국": 5, "학교": 3, "하늘": 2, "하구": 1, "화분": 4, "닭": 1,
+         "달걀": 2, "apple": 1}
+
+
+class TestTrie(unittest.TestCase):
+    def test_letters(self):
+        """letters tests
+        Compound vowels and tails are split into typed letters.
+        """
+        assert letters("화닭") == "ㅎㅗㅏㄷㅏㄹㄱ"
+        assert letters(jamo.h2j("화닭")) == letters("화닭")
+        assert letters("ㅘㄺ a") == "ㅗㅏㄹㄱ a"
+
+    def test_complete(self):
+        """JamoTrie.complete tests
+        The last syllable or letter of a query may still be composed.
+        """
+        words = JamoTrie.from_words(WORDS)
+        assert words.complete("한ㄱ") == [("한국", 5.0)]
+        assert words.complete("학") == [("학교", 3.0), ("하구", 1.0)]
+        assert words.complete("학", partial=False) == [("학교", 3.0)]
+        assert words.complete("하", k=2) == [("한국", 5.0), ("학교", 3.0)]
+        assert words.complete("호") == [("화분", 4.0)]
+        assert words.complete("달") == [("달걀", 2.0), ("닭", 1.0)]
+        assert words.complete("ㄷ", k=1) == [("달걀", 2.0)]
+        assert words.complete("a") == [("apple", 1.0)]
+        assert words.complete("가") == []
+        assert len(words.complete("")) == len(WORDS)
+
+    def test_words(self):
+        """JamoTrie tests
+        Repeated words add up; words with equal keys are kept apart.
+        """
+        words = JamoTrie.from_words(["가", "가", ("나", 0.5), "닭", "달ㄱ"])
+        assert len(words) == 4
+        assert "닭" in words and "달ㄱ" in words and "달" not in words
+        assert words.complete("가") == [("가", 2.0)]
+        assert len(JamoTrie.from_words([])) == 0
+        self.assertRaises(ValueError, JamoTrie, b"\0" * 64)
+
+    def test_long_word(self):
+        """Words far longer than the recursion limit can be stored.
+        """
+        long_word = "가" * 5000
+        words = JamoTrie.from_words([long_word, (long_word[:-1], 2), "가"])
+        assert long_word in words
+        assert words.complete(long_word[:4000], k=2) ==\
+            [(long_word[:-1], 2.0), (long_word, 1.0)]
+        assert words.complete("가")[0] == (long_word[:-1], 2.0)
+
+    def test_save_load(self):
+        """save and load tests
+        A loaded trie answers like the one it was built from.
+        """
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "words.trie")
+        try:
+            trie.save(path, WORDS)
+            with trie.load(path) as words:
+                assert words.complete("하") ==\
+                    JamoTrie.from_words(WORDS).complete("하")
+        finally:
+            os.remove(path)
+            os.rmdir(directory)
+
+if __name__ == "__main__":
+    unittest.main()
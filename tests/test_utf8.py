@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the UTF-8 byte transcoder.
+"""
+import mmap
+import os
+import shutil
+import tempfile
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo import utf8
+from jamo.normalize import normalize
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+TEXT = "한국어 텍스트, ㄱㄴ \uac01 \uac00 é \U0001f600\n" * 3
+
+
+class TestUtf8(unittest.TestCase):
+    def test_decompose(self):
+        """decompose and decompose_into tests
+        """
+        data = TEXT.encode("utf-8")
+        expected = jamo.h2j(TEXT).encode("utf-8")
+        assert utf8.decompose(data) == expected
+        assert utf8.decompose(bytearray(data)) == expected
+        assert utf8.decompose(memoryview(data)) == expected
+        assert utf8.decompose(b"\xff\xea\xb0") == b"\xff\xea\xb0"
+        out = bytearray(b"#" * (3 * len(data) + 2))
+        for chunk_size in (1, 4, 65536):
+            count = utf8.decompose_into(data, out, offset=2,
+                                        chunk_size=chunk_size)
+            assert out[:2] == b"##" and out[2:2 + count] == expected
+        self.assertRaises(ValueError, utf8.decompose_into, data,
+                          bytearray(len(data)))
+
+    def test_compose(self):
+        """compose and compose_into tests
+        Composition matches normalize.
+        """
+        text = jamo.h2j(TEXT) + "\uac01\u11a8 \u1161\u11a8 \uac00\u11a8"
+        data = text.encode("utf-8")
+        expected = normalize(text).encode("utf-8")
+        assert utf8.compose(data) == expected
+        assert utf8.compose(utf8.decompose(TEXT.encode("utf-8"))) ==\
+            normalize(TEXT).encode("utf-8")
+        out = bytearray(len(data))
+        for chunk_size in (1, 4, 65536):
+            count = utf8.compose_into(data, out, chunk_size=chunk_size)
+            assert out[:count] == expected
+
+    def test_file(self):
+        """transcode_file tests
+        Files are read through an mmap and converted in chunks.
+        """
+        directory = tempfile.mkdtemp()
+        try:
+            source = os.path.join(directory, "source.txt")
+            decomposed = os.path.join(directory, "decomposed.txt")
+            composed = os.path.join(directory, "composed.txt")
+            data = TEXT.encode("utf-8") * 10
+            with open(source, "wb") as fout:
+                fout.write(data)
+            with open(source, "rb") as fin:
+                with mmap.mmap(fin.fileno(), 0,
+                               access=mmap.ACCESS_READ) as view:
+                    expected = utf8.decompose(view)
+            assert utf8.transcode_file(source, decomposed,
+                                       chunk_size=10) == len(expected)
+            with open(decomposed, "rb") as fin:
+                assert fin.read() == expected
+            utf8.transcode_file(decomposed, composed, mode="compose",
+                                chunk_size=7)
+            with open(composed, "rb") as fin:
+                assert fin.read() == normalize(TEXT * 10).encode("utf-8")
+            self.assertRaises(ValueError, utf8.transcode_file, source,
+                              composed, mode="x")
+        finally:
+            shutil.rmtree(directory)
+
+    @unittest.skipIf(utf8.numpy is None, "NumPy is not installed")
+    def test_numpy(self):
+        """The NumPy and pure Python decompositions agree.
+        """
+        data = TEXT.encode("utf-8") + b"\xed\x9e\xa3\xed\x9e\xa4\xff"
+        fast = utf8.decompose(data)
+        numpy, utf8.numpy = utf8.numpy, None
+        try:
+            assert utf8.decompose(data) == fast
+        finally:
+            utf8.numpy = numpy
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+"""Unit tests for the jamo sequence validator.
+"""
+import os
+import unittest
+
+# +++ TEMPORARY WORKAROUND TO IMPORT JAMO +++
+import sys
+original_cwd = os.getcwd()
+os.chdir(sys.path[0])
+sys.path.append(os.path.abspath(os.path.join("..")))
+os.chdir(original_cwd)
+import jamo
+from jamo import validate
+from jamo.normalize import normalize
+# +++ END WORKAROUND TO IMPORT JAMO +++
+
+
+class TestValidate(unittest.TestCase):
+    def test_well_formed(self):
+        """is_well_formed tests
+        """
+        for string in ["", "한국어 사전", "ㅋㅋㅋ", jamo.h2j("한국어"),
+                       "가\u1161", "가\u11a8", "\u115f\u1161",
+                       "\u1100\u1100\u1161\u11a8\u11a8"]:
+            assert validate.is_well_formed(string), string
+            assert validate.validate(string) == []
+        for string in ["\u1161", "\u11ab\u1112\u1161", "\u1112",
+                       "\u1112\u11ab", "한\u1161", "ㄱ\u1161"]:
+            assert not validate.is_well_formed(string), string
+
+    def test_problems(self):
+        """validate tests
+        Every problem is reported with its position.
+        """
+        assert validate.validate("A\u1161") == [(1, "orphan vowel")]
+        assert validate.validate("\u11ab\u1112\u1161") ==\
+            [(0, "orphan tail")]
+        assert validate.validate("\u1112 \u1161") ==\
+            [(0, "missing vowel"), (2, "orphan vowel")]
+        assert validate.validate("한\u1161") == [(1, "orphan vowel")]
+        assert validate.validate("\u1112ㅏㄴ") ==\
+            [(0, "missing vowel"), (1, "mixed")]
+        assert validate.validate("ㅋㅋ ㄱ\u1161") ==\
+            [(3, "mixed"), (4, "orphan vowel")]
+        for _, problem in validate.validate("\u1161\u11ab\u1112ㄱ"):
+            assert problem in validate.PROBLEMS
+
+    def test_repair(self):
+        """validate tests with repair
+        Repaired strings are well formed.
+        """
+        for string, repaired in [
+                ("한국어", "한국어"),
+                ("\u1161", "\u115f\u1161"),
+                ("\u11ab", "\u115f\u1160\u11ab"),
+                ("\u1112", "\u1112\u1160"),
+                ("\u1112\u11ab", "\u1112\u1160\u11ab"),
+                ("ㄲ\u1161\u11ab", "\u1101\u1161\u11ab"),
+                ("\u1112ㅏㄴ", "\u1112\u1161\u11ab"),
+                ("하ㄴㄱ\u1161", "하\u11ab\u1100\u1161")]:
+            result, problems = validate.validate(string, repair=True)
+            assert result == repaired, string
+            assert validate.is_well_formed(result)
+            assert bool(problems) == (string != repaired)
+        assert normalize(validate.validate("ㄱ\u1161\u11ab",
+                                           repair=True)[0]) == "간"
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,27 +1,42 @@
 import re
 
+# Assigned codepoints of the Hangul jamo blocks. Keep in sync with
+# jamo.is_jamo; U+3164 (HANGUL FILLER) is named but is not HCJ.
+BLOCKS = [(0x1100, 0x11FF), (0x3131, 0x318E), (0xA960, 0xA97C),
+          (0xD7B0, 0xD7C6), (0xD7CB, 0xD7FB)]
+EXPECTED = set(code for first, last in BLOCKS
+               for code in range(first, last + 1))
+
+
+def records(fin):
+    """Yield (line, fields) for every record of a UnicodeData.txt style file.
+    """
+    for line in fin:
+        if line.strip() and not line.startswith('#'):
+            yield line, line.rstrip('\n').split(';')
+
 
 def validate(filename):
-    with open(filename, 'r') as fin:
-        last_code = 0
-        for line in fin:
-            try:
-                results = re.findall('([\dABCDEF]{4})(.*)(HANGUL .+)', line)
-                if results:
-                    code, char, name = (int(results[0][0], 16),
-                                        results[0][1].strip(),
-                                        results[0][2])
-                    if last_code == 0:
-                        last_code = code
-                    else:
-                        if code != last_code+1:
-                            return False, line, "Skipped code."
-                        if code != ord(char):
-                            return False, line, "Code mismatch."
-                        last_code += 1
-            except:
-                print("Error checking line: \"{}\"".format(line))
-                exit(1)
+    with open(filename, 'r', encoding='utf8') as fin:
+        last_code = -1
+        seen = set()
+        for line, fields in records(fin):
+            if len(fields) != 15:
+                return False, line, "Malformed record."
+            if not re.match(r'[\dABCDEF]{4}$', fields[0]):
+                return False, line, "Malformed code."
+            code, name = int(fields[0], 16), fields[1]
+            if code <= last_code:
+                return False, line, "Code out of order."
+            if code not in EXPECTED:
+                return False, line, "Not a Hangul jamo code."
+            if not re.match(r'HANGUL [A-Z][A-Z -]*$', name):
+                return False, line, "Unexpected name."
+            last_code = code
+            seen.add(code)
+        missing = sorted(EXPECTED - seen)
+        if missing:
+            return False, "U+%04X" % missing[0], "Skipped code."
         return True
 
 
@@ -32,4 +47,4 @@ if __name__ ==  "__main__":
         print("{ok, %s}" % argv[1])
     else:
         print("{error, {reason, \"%s\"}, {line, \"%s\"}}" %
-              (status[2], status[1]))
+              (status[2], status[1].strip()))
@@ -0,0 +1,32 @@
+"""Compare jamo backends against the reference engine on random strings.
+
+    python tools/differential.py --count 1000000 [--backend table ...]
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+from jamo import backends
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=100000)
+    parser.add_argument("--max-length", type=int, default=64)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--backend", action="append", dest="backends")
+    args = parser.parse_args()
+    report = backends.differential_check(args.count, args.backends,
+                                         max_length=args.max_length,
+                                         seed=args.seed)
+    failed = any(entry["count"] for entry in report.values())
+    for name, entry in sorted(report.items()):
+        print("{name}: {seconds:.3f}s, {speedup:.2f}x reference, "
+              "{count} divergences".format(
+                  name=name, **entry))
+        for function, string, want, got in entry["divergences"]:
+            print("  {}({!a}): expected {!a}, got {!a}".format(
+                function, string, want, got))
+    sys.exit(1 if failed else 0)
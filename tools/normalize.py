@@ -0,0 +1,37 @@
+"""Compose NFD Hangul into NFC in the names (and contents) of a tree.
+
+    python tools/normalize.py [--contents] [--apply] [--workers N] ROOT
+
+Without --apply only a report of the changes is printed.
+"""
+import argparse
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+from jamo.normalize import repair_tree
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("root")
+    parser.add_argument("--contents", action="store_true",
+                        help="also rewrite UTF-8 file contents")
+    parser.add_argument("--no-rename", action="store_true",
+                        help="leave file and directory names alone")
+    parser.add_argument("--apply", action="store_true",
+                        help="modify the tree instead of a dry run")
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+    changes = repair_tree(args.root, rename=not args.no_rename,
+                          rewrite=args.contents, dry_run=not args.apply,
+                          workers=args.workers)
+    for change in changes:
+        if change.kind == "rename":
+            print("rename   {!a} -> {}".format(change.path, change.target))
+        else:
+            print("{:<8} {}".format(change.kind, change.path))
+    print("{} change(s){}".format(len(changes),
+                                  "" if args.apply else " (dry run)"))
+    sys.exit(1 if any(_.kind == "conflict" for _ in changes) else 0)
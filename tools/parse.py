@@ -1,20 +1,89 @@
+"""Generate jamo/_tables.py and jamo/_names.py from a UnicodeData.txt style
+file, e.g.
+
+    python tools/parse.py tools/data/HangulJamoData.txt jamo/_tables.py
+
+The name tables go to _names.py next to the conversion tables, so that
+processes which never look up names never import them.
+"""
 from sys import argv
+import os
 import re
-import json
 import check
 
+HEADER = '''\
+# -*- coding: utf-8 -*-
+"""{description} for every Hangul jamo block.
+
+Generated by tools/parse.py from {source}. Do not edit.
+"""
+
+'''
+
+# Same substitution jamo.py historically applied to names at runtime.
+CLASS_WORD = re.compile(r'(?<=HANGUL )(\w+)')
+
+
+def read_names(filename):
+    """Return ({jamo: name}, {hcj: name}) from a UnicodeData.txt style file.
+    """
+    jamo_names, hcj_names = {}, {}
+    with open(filename, 'r', encoding='utf8') as fin:
+        for line, fields in check.records(fin):
+            char = chr(int(fields[0], 16))
+            if 0x3130 <= ord(char) <= 0x318F:
+                hcj_names[char] = fields[1]
+            else:
+                jamo_names[char] = fields[1]
+    return jamo_names, hcj_names
+
+
+def build_tables(jamo_names, hcj_names):
+    """Derive the conversion maps from the names. Only entries that change
+    the character are kept; lookups default to echoing the input.
+    """
+    hcj_lookup = {name: char for char, name in hcj_names.items()}
+    jamo_lookup = {name: char for char, name in jamo_names.items()}
+    names = dict(jamo_names)
+    names.update(hcj_names)
+
+    def convert(char, word, lookup):
+        target = lookup.get(CLASS_WORD.sub(word, names[char]), char)
+        return target if target != char else None
+
+    tables = [("JAMO_TO_NAME", jamo_names), ("HCJ_TO_NAME", hcj_names)]
+    jamo_to_hcj = {char: convert(char, "LETTER", hcj_lookup)
+                   for char in names}
+    tables.append(("JAMO_TO_HCJ", jamo_to_hcj))
+    for position, word in (("LEAD", "CHOSEONG"), ("VOWEL", "JUNGSEONG"),
+                           ("TAIL", "JONGSEONG")):
+        tables.append(("HCJ_TO_JAMO_" + position,
+                       {char: convert(char, word, jamo_lookup)
+                        for char in names}))
+    return [(title, {key: value for key, value in table.items() if value})
+            for title, table in tables]
+
+
+def write_module(fileout, tables, source, description):
+    with open(fileout, 'w', encoding='utf8') as fout:
+        fout.write(HEADER.format(description=description, source=source))
+        for title, table in tables:
+            fout.write("%s = {\n" % title)
+            for key in sorted(table):
+                fout.write("    %s: %s,\n" % (ascii(key), ascii(table[key])))
+            fout.write("}\n")
+
+
 if __name__ == "__main__":
     filein, fileout = argv[1], argv[2]
     status = check.validate(filein)
     if status == True or len(argv) == 4 and argv[3] == '--nocheck':
-        results = []
-        with open(filein, 'r') as fin:
-            results = re.findall('([\dABCDEF]{4}).*(HANGUL .+)', fin.read())
-        with open(fileout, 'w') as fout:
-            json.dump({chr(int(code, 16)): name.strip()\
-                      for code, name in results}, fout,
-                      sort_keys=True, indent=2)
+        tables = build_tables(*read_names(filein))
+        source = filein.replace('\\', '/')
+        write_module(os.path.join(os.path.dirname(fileout), "_names.py"),
+                     tables[:2], source, "Unicode character names")
+        write_module(fileout, tables[2:], source, "Conversion tables")
         print("{ok, %s}" % filein)
     else:
         print("{error, {reason, \"%s\"}, {line, \"%s\"}}" %
-              (status[2], status[1]))
+              (status[2], status[1].strip()))
@@ -0,0 +1,61 @@
+"""Time the jamo SQL functions over a large in-memory sqlite3 table.
+
+    python tools/sqlite_benchmark.py --rows 1000000
+"""
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                ".."))
+from jamo.sqlite import register
+
+
+_QUERIES = [
+    ("h2j", "SELECT sum(length(h2j(name))) FROM names"),
+    ("j2hcj", "SELECT sum(length(j2hcj(h2j(name)))) FROM names"),
+    ("chosung", "SELECT count(*) FROM names "
+                "WHERE chosung(name) LIKE 'ㅎㄱ%'"),
+    ("jamo_distance", "SELECT count(*) FROM names "
+                      "WHERE jamo_distance(name, '홍길동', 2) <= 2"),
+    ("collate", "SELECT name FROM names ORDER BY name COLLATE hangul"),
+    ("hangul_key", "SELECT name FROM names ORDER BY hangul_key(name)"),
+]
+
+
+def benchmark(rows=1000000, seed=0):
+    """Time every registered function over an in-memory table of rows
+    random three-syllable names.
+
+    Returns {query name: (seconds, microseconds per row)}.
+    """
+    rng = random.Random(seed)
+    connection = sqlite3.connect(":memory:")
+    register(connection)
+    connection.execute("CREATE TABLE names (name TEXT)")
+    connection.executemany(
+        "INSERT INTO names VALUES (?)",
+        ((''.join(chr(rng.randrange(0xac00, 0xd7a4)) for _ in range(3)),)
+         for _ in range(rows)))
+    results = {}
+    for name, query in _QUERIES:
+        start = time.perf_counter()
+        for _ in connection.execute(query):
+            pass
+        seconds = time.perf_counter() - start
+        results[name] = (seconds, 1e6 * seconds / max(rows, 1))
+    connection.close()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    results = benchmark(args.rows, args.seed)
+    for name, (seconds, per_row) in results.items():
+        print("{}: {:.3f}s, {:.2f}us per row".format(name, seconds, per_row))